@@ -0,0 +1,62 @@
+"""
+Benchmarks the memory used by captured logs.
+
+Run with ``python benchmarks/bench_captured.py``.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from logot._capture import Captured, intern_str
+
+NUMBER = 1_000_000
+
+
+class TupleCaptured(NamedTuple):
+    # A tuple-backed alternative to `Captured`, for comparison.
+    levelname: str
+    msg: str
+    exc_info: Any
+    levelno: Any
+    name: Any
+    record: Any
+
+
+def bench(label: str, capture: Callable[[int], object]) -> None:
+    tracemalloc.start()
+    captured = [capture(n) for n in range(NUMBER)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<50} {size / NUMBER:>8.0f} bytes/log")
+    del captured
+
+
+def parsed(n: int) -> tuple[str, str, str]:
+    # Simulate fields parsed from a log line, creating new strings for each log.
+    levelname, name = f"INFO:app.module{n % 10}".split(":")
+    return levelname, f"foo {n}", name
+
+
+def main() -> None:
+    def captured_parsed(n: int) -> object:
+        levelname, msg, name = parsed(n)
+        return Captured(levelname, msg, levelno=20, name=name)
+
+    def captured_interned(n: int) -> object:
+        levelname, msg, name = parsed(n)
+        return Captured(intern_str(levelname), msg, levelno=20, name=intern_str(name))
+
+    def tuple_interned(n: int) -> object:
+        levelname, msg, name = parsed(n)
+        return TupleCaptured(intern_str(levelname), msg, ..., 20, intern_str(name), ...)
+
+    bench("Captured", captured_parsed)
+    bench("Captured (interned)", captured_interned)
+    bench("TupleCaptured (interned)", tuple_interned)
+
+
+if __name__ == "__main__":
+    main()
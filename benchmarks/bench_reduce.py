@@ -0,0 +1,35 @@
+"""
+Benchmarks matching log patterns against many repeated captured logs.
+
+Run with ``python benchmarks/bench_reduce.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from logot import Captured, Logot, logged
+
+NUMBER = 100_000
+REPEAT = 5
+
+
+def bench(label: str, *, record: bool) -> None:
+    def run() -> None:
+        logot = Logot()
+        for _ in range(NUMBER):
+            logot.capture(Captured("INFO", "Retrying", record=object() if record else ...))
+        logot.capture(Captured("INFO", "Done"))
+        logot.assert_logged(logged.info("Done"))
+
+    seconds = min(timeit.repeat(run, number=1, repeat=REPEAT))
+    print(f"{label:<50} {seconds / NUMBER * 1e9:>8.0f} ns/log")
+
+
+def main() -> None:
+    bench("Repeated logs (with records)", record=True)
+    bench("Repeated logs (without records)", record=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Benchmarks the memory used by captured logs, with and without spilling to disk.
+
+Run with ``python benchmarks/bench_spill.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+
+from logot import Captured, Logot, logged
+
+NUMBER = 1_000_000
+
+
+def bench(label: str, logot: Logot) -> None:
+    tracemalloc.start()
+    start = timeit.default_timer()
+    for n in range(NUMBER):
+        logot.capture(Captured("INFO", f"foo {n}", levelno=20, name="app"))
+    logot.assert_logged(logged.info(f"foo {NUMBER - 1}"))
+    seconds = timeit.default_timer() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<50} {peak / 1e6:>8.1f} MB peak {seconds / NUMBER * 1e9:>8.0f} ns/log")
+
+
+def main() -> None:
+    bench("In memory", Logot())
+    bench("Spilled (max_buffered=10,000)", Logot(max_buffered=10_000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmarks the per-event overhead of :mod:`structlog` capturers.
+
+Run with ``python benchmarks/bench_structlog.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+
+import structlog
+
+from logot import Logot
+from logot._logot import Capturer
+from logot.structlog import PersistentStructlogCapturer, StructlogCapturer
+
+NUMBER = 20_000
+REPEAT = 20
+
+
+def bench(label: str, log: Callable[[], None], *, setup: Callable[[], None] = lambda: None) -> None:
+    seconds = min(timeit.repeat(log, setup=setup, number=NUMBER, repeat=REPEAT))
+    print(f"{label:<50} {seconds / NUMBER * 1e9:>8.0f} ns/event")
+
+
+def bench_capturer(label: str, capturer: Callable[[], Capturer], *, level: str) -> None:
+    with Logot(capturer=capturer).capturing(level=level) as logot:
+        logger = structlog.get_logger()
+        # Clear captured logs between runs, so the queue does not grow.
+        bench(f"{label} ({level})", lambda: logger.info("foo bar"), setup=logot.clear)
+
+
+def main() -> None:
+    structlog.configure(
+        processors=[],
+        logger_factory=structlog.ReturnLoggerFactory(),
+        wrapper_class=structlog.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+    # Loggers are created after capturing starts, so they are bound to the current processors.
+    logger = structlog.get_logger()
+    bench("No capturing", lambda: logger.info("foo bar"))
+    for level in ("INFO", "WARNING"):
+        bench_capturer("StructlogCapturer", StructlogCapturer, level=level)
+        bench_capturer("PersistentStructlogCapturer", PersistentStructlogCapturer, level=level)
+    # Measure the persistent processor while no `Logot` is capturing.
+    logger = structlog.get_logger()
+    bench("PersistentStructlogCapturer (installed, idle)", lambda: logger.info("foo bar"))
+    PersistentStructlogCapturer.uninstall()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,14 @@ Main :mod:`logot` API for log-based testing.
 from __future__ import annotations
 
 from logot._capture import Captured as Captured
+from logot._capture import ExcSnapshot as ExcSnapshot
 from logot._logged import Logged as Logged
 from logot._logot import Capturer as Capturer
 from logot._logot import Logot as Logot
+from logot._logot import await_for_all as await_for_all
+from logot._logot import await_for_any as await_for_any
+from logot._logot import wait_for_all as wait_for_all
+from logot._logot import wait_for_any as wait_for_any
 from logot._match import Matcher as Matcher
+from logot._stats import LogotStats as LogotStats
 from logot._wait import AsyncWaiter as AsyncWaiter
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import sys
-from types import TracebackType
-from typing import Any
+import traceback
+from types import CodeType, TracebackType
+from typing import Any, cast
 
-from logot._typing import Name, Wildcard
+from logot._typing import ExcInfoRetention, Name, RecordRetention, Wildcard
 
 
 @dataclasses.dataclass(init=False)
@@ -39,12 +41,16 @@ class Captured:
     The log message.
     """
 
-    exc_info: Wildcard[BaseException | None]
+    exc_info: Wildcard[BaseException | ExcSnapshot | None]
     """
     The log exception.
 
     This is an *optional* log capture field. When provided, it allows matching
     :doc:`log patterns </log-pattern-matching>` from :func:`logged.log` with an ``exc_info``.
+
+    .. note::
+
+        This is an :class:`ExcSnapshot` when :attr:`Logot.exc_info_retention` is ``"snapshot"``.
     """
 
     levelno: Wildcard[int | None]
@@ -80,7 +86,7 @@ class Captured:
         levelname: str,
         msg: str,
         *,
-        exc_info: Wildcard[BaseException | None] = ...,
+        exc_info: Wildcard[BaseException | ExcSnapshot | None] = ...,
         levelno: Wildcard[int] = ...,
         name: Wildcard[str | None] = ...,
         record: Wildcard[Any] = ...,
@@ -93,6 +99,165 @@ class Captured:
         self.record = record
 
 
+class ExcSnapshot:
+    """
+    A snapshot of a captured log exception.
+
+    Snapshots are captured instead of the exception when :attr:`Logot.exc_info_retention` is ``"snapshot"``. They do
+    not reference the exception traceback, so its frames and local variables are released as soon as the exception is
+    handled. A snapshot compares equal to the exception it was taken from, or to any exception the original exception
+    compares equal to. Exceptions compared by identity are tracked by :func:`id`, so only compare snapshots with
+    exceptions that are still alive.
+
+    .. note::
+
+        This class is not generally used when writing tests.
+
+    :param exc: The exception to snapshot.
+    """
+
+    __slots__ = ("type", "args", "_key", "_traceback")
+
+    type: type[BaseException]
+    """
+    The exception type.
+    """
+
+    args: tuple[Any, ...]
+    """
+    The exception arguments.
+    """
+
+    def __init__(self, exc: BaseException) -> None:
+        self.type = type(exc)
+        self.args = exc.args
+        self._key = _exc_key(exc)
+        self._traceback = _exc_traceback(exc)
+
+    def __eq__(self, other: object) -> bool:
+        # Handle other snapshot.
+        if isinstance(other, ExcSnapshot):
+            return self._key == other._key and (
+                self._traceback is None or _is_same_traceback(self._traceback, cast(_Traceback, other._traceback))
+            )
+        # Handle live exception.
+        if isinstance(other, BaseException):
+            return (
+                type(other) is self.type
+                and self._key == _exc_key(other)
+                and (self._traceback is None or _is_same_traceback(self._traceback, _traceback(other)))
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ExcSnapshot(type={self.type.__qualname__}, args={self.args!r})"
+
+
+# The code locations in an exception traceback, from the outermost frame.
+_Traceback = tuple[tuple[CodeType, int], ...]
+
+
+def _exc_key(exc: BaseException) -> tuple[Any, ...]:
+    # Handle exceptions compared by identity. Exceptions do not support weak references, so their identity is tracked
+    # by `id()`.
+    if type(exc).__eq__ is object.__eq__:
+        return (type(exc), id(exc))
+    # Handle exceptions compared by value (e.g. dataclasses), comparing their arguments and attributes instead.
+    return (type(exc), exc.args, dict(vars(exc)))
+
+
+def _exc_traceback(exc: BaseException) -> _Traceback | None:
+    # Handle exceptions compared by value, which match regardless of their traceback.
+    if type(exc).__eq__ is not object.__eq__:
+        return None
+    # Handle exceptions compared by identity. The traceback is also compared, so a new exception reusing the same
+    # `id()` is very unlikely to compare equal.
+    return _traceback(exc)
+
+
+def _traceback(exc: BaseException) -> _Traceback:
+    return tuple((frame.f_code, lineno) for frame, lineno in traceback.walk_tb(exc.__traceback__))
+
+
+def _is_same_traceback(traceback_a: _Traceback, traceback_b: _Traceback) -> bool:
+    # A traceback is extended with outer frames as the exception propagates, including when it is logged and then
+    # re-raised. The traceback captured when the exception was logged is therefore the end of any later traceback.
+    if len(traceback_a) > len(traceback_b):
+        traceback_a, traceback_b = traceback_b, traceback_a
+    return traceback_b[len(traceback_b) - len(traceback_a) :] == traceback_a
+
+
+def retain(
+    captured: Captured,
+    *,
+    record_retention: RecordRetention,
+    exc_info_retention: ExcInfoRetention,
+    max_msg_len: int | None,
+) -> Captured:
+    record = ... if record_retention == "none" else captured.record
+    exc_info = captured.exc_info
+    if exc_info_retention == "snapshot" and isinstance(exc_info, BaseException):
+        exc_info = ExcSnapshot(exc_info)
+    msg = captured.msg
+    if max_msg_len is not None and len(msg) > max_msg_len:
+        msg = TruncatedMsg(msg, max_msg_len)
+    # Handle captured logs that are retained in full.
+    if record is captured.record and exc_info is captured.exc_info and msg is captured.msg:
+        return captured
+    # Copy the captured log, since the same `Captured` can be sent to several `Logot` instances.
+    return Captured(
+        captured.levelname,
+        msg,
+        exc_info=exc_info,
+        levelno=captured.levelno,  # type: ignore[arg-type]
+        name=captured.name,
+        record=record,
+    )
+
+
+class TruncatedMsg(str):
+    # A log message truncated to its first `max_msg_len` characters. A digest of the full message is kept, so it can
+    # still be compared exactly with other messages using `msg_equals()`. Otherwise, it behaves as the truncated `str`,
+    # so message patterns only match the truncated message.
+
+    _msg_len: int
+    _digest: bytes
+
+    def __new__(cls, msg: str, max_msg_len: int) -> TruncatedMsg:
+        truncated = super().__new__(cls, msg[:max_msg_len])
+        truncated._msg_len = len(msg)
+        truncated._digest = _digest(msg)
+        return truncated
+
+    def equals(self, other: str) -> bool:
+        # Handle other truncated message.
+        if isinstance(other, TruncatedMsg):
+            return self._msg_len == other._msg_len and self._digest == other._digest
+        # Handle full message.
+        return len(other) == self._msg_len and other.startswith(self) and _digest(other) == self._digest
+
+
+def msg_equals(msg: str, other: str) -> bool:
+    # Compare log messages exactly, using the full message digest of truncated messages.
+    if isinstance(msg, TruncatedMsg):
+        return msg.equals(other)
+    if isinstance(other, TruncatedMsg):
+        return other.equals(msg)
+    return msg == other
+
+
+def _digest(msg: str) -> bytes:
+    return hashlib.blake2b(msg.encode(errors="surrogatepass"), digest_size=16).digest()
+
+
+def intern_str(value: Any) -> Any:
+    # Intern strings repeated across many captured logs (e.g. level names and logger names parsed from log lines), so
+    # large captures share a single copy of each.
+    return sys.intern(value) if type(value) is str else value
+
+
 def capture_exc_info(
     exc_info: bool
     | None
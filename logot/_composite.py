@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from importlib.util import find_spec
+from typing import Callable, cast
+
+from logot._capture import Captured
+from logot._import import LazyCallable
+from logot._logot import Capturer, Logot, LogotProxy
+from logot._names import NameFilter
+from logot._typing import Level, Name
+
+
+class CompositeCapturer(Capturer):
+    """
+    A :class:`logot.Capturer` implementation that captures logs from several logging frameworks together.
+
+    All capturers send logs to the same :class:`logot.Logot`, so :doc:`log patterns </log-pattern-matching>` match
+    logs from different logging frameworks in the order they were emitted.
+
+    Logs forwarded from one logging framework to another are only captured once, using the original log. This covers
+    :mod:`loguru` logs forwarded to :mod:`logging` by a :mod:`loguru` handler sink (e.g. a ``PropagateHandler``), and
+    :mod:`structlog` logs forwarded to :mod:`logging` by a :mod:`logging` logger (e.g. using
+    :class:`structlog.stdlib.LoggerFactory`).
+
+    :param capturers: The capturers to start together. Defaults to :class:`logot.logging.LoggingCapturer`, followed
+        by :class:`logot.loguru.LoguruCapturer` and :class:`logot.structlog.StructlogCapturer` if :mod:`loguru` and
+        :mod:`structlog` are installed.
+    """
+
+    __slots__ = ("_capturer_factories", "_capturers")
+
+    _name_filter = True
+
+    def __init__(self, *capturers: Callable[[], Capturer]) -> None:
+        self._capturer_factories = capturers or _default_capturers()
+
+    def start_capturing(self, logot: Logot, /, *, level: Level, name: Name | NameFilter) -> None:
+        self._capturers: list[Capturer] = []
+        try:
+            for capturer in self._capturer_factories:
+                capturer_obj = capturer()
+                # Handle capturers that only support a single logger name.
+                if isinstance(name, NameFilter) and not capturer_obj._name_filter:
+                    raise TypeError(f"{type(capturer_obj).__name__} does not support multiple names or exclude")
+                capturer_obj.start_capturing(cast(Logot, _SourceLogot(self, logot)), level=level, name=cast(Name, name))
+                self._capturers.append(capturer_obj)
+        except BaseException:
+            # Stop any capturers already started.
+            self.stop_capturing()
+            raise
+
+    def stop_capturing(self) -> None:
+        # Stop capturers in reverse order.
+        while self._capturers:
+            self._capturers.pop().stop_capturing()
+
+    def flush(self) -> None:
+        for capturer_obj in self._capturers:
+            capturer_obj.flush()
+
+    def _capture(self, captured: Captured) -> bool:
+        # Handle a log forwarded from another captured logging framework, so it only matches once.
+        return not any(capturer_obj._is_forwarded(captured) for capturer_obj in self._capturers)
+
+
+class _SourceLogot(LogotProxy):
+    # A `Logot` proxy passed to each capturer in a `CompositeCapturer`, skipping forwarded logs.
+
+    __slots__ = ("_composite",)
+
+    def __init__(self, composite: CompositeCapturer, logot: Logot) -> None:
+        super().__init__(logot)
+        self._composite = composite
+
+    def capture(self, captured: Captured) -> None:
+        if self._composite._capture(captured):
+            super().capture(captured)
+
+
+def _default_capturers() -> tuple[Callable[[], Capturer], ...]:
+    return (
+        LazyCallable("logot.logging", "LoggingCapturer"),
+        *(
+            LazyCallable(f"logot.{module}", capturer)
+            for module, capturer in (("loguru", "LoguruCapturer"), ("structlog", "StructlogCapturer"))
+            if find_spec(module) is not None
+        ),
+    )
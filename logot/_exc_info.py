@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 
-from logot._capture import Captured
+from logot._capture import Captured, ExcSnapshot
 from logot._match import Matcher
 from logot._typing import ExcInfo
 
@@ -12,7 +12,7 @@ class _ExcInfoTrueMatcher(Matcher):
     __slots__ = ()
 
     def match(self, captured: Captured) -> bool:
-        return isinstance(captured.exc_info, BaseException)
+        return isinstance(captured.exc_info, (BaseException, ExcSnapshot))
 
     def __repr__(self) -> str:
         return "exc_info=True"
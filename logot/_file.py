@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import logging
+import os
+from _thread import allocate_lock
+from threading import Event, Thread
+from typing import IO
+
+from logot._level import get_levelno
+from logot._logot import Capturer, Logot
+from logot._names import NameFilter
+from logot._parse import Parser, capture_line, line_parser
+from logot._route import Route
+from logot._typing import Level, Name
+
+# How much data (in bytes) to read from a file at a time.
+_CHUNK_SIZE = 1 << 16
+
+# How often (in seconds) to poll files for new data. Polling backs off from the minimum to the maximum interval while
+# files are idle, and resets as soon as new data is read.
+_MIN_INTERVAL = 0.001
+_MAX_INTERVAL = 0.02
+
+
+class FileCapturer(Capturer):
+    """
+    A :class:`logot.Capturer` implementation for logs written as text lines to log files.
+
+    Files are tailed from their current end, and read incrementally in a background thread. Rotated and truncated files
+    are followed, and files created after capturing starts are read from their beginning. Files that cannot be read are
+    retried on the next poll. Lines that do not match the log format (e.g. tracebacks or other output) are ignored.
+
+    :param paths: The log files to tail.
+    :param format: The :mod:`logging` format of the log lines. Defaults to :data:`logging.BASIC_FORMAT`. The
+        ``%(levelname)s`` and ``%(message)s`` fields are required. The ``%(levelno)d`` and ``%(name)s`` fields are
+        also captured, and other fields are ignored.
+    :param json: Parse JSON log lines instead. The ``levelname`` (or ``level``), ``levelno``, ``name`` (or
+        ``logger``) and ``message`` (or ``msg`` or ``event``) keys are captured.
+    """
+
+    __slots__ = ("_paths", "_parser", "_route", "_tailers", "_stopping", "_thread")
+
+    _name_filter = True
+
+    def __init__(
+        self,
+        *paths: str | os.PathLike[str],
+        format: str = logging.BASIC_FORMAT,
+        json: bool = False,
+    ) -> None:
+        self._paths = paths
+        self._parser = line_parser(format, json=json)
+
+    def start_capturing(self, logot: Logot, /, *, level: Level, name: Name | NameFilter) -> None:
+        self._route = Route(logot, levelno=get_levelno(level), name=name)
+        self._tailers = [_Tailer(path, self._route, self._parser) for path in self._paths]
+        self._stopping = Event()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop_capturing(self) -> None:
+        self._stopping.set()
+        self._thread.join()
+        for tailer in self._tailers:
+            tailer.close()
+
+    def flush(self) -> None:
+        # Read any remaining data in the current thread, rather than waiting for the next poll.
+        for tailer in self._tailers:
+            _poll(tailer)
+
+    def _run(self) -> None:
+        interval = _MIN_INTERVAL
+        while not self._stopping.wait(interval):
+            # Poll quickly while files are being written, backing off while they are idle.
+            if any([_poll(tailer) for tailer in self._tailers]):
+                interval = _MIN_INTERVAL
+            else:
+                interval = min(interval * 2, _MAX_INTERVAL)
+
+
+def _poll(tailer: _Tailer) -> bool:
+    try:
+        return tailer.poll()
+    except OSError:
+        # Handle unreadable file, retrying on the next poll. This keeps the background thread tailing other files.
+        return False
+
+
+class _Tailer:
+    __slots__ = ("_path", "_route", "_parser", "_lock", "_file", "_buffer")
+
+    def __init__(self, path: str | os.PathLike[str], route: Route, parser: Parser) -> None:
+        self._path = path
+        self._route = route
+        self._parser = parser
+        # Polls can come from the background thread or a flush.
+        self._lock = allocate_lock()
+        self._buffer = b""
+        # Tail the file from its current end.
+        self._file = self._open()
+        if self._file is not None:
+            self._file.seek(0, os.SEEK_END)
+
+    def poll(self) -> bool:
+        with self._lock:
+            has_data = False
+            while True:
+                # Handle file not yet created.
+                if self._file is None:
+                    self._file = self._open()
+                    if self._file is None:
+                        return has_data
+                # Handle new data.
+                data = self._file.read(_CHUNK_SIZE)
+                if data:
+                    has_data = True
+                    self._capture(data)
+                    continue
+                # Handle no new data. Check whether the file has been rotated or truncated.
+                try:
+                    stat = os.stat(self._path)
+                except FileNotFoundError:
+                    # Handle rotated file, with the new file not yet created.
+                    return has_data
+                fstat = os.fstat(self._file.fileno())
+                # Handle rotated file. Lines may have been written to the old file since it was last read, so read it to
+                # its end once more, and then read the new file from its beginning.
+                if (stat.st_dev, stat.st_ino) != (fstat.st_dev, fstat.st_ino):
+                    while True:
+                        data = self._file.read(_CHUNK_SIZE)
+                        if not data:
+                            break
+                        has_data = True
+                        self._capture(data)
+                    self._capture_partial()
+                    self._file.close()
+                    self._file = None
+                    continue
+                # Handle truncated file.
+                if stat.st_size < self._file.tell():
+                    self._capture_partial()
+                    self._file.seek(0)
+                    continue
+                # Handle idle file.
+                return has_data
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _open(self) -> IO[bytes] | None:
+        try:
+            return open(self._path, "rb")
+        except OSError:
+            # Handle missing or unreadable file, retrying on the next poll.
+            return None
+
+    def _capture(self, data: bytes) -> None:
+        # Split the data into complete lines, buffering any partial last line until the next read.
+        *lines, self._buffer = (self._buffer + data).split(b"\n")
+        for line in lines:
+            capture_line(self._route, self._parser, line)
+
+    def _capture_partial(self) -> None:
+        # Capture a partial last line once the file has been rotated or truncated, since it will never be completed.
+        line, self._buffer = self._buffer, b""
+        if line:
+            capture_line(self._route, self._parser, line)
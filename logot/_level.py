@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
+import logging
 
 from logot._capture import Captured
 from logot._match import AnyMatcher, Matcher
@@ -56,3 +57,29 @@ def level_matcher(level: Wildcard[Level]) -> Matcher:
         return _LevelNoMatcher(level)
     # Handle invalid level.
     raise TypeError(f"Invalid level: {level!r}")
+
+
+def get_levelno(level: Level) -> int:
+    # Handle `int` level.
+    if isinstance(level, int):
+        return level
+    # Handle `str` level.
+    levelno = logging.getLevelName(level)
+    if isinstance(levelno, int):
+        return levelno
+    # Handle unknown level.
+    raise ValueError(f"Unknown level: {level!r}")
+
+
+def matcher_levelno(matcher: Matcher) -> int:
+    # Handle `str` level.
+    if isinstance(matcher, _LevelNameMatcher):
+        try:
+            return get_levelno(matcher.levelname)
+        except ValueError:
+            pass
+    # Handle `int` level.
+    if isinstance(matcher, _LevelNoMatcher):
+        return matcher.levelno
+    # Handle wildcard or unknown level. This requires capturing logs at all levels.
+    return logging.NOTSET
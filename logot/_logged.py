@@ -3,9 +3,18 @@ from __future__ import annotations
 import dataclasses
 from abc import ABC, abstractmethod
 
+from logot import _profiling
 from logot._capture import Captured
 from logot._exc_info import exc_info_matcher
-from logot._level import CRITICAL_MATCHER, DEBUG_MATCHER, ERROR_MATCHER, INFO_MATCHER, WARNING_MATCHER, level_matcher
+from logot._level import (
+    CRITICAL_MATCHER,
+    DEBUG_MATCHER,
+    ERROR_MATCHER,
+    INFO_MATCHER,
+    WARNING_MATCHER,
+    level_matcher,
+    matcher_levelno,
+)
 from logot._match import Matcher
 from logot._msg import msg_matcher
 from logot._name import name_matcher
@@ -68,6 +77,11 @@ class Logged(ABC):
     def _str(self, *, indent: str) -> str:
         raise NotImplementedError
 
+    @abstractmethod
+    def _levelno(self) -> int:
+        # The minimum log level number that must be captured to match this log pattern.
+        raise NotImplementedError
+
 
 def log(
     level: Wildcard[Level],
@@ -207,6 +221,9 @@ class _MatcherLogged(Logged):
     matchers: tuple[Matcher, ...]
 
     def reduce(self, captured: Captured) -> Logged | None:
+        # Handle profiling.
+        if _profiling.active:
+            return _profiling.profile_reduce(self, captured)
         # Handle full reduction.
         if all(matcher.match(captured) for matcher in self.matchers):
             return None
@@ -220,6 +237,10 @@ class _MatcherLogged(Logged):
     def _str(self, *, indent: str) -> str:
         return " ".join(map(str, self.matchers))
 
+    def _levelno(self) -> int:
+        # The level matcher is always the first matcher.
+        return matcher_levelno(self.matchers[0])
+
 
 @dataclasses.dataclass(frozen=True, repr=False)
 class _ComposedLogged(Logged):
@@ -241,6 +262,9 @@ class _ComposedLogged(Logged):
         # Wrap the logged items without flattening.
         return cls((logged_a, logged_b))
 
+    def _levelno(self) -> int:
+        return min(logged._levelno() for logged in self.logged_items)
+
     @classmethod
     def from_reduce(cls, logged_items: tuple[Logged, ...]) -> Logged | None:
         assert logged_items
@@ -1,9 +1,22 @@
 from __future__ import annotations
 
 import logging
+from _thread import LockType, allocate_lock
+from functools import partial
+from logging.handlers import QueueListener
+from threading import local
+from time import perf_counter
+from types import TracebackType
+from typing import Any, Callable, ClassVar
+from weakref import ref
 
 from logot._capture import Captured, capture_exc_info
+from logot._level import get_levelno
 from logot._logot import Capturer, Logot
+from logot._names import NameFilter
+from logot._profiling import LoggingProfileStats
+from logot._route import Route, Router
+from logot._scope import Scope
 from logot._typing import Level, Name
 
 
@@ -14,24 +27,235 @@ class LoggingCapturer(Capturer):
     .. note::
 
         This is the default :class:`logot.Capturer` implementation.
+
+    All :class:`logot.Logot` instances capturing from the same logger share a single handler, so each log is only
+    converted once, however many :class:`logot.Logot` instances capture it.
+
+    :param listener: An optional :class:`logging.handlers.QueueListener` to capture logs from. When provided, logs are
+        captured as they are handled by the listener, and :meth:`logot.Logot.flush` waits for the listener queue to be
+        drained. This requires a queue supporting ``join()`` (e.g. :class:`queue.Queue`).
+    """
+
+    __slots__ = ("_listener", "_loggers", "_handler", "_routes", "_prev_levelnos")
+
+    _name_filter = True
+
+    def __init__(self, *, listener: QueueListener | None = None) -> None:
+        self._listener = listener
+
+    def start_capturing(self, logot: Logot, /, *, level: Level, name: Name | NameFilter) -> None:
+        # Multiple names are captured from each outermost logger.
+        loggers = self._loggers = [
+            logging.getLogger(root) for root in (name.roots if isinstance(name, NameFilter) else (name,))
+        ]
+        levelno = get_levelno(level)
+        # If a logger is less verbose than the capture level, force it to the necessary verboseness.
+        self._prev_levelnos = [logger.level for logger in loggers]
+        for logger in loggers:
+            if levelno < logger.getEffectiveLevel():
+                logger.setLevel(levelno)
+        # Add a route to the shared handler of each logger. Only logs from the logger and its descendants reach the
+        # handler, so routes only need to filter by name when capturing multiple names, since some may be excluded.
+        if self._listener is None:
+            route_name = name if isinstance(name, NameFilter) else None
+            self._routes = [_SharedHandler.add(logger, logot, levelno=levelno, name=route_name) for logger in loggers]
+        # Add a handler to the listener. Listeners handle logs from any logger, and ignore handler levels by default, so
+        # filter by level and name.
+        else:
+            handler = self._handler = _Handler(levelno, logot)
+            handler.addFilter(_Filter(levelno, name))
+            self._listener.handlers = (*self._listener.handlers, handler)
+
+    def stop_capturing(self) -> None:
+        # Remove the routes (or handler) and restore the previous levels.
+        if self._listener is None:
+            for logger, route in zip(self._loggers, self._routes):
+                _SharedHandler.remove(logger, route)
+        else:
+            self._listener.handlers = tuple(h for h in self._listener.handlers if h is not self._handler)
+        # Setting a logger level clears the cache of every logger, so avoid it unless the level actually changed.
+        for logger, prev_levelno in zip(self._loggers, self._prev_levelnos):
+            if logger.level != prev_levelno:
+                logger.setLevel(prev_levelno)
+
+    def flush(self) -> None:
+        # Wait for the listener to handle all queued logs. A stopped listener never drains its queue, so joining the
+        # queue would block forever.
+        if self._listener is not None and getattr(self._listener, "_thread", None) is not None:
+            join = getattr(self._listener.queue, "join", None)
+            if join is not None:
+                join()
+
+
+class PersistentLoggingCapturer(Capturer):
     """
+    A :class:`logot.Capturer` implementation for :mod:`logging` that installs a single handler per logger ``name`` for
+    the whole session, switching its target :class:`logot.Logot` on each capture.
+
+    Unlike :class:`LoggingCapturer`, handlers are not added and removed for every capture, and logger levels are only
+    adjusted when the required verboseness actually changes. This makes capturing faster in large test suites.
+
+    .. important::
+
+        Handlers are *not* removed when capturing stops, and loggers made more verbose for capturing are kept at that
+        level. Use :meth:`uninstall` to remove all persistent handlers and restore the logger levels. The
+        :mod:`pytest` plugin does this automatically at the end of the test session.
+
+    :param scoped: Only capture logs emitted in the execution context where capturing started (including threads and
+        tasks started with a copy of that context), isolating tests running concurrently in the same process.
+    """
+
+    __slots__ = ("_scoped", "_handler", "_route")
 
-    __slots__ = ("_logger", "_handler", "_prev_levelno")
+    def __init__(self, *, scoped: bool = False) -> None:
+        self._scoped = scoped
 
     def start_capturing(self, logot: Logot, /, *, level: Level, name: Name) -> None:
-        logger = self._logger = logging.getLogger(name)
-        handler = self._handler = _Handler(level, logot)
-        # If the logger is less verbose than the handler, force it to the necessary verboseness.
-        self._prev_levelno = logger.level
-        if handler.level < logger.getEffectiveLevel():
-            logger.setLevel(handler.level)
-        # Add the handler.
-        logger.addHandler(handler)
+        handler = self._handler = _PersistentHandler.install(name)
+        scope = Scope() if self._scoped else None
+        if scope is not None:
+            scope.enter()
+        self._route = handler.router.add(logot, levelno=get_levelno(level), scope=scope)
+        handler.update_level()
 
     def stop_capturing(self) -> None:
-        # Remove the handler and restore the previous level.
-        self._logger.removeHandler(self._handler)
-        self._logger.setLevel(self._prev_levelno)
+        self._handler.router.remove(self._route)
+        if self._route.scope is not None:
+            self._route.scope.exit()
+
+    @staticmethod
+    def uninstall() -> None:
+        """
+        Removes all persistent handlers and restores the levels of their loggers.
+        """
+        _PersistentHandler.uninstall_all()
+
+
+class LoggingProfiler:
+    """
+    Profiles the time spent handling :mod:`logging` records, for each logger name and level.
+
+    Use as a context manager. While active, the time spent in each :class:`logging.Handler` is measured, including
+    filtering, message formatting and writing logs (e.g. to a stream or file). Use :meth:`report` to find expensive
+    logs, and guard them with :meth:`logging.Logger.isEnabledFor`.
+
+    Handlers installed by :mod:`logot` are not profiled. Handlers that override :meth:`logging.Handler.handle` are not
+    profiled, and handlers called by other handlers (e.g. the target of a :class:`logging.handlers.MemoryHandler`) are
+    profiled as part of the calling handler.
+
+    .. note::
+
+        Profiling adds overhead to every handled record, so only enable it while investigating slow tests.
+    """
+
+    __slots__ = ("_lock", "_stats")
+
+    _active_lock: ClassVar[LockType] = allocate_lock()
+    _active: ClassVar[tuple[LoggingProfiler, ...]] = ()
+    # The unprofiled `logging.Handler.handle()`, restored once no profilers are active.
+    _handle: ClassVar[Callable[[logging.Handler, logging.LogRecord], Any]] = logging.Handler.handle
+
+    def __init__(self) -> None:
+        self._lock = allocate_lock()
+        self._stats: dict[tuple[str, str], list[Any]] = {}
+
+    def __enter__(self) -> LoggingProfiler:
+        cls = LoggingProfiler
+        with cls._active_lock:
+            # Handle first active profiler.
+            if not cls._active:
+                cls._handle = logging.Handler.handle
+                logging.Handler.handle = _profiled_handle  # type: ignore[method-assign]
+            cls._active = (*cls._active, self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        cls = LoggingProfiler
+        with cls._active_lock:
+            cls._active = tuple(profiler for profiler in cls._active if profiler is not self)
+            # Handle last active profiler.
+            if not cls._active:
+                logging.Handler.handle = cls._handle  # type: ignore[method-assign, assignment]
+
+    @property
+    def stats(self) -> list[LoggingProfileStats]:
+        """
+        Profiling statistics for each logger name and level, sorted by total time (most expensive first).
+        """
+        with self._lock:
+            stats = [
+                LoggingProfileStats(name=name, levelname=levelname, records=records, seconds=seconds)
+                for (name, levelname), (records, seconds) in self._stats.items()
+            ]
+        return sorted(stats, key=lambda entry: entry.seconds, reverse=True)
+
+    def report(self, *, limit: int = 20) -> str:
+        """
+        Returns a report of the most expensive logger names and levels.
+
+        :param limit: The maximum number of logger names and levels to include.
+        """
+        return "\n".join(
+            (
+                "Logging overhead:",
+                f"{'records':>10} {'total (ms)':>12} {'per record (us)':>16}  {'level':<8} logger",
+                *(
+                    f"{entry.records:>10} {entry.seconds * 1e3:>12.3f} "
+                    f"{entry.seconds / entry.records * 1e6:>16.3f}  {entry.levelname:<8} {entry.name}"
+                    for entry in self.stats[:limit]
+                ),
+            )
+        )
+
+    def _record(self, record: logging.LogRecord, new: bool, seconds: float) -> None:
+        with self._lock:
+            try:
+                entry = self._stats[(record.name, record.levelname)]
+            except KeyError:
+                entry = self._stats[(record.name, record.levelname)] = [0, 0.0]
+            entry[0] += new
+            entry[1] += seconds
+
+
+# The record being handled by each thread, used by `LoggingProfiler`.
+_profiled_local = local()
+
+
+def _profiled_handle(self: logging.Handler, record: logging.LogRecord) -> Any:
+    # Profiled version of `logging.Handler.handle()`, installed while a `LoggingProfiler` is active.
+    handle = LoggingProfiler._handle
+    # Handle logot handlers, and handlers called by other handlers.
+    if isinstance(self, (_Handler, _SharedHandler, _PersistentHandler)) or getattr(_profiled_local, "handling", False):
+        return handle(self, record)
+    # Only count each record once, however many handlers handle it. A weak reference avoids keeping the record alive.
+    prev = getattr(_profiled_local, "record", None)
+    new = prev is None or prev() is not record
+    _profiled_local.record = ref(record)
+    _profiled_local.handling = True
+    start = perf_counter()
+    try:
+        return handle(self, record)
+    finally:
+        seconds = perf_counter() - start
+        _profiled_local.handling = False
+        for profiler in LoggingProfiler._active:
+            profiler._record(record, new, seconds)
+
+
+def _capture_record(record: logging.LogRecord) -> Captured:
+    return Captured(
+        record.levelname,
+        record.getMessage(),
+        exc_info=capture_exc_info(record.exc_info),
+        levelno=record.levelno,
+        name=record.name,
+        record=record,
+    )
 
 
 class _Handler(logging.Handler):
@@ -42,12 +266,115 @@ class _Handler(logging.Handler):
         self._logot = logot
 
     def emit(self, record: logging.LogRecord) -> None:
-        captured = Captured(
-            record.levelname,
-            record.getMessage(),
-            exc_info=capture_exc_info(record.exc_info),
-            levelno=record.levelno,
-            name=record.name,
-            record=record,
-        )
-        self._logot.capture(captured)
+        self._logot.capture(_capture_record(record))
+
+
+class _SharedHandler(logging.Handler):
+    # A handler shared by all `LoggingCapturer` instances capturing from the same logger. Each record is converted once,
+    # and the same `Captured` is sent to all capturing `Logot` instances. The handler is removed from the logger once
+    # nothing is capturing from it.
+
+    __slots__ = ("router",)
+
+    _lock: ClassVar[LockType] = allocate_lock()
+    _installed: ClassVar[dict[logging.Logger, _SharedHandler]] = {}
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.router = Router()
+
+    @classmethod
+    def add(cls, logger: logging.Logger, logot: Logot, *, levelno: int, name: NameFilter | None) -> Route:
+        with cls._lock:
+            handler = cls._installed.get(logger)
+            # Handle first capture from the logger.
+            if handler is None:
+                handler = cls._installed[logger] = cls()
+                logger.addHandler(handler)
+            route = handler.router.add(logot, levelno=levelno, name=name)
+            # Reject records not accepted by any route before the handler lock is taken.
+            handler.setLevel(handler.router.levelno)
+            return route
+
+    @classmethod
+    def remove(cls, logger: logging.Logger, route: Route) -> None:
+        with cls._lock:
+            handler = cls._installed[logger]
+            handler.router.remove(route)
+            # Handle last capture from the logger.
+            if not handler.router.routes:
+                logger.removeHandler(handler)
+                del cls._installed[logger]
+            else:
+                handler.setLevel(handler.router.levelno)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.router.dispatch(record.levelno, record.name, partial(_capture_record, record))
+
+
+class _Filter(logging.Filter):
+    __slots__ = ("_levelno", "_names")
+
+    def __init__(self, levelno: int, name: Name | NameFilter) -> None:
+        super().__init__(name if isinstance(name, str) else "")
+        self._levelno = levelno
+        self._names = name if isinstance(name, NameFilter) else None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Handle level.
+        if record.levelno < self._levelno:
+            return False
+        # Handle multiple names.
+        if self._names is not None:
+            return self._names.accepts(record.name)
+        # Handle a single name.
+        return super().filter(record)
+
+
+class _PersistentHandler(logging.Handler):
+    __slots__ = ("logger", "router", "_prev_levelno")
+
+    _lock: ClassVar[LockType] = allocate_lock()
+    _installed: ClassVar[dict[Name, _PersistentHandler]] = {}
+
+    def __init__(self, logger: logging.Logger) -> None:
+        super().__init__()
+        self.logger = logger
+        self.router = Router()
+        self._prev_levelno = logger.level
+
+    @classmethod
+    def install(cls, name: Name) -> _PersistentHandler:
+        with cls._lock:
+            # Reuse an existing handler.
+            try:
+                return cls._installed[name]
+            except KeyError:
+                pass
+            # Install a new handler.
+            logger = logging.getLogger(name)
+            handler = cls._installed[name] = cls(logger)
+            logger.addHandler(handler)
+            return handler
+
+    @classmethod
+    def uninstall_all(cls) -> None:
+        with cls._lock:
+            for handler in cls._installed.values():
+                handler.logger.removeHandler(handler)
+                if handler.logger.level != handler._prev_levelno:
+                    handler.logger.setLevel(handler._prev_levelno)
+            cls._installed.clear()
+
+    def update_level(self) -> None:
+        # Concurrent captures may update the level from different threads.
+        with self._lock:
+            # If the logger is less verbose than any route, force it to the necessary verboseness. The level is kept
+            # for the whole session, with routes filtering logs by level, since setting a logger level clears the
+            # cache of every logger. The previous level is restored by `uninstall_all()`.
+            if self.router.levelno < self.logger.getEffectiveLevel():
+                self.logger.setLevel(self.router.levelno)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # The handler is installed on a single logger, so routes only filter by level.
+        self.router.dispatch(record.levelno, None, partial(_capture_record, record))
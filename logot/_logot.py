@@ -1,17 +1,32 @@
 from __future__ import annotations
 
+import itertools
 from _thread import allocate_lock
 from abc import ABC, abstractmethod
 from collections import deque
+from collections.abc import Iterator, Mapping, Sequence
 from contextlib import AbstractContextManager
+from time import perf_counter
 from types import TracebackType
-from typing import Any, Callable, ClassVar, Generic
+from typing import Any, Callable, ClassVar, Generic, cast
 
-from logot._capture import Captured
+from logot._capture import Captured, msg_equals, retain
 from logot._import import LazyCallable
-from logot._logged import Logged
-from logot._typing import Level, Name
-from logot._validate import validate_level, validate_name, validate_timeout
+from logot._logged import Logged, _AnyLogged, _ComposedLogged, _UnorderedAllLogged
+from logot._names import NameFilter
+from logot._spill import Spill
+from logot._stats import LogotStats, Stats, captured_size
+from logot._typing import ExcInfoRetention, Level, Name, RecordRetention
+from logot._validate import (
+    validate_exc_info_retention,
+    validate_level,
+    validate_max_buffered,
+    validate_max_msg_len,
+    validate_names,
+    validate_record_retention,
+    validate_sample,
+    validate_timeout,
+)
 from logot._wait import AsyncWaiter, W, create_threading_waiter
 
 
@@ -26,9 +41,32 @@ class Logot:
     :param capturer: See :attr:`Logot.capturer`.
     :param timeout: See :attr:`Logot.timeout`.
     :param async_waiter: See :attr:`Logot.async_waiter`.
+    :param record_retention: See :attr:`Logot.record_retention`.
+    :param exc_info_retention: See :attr:`Logot.exc_info_retention`.
+    :param max_msg_len: See :attr:`Logot.max_msg_len`.
+    :param max_buffered: See :attr:`Logot.max_buffered`.
+    :param measure_bytes: See :attr:`Logot.measure_bytes`.
     """
 
-    __slots__ = ("capturer", "timeout", "async_waiter", "_lock", "_queue", "_wait")
+    __slots__ = (
+        "capturer",
+        "timeout",
+        "async_waiter",
+        "record_retention",
+        "exc_info_retention",
+        "max_msg_len",
+        "max_buffered",
+        "measure_bytes",
+        "_lock",
+        "_queue_lock",
+        "_queue",
+        "_counts",
+        "_spill",
+        "_stats",
+        "_wait",
+        "_capturers",
+        "_reduced_levelno",
+    )
 
     DEFAULT_LEVEL: ClassVar[Level] = "DEBUG"
     """
@@ -57,6 +95,26 @@ class Logot:
     The default :attr:`async_waiter` for new :class:`Logot` instances.
     """
 
+    DEFAULT_RECORD_RETENTION: ClassVar[RecordRetention] = "full"
+    """
+    The default :attr:`record_retention` for new :class:`Logot` instances.
+    """
+
+    DEFAULT_EXC_INFO_RETENTION: ClassVar[ExcInfoRetention] = "full"
+    """
+    The default :attr:`exc_info_retention` for new :class:`Logot` instances.
+    """
+
+    DEFAULT_MAX_MSG_LEN: ClassVar[int | None] = None
+    """
+    The default :attr:`max_msg_len` for new :class:`Logot` instances.
+    """
+
+    DEFAULT_MAX_BUFFERED: ClassVar[int | None] = None
+    """
+    The default :attr:`max_buffered` for new :class:`Logot` instances.
+    """
+
     capturer: Callable[[], Capturer]
     """
     The default ``capturer`` used by :meth:`capturing`.
@@ -86,25 +144,103 @@ class Logot:
     Defaults to :attr:`Logot.DEFAULT_ASYNC_WAITER`.
     """
 
+    record_retention: RecordRetention
+    """
+    How much of the underlying log record is kept for each captured log.
+
+    - ``"full"`` - The underlying log record is kept in :attr:`Captured.record`.
+    - ``"none"`` - The underlying log record is dropped, freeing any ``args`` or extra data it references. Custom
+      ``*matchers`` that use :attr:`Captured.record` will not match.
+
+    Defaults to :attr:`Logot.DEFAULT_RECORD_RETENTION`.
+    """
+
+    exc_info_retention: ExcInfoRetention
+    """
+    How much of the log exception is kept for each captured log.
+
+    - ``"full"`` - The exception is kept in :attr:`Captured.exc_info`.
+    - ``"snapshot"`` - An :class:`ExcSnapshot` is kept in :attr:`Captured.exc_info`, releasing the exception traceback
+      and all its frames. Snapshots still match :doc:`log patterns </log-pattern-matching>` with an ``exc_info``.
+
+    .. note::
+
+        The underlying log record can also reference the exception, so combine this with ``record_retention="none"``
+        to release the exception traceback.
+
+    Defaults to :attr:`Logot.DEFAULT_EXC_INFO_RETENTION`.
+    """
+
+    max_msg_len: int | None
+    """
+    The maximum length of each captured log message, or :data:`None` for no maximum.
+
+    Longer messages are truncated. A digest of the full message is kept, so truncated messages still match exact
+    :doc:`message patterns </log-message-matching>`. Message patterns with conversion specifiers (e.g. ``%s``) only
+    match the truncated message.
+
+    Defaults to :attr:`Logot.DEFAULT_MAX_MSG_LEN`.
+    """
+
+    max_buffered: int | None
+    """
+    The maximum number of captured logs buffered in memory, or :data:`None` for no maximum.
+
+    Older logs are spilled to a temporary file, and read back as they are matched against
+    :doc:`log patterns </log-pattern-matching>`. Spilled logs do not keep the underlying log record in
+    :attr:`Captured.record`, so custom ``*matchers`` that use it will not match them.
+
+    Defaults to :attr:`Logot.DEFAULT_MAX_BUFFERED`.
+    """
+
+    measure_bytes: bool
+    """
+    Whether to measure the approximate memory used by captured logs, reported by :attr:`LogotStats.captured_bytes`.
+
+    Measuring adds overhead to every captured log, so it is disabled by default.
+    """
+
     def __init__(
         self,
         *,
         capturer: Callable[[], Capturer] = DEFAULT_CAPTURER,
         timeout: float = DEFAULT_TIMEOUT,
         async_waiter: Callable[[], AsyncWaiter] = DEFAULT_ASYNC_WAITER,
+        record_retention: RecordRetention = DEFAULT_RECORD_RETENTION,
+        exc_info_retention: ExcInfoRetention = DEFAULT_EXC_INFO_RETENTION,
+        max_msg_len: int | None = DEFAULT_MAX_MSG_LEN,
+        max_buffered: int | None = DEFAULT_MAX_BUFFERED,
+        measure_bytes: bool = False,
     ) -> None:
         self.capturer = capturer
         self.timeout = validate_timeout(timeout)
         self.async_waiter = async_waiter
+        self.record_retention = validate_record_retention(record_retention)
+        self.exc_info_retention = validate_exc_info_retention(exc_info_retention)
+        self.max_msg_len = validate_max_msg_len(max_msg_len)
+        self.max_buffered = validate_max_buffered(max_buffered)
+        self.measure_bytes = measure_bytes
         self._lock = allocate_lock()
+        self._queue_lock = allocate_lock()
         self._queue: deque[Captured] = deque()
+        # The number of consecutive repeats of each buffered log.
+        self._counts: deque[int] = deque()
+        # Older logs spilled to disk once more than `max_buffered` logs are buffered.
+        self._spill: Spill | None = None
+        # Statistics about the captured logs, including logs discarded by sampling.
+        self._stats = Stats()
         self._wait: _Wait[Any] | None = None
+        self._capturers: list[Capturer] = []
+        # The minimum log level number required by any log pattern reduced by this instance.
+        self._reduced_levelno: int | None = None
 
     def capturing(
         self,
         *,
         level: Level = DEFAULT_LEVEL,
-        name: Name = DEFAULT_NAME,
+        name: Name | Sequence[str] = DEFAULT_NAME,
+        exclude: Sequence[str] = (),
+        sample: Mapping[Level, float] | None = None,
         capturer: Callable[[], Capturer] | None = None,
     ) -> AbstractContextManager[Logot]:
         """
@@ -120,16 +256,29 @@ class Logot:
 
         :param level: A log level name (e.g. ``"DEBUG"``) or numeric level (e.g. :data:`logging.DEBUG`). Defaults to
             :attr:`Logot.DEFAULT_LEVEL`.
-        :param name: A logger name to capture logs from. Defaults to :attr:`Logot.DEFAULT_NAME`.
+        :param name: A logger name to capture logs from, or a sequence of logger names. Defaults to
+            :attr:`Logot.DEFAULT_NAME`.
+        :param exclude: A sequence of logger names *not* to capture logs from. Each logger name also excludes its
+            descendants, unless they are captured by a more specific ``name``.
+        :param sample: An optional mapping of log levels to sample rates (from ``0.0`` to ``1.0``). Only that fraction
+            of the logs emitted at each level by each logger are captured, with sampling done deterministically (e.g. a
+            rate of ``0.1`` captures every 10th log). Logs at other levels are always captured. Use
+            :meth:`level_counts` to get the number of logs emitted at each level, including logs not captured.
         :param capturer: Protocol used to capture logs. This is for integration with
             :ref:`3rd-party logging frameworks <integrations-logging>`. Defaults to :attr:`Logot.capturer`.
+        :raises TypeError: If multiple ``name`` values or ``exclude`` are given, and the ``capturer`` does not support
+            them.
         """
         if capturer is None:
             capturer = self.capturer
         capturer_obj = capturer()
         level = validate_level(level)
-        name = validate_name(name)
-        return _Capturing(self, capturer_obj, level=level, name=name)
+        name_or_filter = validate_names(name, exclude)
+        sample_names = validate_sample(sample)
+        # Handle capturers that only support a single logger name.
+        if isinstance(name_or_filter, NameFilter) and not capturer_obj._name_filter:
+            raise TypeError(f"{type(capturer_obj).__name__} does not support multiple names or exclude")
+        return _Capturing(self, capturer_obj, level=level, name=name_or_filter, sample=sample_names)
 
     def capture(self, captured: Captured) -> None:
         """
@@ -145,16 +294,46 @@ class Logot:
 
         :param captured: The captured log.
         """
+        start = perf_counter()
+        retained = retain(
+            captured,
+            record_retention=self.record_retention,
+            exc_info_retention=self.exc_info_retention,
+            max_msg_len=self.max_msg_len,
+        )
+        size = captured_size(retained) if self.measure_bytes else 0
         with self._lock:
+            self._stats.count(captured, size)
             # If there is a waiter that has not been fully reduced, attempt to reduce it.
             if self._wait is not None and self._wait.logged is not None:
-                self._wait.logged = self._wait.logged.reduce(captured)
+                self._wait.logged = self._wait.logged.reduce(retained)
                 # If the waiter has fully reduced, release the blocked caller.
                 if self._wait.logged is None:
                     self._wait.waiter_obj.release()
-                return
+                with self._queue_lock:
+                    self._stats.consume(captured, 1)
             # Otherwise, buffer the captured log.
-            self._queue.append(captured)
+            else:
+                with self._queue_lock:
+                    self._buffer(retained)
+            self._stats.capture_seconds += perf_counter() - start
+
+    def flush(self) -> None:
+        """
+        Waits for any logs emitted *before* this call to be captured.
+
+        This is only needed for logging pipelines that capture logs *asynchronously* (e.g. via a
+        :class:`logging.handlers.QueueListener`). It is called automatically by :meth:`assert_logged` and
+        :meth:`assert_not_logged`.
+
+        .. seealso::
+
+            See :meth:`Capturer.flush` API reference.
+        """
+        with self._lock:
+            capturers = (*self._capturers,)
+        for capturer_obj in capturers:
+            capturer_obj.flush()
 
     def assert_logged(self, logged: Logged) -> None:
         """
@@ -163,6 +342,7 @@ class Logot:
         :param logged: The expected :doc:`log pattern </log-pattern-matching>`.
         :raises AssertionError: If the expected log pattern has not arrived.
         """
+        self.flush()
         reduced = self.reduce(logged)
         if reduced is not None:
             raise AssertionError(f"Not logged:\n\n{reduced}")
@@ -174,6 +354,7 @@ class Logot:
         :param logged: The expected :doc:`log pattern </log-pattern-matching>`.
         :raises AssertionError: If the expected log pattern **has** arrived.
         """
+        self.flush()
         reduced = self.reduce(logged)
         if reduced is None:
             raise AssertionError(f"Logged:\n\n{logged}")
@@ -197,7 +378,7 @@ class Logot:
         try:
             wait.waiter_obj.acquire(timeout=wait.timeout)
         finally:
-            self._stop_waiting(wait)
+            _raise_not_logged(self._stop_waiting(wait))
 
     async def await_for(
         self,
@@ -223,7 +404,7 @@ class Logot:
         try:
             await wait.waiter_obj.wait(timeout=wait.timeout)
         finally:
-            self._stop_waiting(wait)
+            _raise_not_logged(self._stop_waiting(wait))
 
     def reduce(self, logged: Logged) -> Logged | None:
         """
@@ -239,23 +420,103 @@ class Logot:
 
         :param logged: The expected :doc:`log pattern </log-pattern-matching>`.
         """
+        # Track the log level required by the log pattern.
+        levelno = logged._levelno()
+        if self._reduced_levelno is None or levelno < self._reduced_levelno:
+            self._reduced_levelno = levelno
         reduced: Logged | None = logged
         # Drain the queue until the log is fully reduced.
-        # This does not need a lock, since `deque.popleft()` is thread-safe.
         while reduced is not None:
-            try:
-                captured = self._queue.popleft()
-            except IndexError:
-                break
-            reduced = reduced.reduce(captured)
+            with self._queue_lock:
+                # Handle spilled logs, which are older than logs buffered in memory.
+                spill = self._spill
+                if spill:
+                    captured, popped_count = spill.popleft()
+                else:
+                    spill = None
+                    try:
+                        captured = self._queue.popleft()
+                    except IndexError:
+                        break
+                    popped_count = self._counts.popleft()
+            count = popped_count
+            # Reduce using each repeat of the captured log. Log patterns reduce repeats in the same way, so once a
+            # repeat does not reduce the log pattern, the remaining repeats are skipped.
+            while count:
+                count -= 1
+                prev_reduced = reduced
+                reduced = reduced.reduce(captured)
+                if reduced is prev_reduced:
+                    count = 0
+                elif reduced is None:
+                    break
+            with self._queue_lock:
+                self._stats.consume(captured, popped_count - count)
+                self._stats.buffered -= popped_count - count
+                # Handle fully reduced log pattern, returning any remaining repeats to the queue.
+                if count:
+                    if spill is not None:
+                        spill.appendleft(captured, count)
+                    else:
+                        self._queue.appendleft(captured)
+                        self._counts.appendleft(count)
         # All done!
         return reduced
 
+    def level_counts(self) -> dict[str, int]:
+        """
+        Returns the number of logs captured at each level name (e.g. ``{"INFO": 12}``).
+
+        Logs not captured due to ``sample`` in :meth:`capturing` are also counted.
+        """
+        with self._lock:
+            return self._stats.levels()
+
+    def stats(self) -> LogotStats:
+        """
+        Returns statistics about the captured logs.
+
+        Use :meth:`LogotStats.to_json` or :meth:`LogotStats.to_prometheus` to export the statistics (e.g. to track log
+        volume in CI).
+        """
+        with self._lock, self._queue_lock:
+            return self._stats.snapshot()
+
     def clear(self) -> None:
         """
-        Clears any captured logs.
+        Clears any captured logs and statistics.
         """
-        self._queue.clear()
+        with self._lock, self._queue_lock:
+            self._stats = Stats()
+            self._queue.clear()
+            self._counts.clear()
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+
+    def _usage(self) -> dict[tuple[str, Name], tuple[int, int]]:
+        # The number of logs captured and consumed, keyed by `(level name, logger name)`.
+        with self._lock, self._queue_lock:
+            consumed_counts = self._stats.consumed_counts
+            return {key: (count, consumed_counts.get(key, 0)) for key, count in self._stats.counts.items()}
+
+    def _buffer(self, captured: Captured) -> None:
+        # This must be called while holding `_queue_lock`.
+        stats = self._stats
+        stats.buffered += 1
+        if stats.buffered > stats.peak_buffered:
+            stats.peak_buffered = stats.buffered
+        # Handle a repeat of the last buffered log, counting it instead of buffering it again.
+        if self._queue and _is_repeat(self._queue[-1], captured):
+            self._counts[-1] += 1
+            return
+        self._queue.append(captured)
+        self._counts.append(1)
+        # Spill the oldest buffered log once too many logs are buffered.
+        if self.max_buffered is not None and len(self._queue) > self.max_buffered:
+            if self._spill is None:
+                self._spill = Spill()
+            self._spill.append(self._queue.popleft(), self._counts.popleft())
 
     def _start_waiting(self, logged: Logged, waiter: Callable[[], W], *, timeout: float | None) -> _Wait[W] | None:
         with self._lock:
@@ -277,18 +538,204 @@ class Logot:
             wait = self._wait = _Wait(logged=reduced, timeout=timeout, waiter_obj=waiter_obj)
             return wait
 
-    def _stop_waiting(self, wait: _Wait[Any]) -> None:
+    def _stop_waiting(self, wait: _Wait[Any]) -> Logged | None:
         with self._lock:
             # Clear the waiter.
             self._wait = None
-            # Error if the waiter logs are not fully reduced.
-            if wait.logged is not None:
-                raise AssertionError(f"Not logged:\n\n{wait.logged}")
+            # Return any logs that were not fully reduced.
+            return wait.logged
 
     def __repr__(self) -> str:
         return f"Logot(capturer={self.capturer!r}, timeout={self.timeout!r}, async_waiter={self.async_waiter!r})"
 
 
+def _is_repeat(prev: Captured, captured: Captured) -> bool:
+    # Logs are only repeats if no log pattern can tell them apart. Underlying log records are always different, so logs
+    # are only counted as repeats once their records are dropped (e.g. with `record_retention="none"`).
+    return (
+        prev.record is ...
+        and captured.record is ...
+        and msg_equals(prev.msg, captured.msg)
+        and prev.levelname == captured.levelname
+        and prev.levelno == captured.levelno
+        and prev.name == captured.name
+        and prev.exc_info is captured.exc_info
+    )
+
+
+def wait_for_all(logged: Mapping[Logot, Logged], *, timeout: float | None = None) -> None:
+    """
+    Waits for *all* the expected log patterns to arrive at their :class:`Logot` or the ``timeout`` to expire.
+
+    .. code:: python
+
+        wait_for_all({logot_a: logged.info("App started"), logot_b: logged.info("Worker started")})
+
+    :param logged: A mapping of :class:`Logot` instances to their expected
+        :doc:`log pattern </log-pattern-matching>`.
+    :param timeout: How long to wait (in seconds) before failing the test. Defaults to the largest
+        :attr:`Logot.timeout`.
+    :raises AssertionError: If any expected log pattern does not arrive within ``timeout`` seconds.
+    """
+    _wait_for_group(logged, _UnorderedAllLogged, timeout=timeout)
+
+
+def wait_for_any(logged: Mapping[Logot, Logged], *, timeout: float | None = None) -> None:
+    """
+    Waits for *any* of the expected log patterns to arrive at their :class:`Logot` or the ``timeout`` to expire.
+
+    .. note::
+
+        As with :meth:`Logot.wait_for`, captured logs are consumed while they are matched against the expected log
+        patterns. Logs partially matched by the *other* :class:`Logot` instances are not restored.
+
+    :param logged: A mapping of :class:`Logot` instances to their expected
+        :doc:`log pattern </log-pattern-matching>`.
+    :param timeout: How long to wait (in seconds) before failing the test. Defaults to the largest
+        :attr:`Logot.timeout`.
+    :raises AssertionError: If no expected log pattern arrives within ``timeout`` seconds.
+    """
+    _wait_for_group(logged, _AnyLogged, timeout=timeout)
+
+
+async def await_for_all(
+    logged: Mapping[Logot, Logged],
+    *,
+    timeout: float | None = None,
+    async_waiter: Callable[[], AsyncWaiter] | None = None,
+) -> None:
+    """
+    Waits *asynchronously* for *all* the expected log patterns to arrive at their :class:`Logot` or the ``timeout`` to
+    expire.
+
+    :param logged: A mapping of :class:`Logot` instances to their expected
+        :doc:`log pattern </log-pattern-matching>`.
+    :param timeout: How long to wait (in seconds) before failing the test. Defaults to the largest
+        :attr:`Logot.timeout`.
+    :param async_waiter: Protocol used to pause tests until expected logs arrive. This is for integration with
+        :ref:`3rd-party asynchronous frameworks <integrations-async>`. Defaults to the :attr:`Logot.async_waiter` of
+        the first :class:`Logot`.
+    :raises AssertionError: If any expected log pattern does not arrive within ``timeout`` seconds.
+    """
+    await _await_for_group(logged, _UnorderedAllLogged, timeout=timeout, async_waiter=async_waiter)
+
+
+async def await_for_any(
+    logged: Mapping[Logot, Logged],
+    *,
+    timeout: float | None = None,
+    async_waiter: Callable[[], AsyncWaiter] | None = None,
+) -> None:
+    """
+    Waits *asynchronously* for *any* of the expected log patterns to arrive at their :class:`Logot` or the
+    ``timeout`` to expire.
+
+    .. note::
+
+        As with :meth:`Logot.await_for`, captured logs are consumed while they are matched against the expected log
+        patterns. Logs partially matched by the *other* :class:`Logot` instances are not restored.
+
+    :param logged: A mapping of :class:`Logot` instances to their expected
+        :doc:`log pattern </log-pattern-matching>`.
+    :param timeout: How long to wait (in seconds) before failing the test. Defaults to the largest
+        :attr:`Logot.timeout`.
+    :param async_waiter: Protocol used to pause tests until expected logs arrive. This is for integration with
+        :ref:`3rd-party asynchronous frameworks <integrations-async>`. Defaults to the :attr:`Logot.async_waiter` of
+        the first :class:`Logot`.
+    :raises AssertionError: If no expected log pattern arrives within ``timeout`` seconds.
+    """
+    await _await_for_group(logged, _AnyLogged, timeout=timeout, async_waiter=async_waiter)
+
+
+def _wait_for_group(logged: Mapping[Logot, Logged], compose: type[_ComposedLogged], *, timeout: float | None) -> None:
+    _validate_group(logged)
+    group = _start_waiting_group(logged, compose, create_threading_waiter, timeout=timeout)
+    if group is None:
+        return
+    try:
+        group.waiter_obj.acquire(timeout=group.timeout)
+    finally:
+        _raise_not_logged(_stop_waiting_group(group))
+
+
+async def _await_for_group(
+    logged: Mapping[Logot, Logged],
+    compose: type[_ComposedLogged],
+    *,
+    timeout: float | None,
+    async_waiter: Callable[[], AsyncWaiter] | None,
+) -> None:
+    _validate_group(logged)
+    if async_waiter is None:
+        async_waiter = next(iter(logged)).async_waiter
+    group = _start_waiting_group(logged, compose, async_waiter, timeout=timeout)
+    if group is None:
+        return
+    try:
+        await group.waiter_obj.wait(timeout=group.timeout)
+    finally:
+        _raise_not_logged(_stop_waiting_group(group))
+
+
+def _validate_group(logged: Mapping[Logot, Logged]) -> None:
+    if not logged:
+        raise ValueError("No log patterns to wait for")
+
+
+def _start_waiting_group(
+    logged: Mapping[Logot, Logged],
+    compose: type[_ComposedLogged],
+    waiter: Callable[[], W],
+    *,
+    timeout: float | None,
+) -> _WaitGroup[W] | None:
+    # If no timeout is provided, use the largest default timeout.
+    # Otherwise, validate and use the provided timeout.
+    if timeout is None:
+        timeout = max(logot.timeout for logot in logged)
+    else:
+        timeout = validate_timeout(timeout)
+    # An "all" group is released once every waiter has fully reduced. An "any" group is released by the first.
+    is_any = compose is _AnyLogged
+    group = _WaitGroup(compose, timeout=timeout, waiter_obj=waiter(), count=1 if is_any else len(logged))
+    try:
+        for logot, logged_item in logged.items():
+            # All waits share the group as their waiter.
+            wait = logot._start_waiting(logged_item, lambda: group, timeout=timeout)
+            if wait is None:
+                # Handle an immediate full reduction.
+                group.release()
+                if is_any:
+                    break
+            else:
+                group.waits.append((logot, wait))
+        # Skip waiting if there is nothing left to wait for.
+        if group.is_released():
+            _stop_waiting_group(group)
+            return None
+    except BaseException:
+        _stop_waiting_group(group)
+        raise
+    # All done!
+    return group
+
+
+def _stop_waiting_group(group: _WaitGroup[Any]) -> Logged | None:
+    # Stop all the waits, collecting logs that were not fully reduced.
+    reduced_items = tuple(reduced for logot, wait in group.waits if (reduced := logot._stop_waiting(wait)) is not None)
+    group.waits.clear()
+    # An "any" group is satisfied by a single full reduction.
+    if group.is_released() or not reduced_items:
+        return None
+    return group.compose.from_reduce(reduced_items)
+
+
+def _raise_not_logged(reduced: Logged | None) -> None:
+    # Error if the waiter logs are not fully reduced.
+    if reduced is not None:
+        raise AssertionError(f"Not logged:\n\n{reduced}")
+
+
 class Capturer(ABC):
     """
     Protocol used by :meth:`Logot.capturing` to capture logs.
@@ -301,6 +748,14 @@ class Capturer(ABC):
 
     __slots__ = ()
 
+    # Whether `start_capturing()` accepts a `NameFilter` as `name`, supporting capturing multiple logger names.
+    _name_filter: ClassVar[bool] = False
+
+    def _is_forwarded(self, captured: Captured) -> bool:
+        # Whether a log captured by another capturer was forwarded from the logging framework of this capturer (e.g. by
+        # a handler propagating logs to `logging`). This is used by `CompositeCapturer` to only capture such logs once.
+        return False
+
     @abstractmethod
     def start_capturing(self, logot: Logot, /, *, level: Level, name: Name) -> None:
         """
@@ -321,18 +776,40 @@ class Capturer(ABC):
         """
         raise NotImplementedError
 
+    def flush(self) -> None:
+        """
+        Waits for any logs emitted *before* this call to be sent to :meth:`Logot.capture`.
+
+        Capturers that receive logs *asynchronously* (e.g. from a queue processed by another thread) should override
+        this to drain any pending logs. The default implementation does nothing.
+        """
+
 
 class _Capturing:
-    __slots__ = ("_logot", "_capturer_obj", "_level", "_name")
+    __slots__ = ("_logot", "_capturer_obj", "_level", "_name", "_sample")
 
-    def __init__(self, logot: Logot, capturer_obj: Capturer, *, level: Level, name: Name) -> None:
+    def __init__(
+        self,
+        logot: Logot,
+        capturer_obj: Capturer,
+        *,
+        level: Level,
+        name: Name | NameFilter,
+        sample: dict[str, float] | None,
+    ) -> None:
         self._logot = logot
         self._capturer_obj = capturer_obj
         self._level = level
         self._name = name
+        self._sample = sample
 
     def __enter__(self) -> Logot:
-        self._capturer_obj.start_capturing(self._logot, level=self._level, name=self._name)
+        # Sampled logs are discarded before they reach the `Logot`.
+        logot = self._logot if self._sample is None else cast(Logot, _SampledLogot(self._logot, self._sample))
+        # A `NameFilter` is only passed to capturers that support it.
+        self._capturer_obj.start_capturing(logot, level=self._level, name=cast(Name, self._name))
+        with self._logot._lock:
+            self._logot._capturers.append(self._capturer_obj)
         return self._logot
 
     def __exit__(
@@ -341,9 +818,65 @@ class _Capturing:
         exc_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
+        with self._logot._lock:
+            self._logot._capturers.remove(self._capturer_obj)
         self._capturer_obj.stop_capturing()
 
 
+class LogotProxy:
+    # A capture target passed to capturers in place of a `Logot`, forwarding captured logs to the wrapped `Logot`.
+    # Subclasses override `capture()` to filter logs. All other attributes are read from the wrapped `Logot`, so
+    # capturers never act on separate proxy state.
+
+    __slots__ = ("_logot",)
+
+    def __init__(self, logot: Logot) -> None:
+        self._logot = logot
+
+    def capture(self, captured: Captured) -> None:
+        self._logot.capture(captured)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._logot, name)
+
+
+class _SampledLogot(LogotProxy):
+    # A `Logot` proxy passed to capturers when capturing with `sample`, only keeping a fraction of the logs at each
+    # sampled level. Sampling is deterministic: for each level and logger name, a log is kept each time the running
+    # total of the sample rate reaches a whole number.
+
+    __slots__ = ("_sample", "_counters")
+
+    def __init__(self, logot: Logot, sample: dict[str, float]) -> None:
+        super().__init__(logot)
+        self._sample = sample
+        # The number of logs seen for each sampled level name and logger name. `next()` on a counter is atomic, so
+        # logs can be counted from any thread without a lock.
+        self._counters: dict[tuple[str, Name], Iterator[int]] = {}
+
+    def capture(self, captured: Captured) -> None:
+        rate = self._sample.get(captured.levelname)
+        # Handle unsampled level.
+        if rate is None:
+            super().capture(captured)
+            return
+        # Handle sampled level.
+        name = captured.name if isinstance(captured.name, str) else None
+        key = (captured.levelname, name)
+        try:
+            counter = self._counters[key]
+        except KeyError:
+            counter = self._counters.setdefault(key, itertools.count())
+        n = next(counter)
+        if int((n + 1) * rate) > int(n * rate):
+            super().capture(captured)
+            return
+        # Handle discarded log, still counting it.
+        with self._logot._lock:
+            self._logot._stats.count(captured, 0)
+            self._logot._stats.dropped += 1
+
+
 class _Wait(Generic[W]):
     __slots__ = ("logged", "timeout", "waiter_obj")
 
@@ -351,3 +884,26 @@ class _Wait(Generic[W]):
         self.logged = logged
         self.timeout = timeout
         self.waiter_obj = waiter_obj
+
+
+class _WaitGroup(Generic[W]):
+    __slots__ = ("compose", "timeout", "waiter_obj", "waits", "_lock", "_count")
+
+    def __init__(self, compose: type[_ComposedLogged], *, timeout: float, waiter_obj: W, count: int) -> None:
+        self.compose = compose
+        self.timeout = timeout
+        self.waiter_obj = waiter_obj
+        self.waits: list[tuple[Logot, _Wait[_WaitGroup[W]]]] = []
+        self._lock = allocate_lock()
+        self._count = count
+
+    def release(self) -> None:
+        # Captures for different `Logot` instances can release the group concurrently.
+        with self._lock:
+            self._count -= 1
+            # Only release the shared waiter once.
+            if self._count == 0:
+                self.waiter_obj.release()
+
+    def is_released(self) -> bool:
+        return self._count <= 0
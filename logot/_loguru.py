@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import logging
+import sys
+from _thread import LockType, allocate_lock
 from functools import partial
+from typing import ClassVar
 
 import loguru
 from loguru import logger
 
 from logot._capture import Captured, capture_exc_info
 from logot._logot import Capturer, Logot
+from logot._names import NameFilter
+from logot._route import Router
 from logot._typing import Level, Name
 
 
@@ -17,17 +23,81 @@ class LoguruCapturer(Capturer):
 
     __slots__ = ("_handler_id",)
 
-    def start_capturing(self, logot: Logot, /, *, level: Level, name: Name) -> None:
-        self._handler_id = logger.add(partial(_sink, logot=logot), level=level, filter=name)
+    _name_filter = True
+
+    def start_capturing(self, logot: Logot, /, *, level: Level, name: Name | NameFilter) -> None:
+        # Handle multiple names.
+        if isinstance(name, NameFilter):
+            names = name
+            self._handler_id = logger.add(
+                partial(_sink, logot=logot), level=level, filter=lambda record: names.accepts(record["name"])
+            )
+        # Handle a single name.
+        else:
+            self._handler_id = logger.add(partial(_sink, logot=logot), level=level, filter=name)
 
     def stop_capturing(self) -> None:
         logger.remove(self._handler_id)
 
+    def _is_forwarded(self, captured: Captured) -> bool:
+        return _is_forwarded(captured)
 
-def _sink(msg: loguru.Message, *, logot: Logot) -> None:
-    record = msg.record
+
+class PersistentLoguruCapturer(Capturer):
+    """
+    A :class:`logot.Capturer` implementation for :mod:`loguru` that adds a single sink for the whole session, switching
+    its target :class:`logot.Logot` on each capture.
+
+    Unlike :class:`LoguruCapturer`, sinks are not added and removed for every capture. Records are filtered by level
+    before :mod:`loguru` formats them, and converted once for all capturing :class:`logot.Logot` instances.
+
+    The sink is added at the capture level, and is only re-added if a lower level is later captured. While the sink is
+    installed, :mod:`loguru` handles all logs at or above this level, even when nothing is capturing.
+
+    .. important::
+
+        The sink is *not* removed when capturing stops. Use :meth:`uninstall` to remove it. The :mod:`pytest` plugin
+        does this automatically at the end of the test session.
+
+    :param enqueue: Whether the sink is added with ``enqueue=True``, capturing logs from other processes and
+        asynchronous tasks via a :mod:`loguru` queue. Logs are then captured asynchronously, so use
+        :meth:`logot.Logot.flush` to wait for pending logs.
+    """
+
+    __slots__ = ("_enqueue", "_sink", "_route")
+
+    _name_filter = True
+
+    def __init__(self, *, enqueue: bool = False) -> None:
+        self._enqueue = enqueue
+
+    def start_capturing(self, logot: Logot, /, *, level: Level, name: Name | NameFilter) -> None:
+        levelno = level if isinstance(level, int) else logger.level(level).no
+        self._sink = _PersistentSink.install(enqueue=self._enqueue, levelno=levelno)
+        self._route = self._sink.router.add(logot, levelno=levelno, name=name)
+
+    def stop_capturing(self) -> None:
+        self._sink.router.remove(self._route)
+
+    def _is_forwarded(self, captured: Captured) -> bool:
+        return _is_forwarded(captured)
+
+    def flush(self) -> None:
+        # Wait for loguru to process all enqueued logs.
+        if self._enqueue:
+            logger.complete()
+
+    @staticmethod
+    def uninstall() -> None:
+        """
+        Removes all persistent sinks.
+        """
+        _PersistentSink.uninstall_all()
+
+
+def _capture_record(record: loguru.Record) -> Captured:
     level = record["level"]
-    captured = Captured(
+    return Captured(
         level.name,
         record["message"],
         exc_info=capture_exc_info(record["exception"]),
@@ -35,4 +105,72 @@ def _sink(msg: loguru.Message, *, logot: Logot) -> None:
         name=record["name"],
         record=record,
     )
-    logot.capture(captured)
+
+
+def _is_forwarded(captured: Captured) -> bool:
+    # Loguru forwards logs to `logging` handlers via a standard sink, which creates log records with the loguru `extra`
+    # dict as a record attribute.
+    record = captured.record
+    if not isinstance(record, logging.LogRecord) or "extra" not in record.__dict__:
+        return False
+    # Check that the log record is being handled by a loguru standard sink.
+    frame = sys._getframe()
+    while frame is not None:
+        if frame.f_globals.get("__name__") == "loguru._simple_sinks":
+            return True
+        frame = frame.f_back
+    return False
+
+
+def _sink(msg: loguru.Message, *, logot: Logot) -> None:
+    logot.capture(_capture_record(msg.record))
+
+
+class _PersistentSink:
+    __slots__ = ("router", "_enqueue", "_levelno", "_handler_id")
+
+    _lock: ClassVar[LockType] = allocate_lock()
+    _installed: ClassVar[dict[bool, _PersistentSink]] = {}
+
+    def __init__(self, *, enqueue: bool, levelno: int) -> None:
+        self.router = Router()
+        self._enqueue = enqueue
+        # The sink level is the lowest level captured so far. Loguru skips all logs below the lowest sink level, so
+        # adding the sink at a lower level would slow down logging for the whole session.
+        self._levelno = levelno
+        self._handler_id = self._add()
+
+    @classmethod
+    def install(cls, *, enqueue: bool, levelno: int) -> _PersistentSink:
+        with cls._lock:
+            # Install a new sink.
+            sink = cls._installed.get(enqueue)
+            if sink is None:
+                sink = cls._installed[enqueue] = cls(enqueue=enqueue, levelno=levelno)
+            # Handle a lower level than the sink was added at. Loguru sink levels cannot be changed, so re-add the sink.
+            elif levelno < sink._levelno:
+                logger.remove(sink._handler_id)
+                sink._levelno = levelno
+                sink._handler_id = sink._add()
+            return sink
+
+    @classmethod
+    def uninstall_all(cls) -> None:
+        with cls._lock:
+            for sink in cls._installed.values():
+                logger.remove(sink._handler_id)
+            cls._installed.clear()
+
+    def _add(self) -> int:
+        # Reject records not accepted by any route before they are formatted. Enqueued records may come from other
+        # processes with stale routes, so they are only filtered by the sink.
+        filter_fn = None if self._enqueue else self._filter
+        # Only format the message, since the rest of the record is captured directly.
+        return logger.add(self._sink, level=self._levelno, format="{message}", filter=filter_fn, enqueue=self._enqueue)
+
+    def _filter(self, record: loguru.Record) -> bool:
+        return record["level"].no >= self.router.levelno
+
+    def _sink(self, msg: loguru.Message) -> None:
+        record = msg.record
+        self.router.dispatch(record["level"].no, record["name"], partial(_capture_record, record))
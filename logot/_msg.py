@@ -3,7 +3,7 @@ from __future__ import annotations
 import dataclasses
 import re
 
-from logot._capture import Captured
+from logot._capture import Captured, msg_equals
 from logot._match import AnyMatcher, Matcher
 from logot._typing import Wildcard
 
@@ -45,7 +45,7 @@ class _MessageMatcher(Matcher):
     msg: str
 
     def match(self, captured: Captured) -> bool:
-        return captured.msg == self.msg
+        return msg_equals(captured.msg, self.msg)
 
     def __repr__(self) -> str:
         return repr(self.msg)
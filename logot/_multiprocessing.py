@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import logging
+import marshal
+import os
+import pickle
+import struct
+import warnings
+from _thread import LockType, allocate_lock
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from threading import Thread
+from time import monotonic, sleep
+from typing import Any, ClassVar
+
+from logot._capture import Captured, capture_exc_info, intern_str
+from logot._level import get_levelno
+from logot._logging import _Handler
+from logot._logot import Capturer, Logot
+from logot._typing import Level, Name
+
+# Ring buffer header: total bytes written, total bytes read, closed flag, total records dropped.
+_POSITION = struct.Struct("<Q")
+_WRITTEN_OFFSET = 0
+_READ_OFFSET = 8
+_CLOSED_OFFSET = 16
+_DROPPED_OFFSET = 24
+_HEADER_SIZE = 32
+# Record header: payload length.
+_LENGTH = struct.Struct("<I")
+
+
+class MultiprocessingCapturer(Capturer):
+    """
+    A :class:`logot.Capturer` implementation for :mod:`logging` that also captures logs from child processes.
+
+    Logs from the current process are captured directly. Logs from child processes are written to a
+    :mod:`shared memory <multiprocessing.shared_memory>` ring buffer as compact serialized records, and collected by a
+    background thread in the current process.
+
+    Child processes started with the ``fork`` start method capture logs automatically. For other start methods (e.g.
+    ``spawn`` or ``forkserver``), pass :meth:`initializer` and :meth:`initargs` to your process pool:
+
+    .. code:: python
+
+        executor = ProcessPoolExecutor(
+            initializer=MultiprocessingCapturer.initializer,
+            initargs=MultiprocessingCapturer.initargs(),
+        )
+
+    .. note::
+
+        Log exceptions are only captured from child processes if they can be pickled.
+
+    :param size: The size (in bytes) of the shared memory ring buffer. Child processes block while the ring buffer is
+        full, dropping logs if space does not become available within a second. Logs too large for the ring buffer are
+        also dropped. A :class:`RuntimeWarning` reporting the number of dropped logs is issued when capturing stops.
+    """
+
+    __slots__ = ("_size", "_logot", "_logger", "_handler", "_prev_levelno", "_levelno", "_name", "_ring", "_collector")
+
+    _lock: ClassVar[LockType] = allocate_lock()
+    _active: ClassVar[list[MultiprocessingCapturer]] = []
+
+    def __init__(self, *, size: int = 1 << 20) -> None:
+        self._size = size
+
+    def start_capturing(self, logot: Logot, /, *, level: Level, name: Name) -> None:
+        self._logot = logot
+        self._levelno = get_levelno(level)
+        self._name = name
+        self._ring = _RingBuffer.create(self._size)
+        self._collector = _Collector(self._ring, logot)
+        self._collector.start()
+        logger = self._logger = logging.getLogger(name)
+        # If the logger is less verbose than the handler, force it to the necessary verboseness.
+        self._prev_levelno = logger.level
+        if self._levelno < logger.getEffectiveLevel():
+            logger.setLevel(self._levelno)
+        # Add the handler.
+        handler = self._handler = _Handler(self._levelno, logot)
+        logger.addHandler(handler)
+        with MultiprocessingCapturer._lock:
+            MultiprocessingCapturer._active.append(self)
+
+    def stop_capturing(self) -> None:
+        with MultiprocessingCapturer._lock:
+            MultiprocessingCapturer._active.remove(self)
+        # Remove the handler and restore the previous level.
+        self._logger.removeHandler(self._handler)
+        if self._logger.level != self._prev_levelno:
+            self._logger.setLevel(self._prev_levelno)
+        # Stop child processes writing logs, and collect any remaining logs.
+        self._ring.close()
+        self._collector.stop()
+        dropped = self._ring.dropped
+        self._ring.unlink()
+        # Report logs dropped by child processes, since they can cause confusing assertion failures.
+        if dropped:
+            warnings.warn(
+                f"Dropped {dropped} log(s) from child processes, increase the ring buffer size", RuntimeWarning
+            )
+
+    def flush(self) -> None:
+        self._collector.collect()
+
+    @staticmethod
+    def initializer(*args: Any) -> None:
+        """
+        Starts capturing logs in a child process.
+
+        Pass this as the ``initializer`` of a process pool, along with :meth:`initargs`.
+        """
+        for ring, levelno, name in args:
+            _start_child_capturing(ring, levelno, name)
+
+    @classmethod
+    def initargs(cls) -> tuple[Any, ...]:
+        """
+        Returns the ``initargs`` for :meth:`initializer`, capturing logs for all active captures.
+        """
+        with cls._lock:
+            return tuple((capturer._ring, capturer._levelno, capturer._name) for capturer in cls._active)
+
+    def _after_fork_in_child(self) -> None:
+        # The handler inherited from the parent process would capture logs in a useless copy of the parent `Logot`.
+        # Replace it with a handler writing to the ring buffer.
+        self._logger.removeHandler(self._handler)
+        _start_child_capturing(self._ring, self._levelno, self._name)
+
+
+def _after_fork_in_child() -> None:
+    # Another thread may have held the lock while forking, so replace it.
+    MultiprocessingCapturer._lock = allocate_lock()
+    active = MultiprocessingCapturer._active[:]
+    MultiprocessingCapturer._active.clear()
+    for capturer in active:
+        capturer._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _start_child_capturing(ring: _RingBuffer, levelno: int, name: Name) -> None:
+    logger = logging.getLogger(name)
+    # If the logger is less verbose than the handler, force it to the necessary verboseness.
+    if levelno < logger.getEffectiveLevel():
+        logger.setLevel(levelno)
+    logger.addHandler(_ChildHandler(levelno, ring, logger))
+
+
+def _encode_exc_info(exc_info: BaseException | None) -> bytes | bool | None:
+    # Handle no exception.
+    if exc_info is None:
+        return None
+    # Handle picklable exception.
+    try:
+        return pickle.dumps(exc_info)
+    except Exception:
+        # Handle unpicklable exception.
+        return True
+
+
+def _decode_exc_info(exc_info: bytes | bool | None) -> BaseException | None | Any:
+    # Handle no exception.
+    if exc_info is None:
+        return None
+    # Handle unpicklable exception. This can still be matched with `exc_info=True`.
+    if exc_info is True:
+        return BaseException()
+    # Handle picklable exception.
+    return pickle.loads(exc_info)  # type: ignore[arg-type]
+
+
+class _ChildHandler(logging.Handler):
+    __slots__ = ("_ring", "_logger")
+
+    def __init__(self, levelno: int, ring: _RingBuffer, logger: logging.Logger) -> None:
+        super().__init__(levelno)
+        self._ring = ring
+        # Records can propagate from descendant loggers, so remember the logger this handler is added to.
+        self._logger = logger
+
+    def emit(self, record: logging.LogRecord) -> None:
+        payload = marshal.dumps(
+            (
+                record.levelname,
+                record.getMessage(),
+                record.levelno,
+                record.name,
+                _encode_exc_info(capture_exc_info(record.exc_info)),
+            )
+        )
+        # Stop writing once the parent process has stopped capturing.
+        if not self._ring.write(payload):
+            self._logger.removeHandler(self)
+
+
+class _RingBuffer:
+    __slots__ = ("_shm", "_buf", "_lock", "_capacity")
+
+    def __init__(self, shm: SharedMemory, lock: Any) -> None:
+        self._init(shm, lock)
+
+    def _init(self, shm: SharedMemory, lock: Any) -> None:
+        self._shm = shm
+        self._buf: memoryview = shm.buf  # type: ignore[assignment]
+        self._lock = lock
+        self._capacity = shm.size - _HEADER_SIZE
+
+    @classmethod
+    def create(cls, size: int) -> _RingBuffer:
+        shm = SharedMemory(create=True, size=size + _HEADER_SIZE)
+        # A lock from the `spawn` context can be shared with child processes using any start method.
+        return cls(shm, get_context("spawn").Lock())
+
+    def __getstate__(self) -> tuple[str, Any]:
+        return (self._shm.name, self._lock)
+
+    def __setstate__(self, state: tuple[str, Any]) -> None:
+        name, lock = state
+        # The resource tracker is shared with the creating process, which unlinks the shared memory.
+        self._init(SharedMemory(name=name), lock)
+
+    def write(self, payload: bytes, *, timeout: float = 1.0) -> bool:
+        data = _LENGTH.pack(len(payload)) + payload
+        data_len = len(data)
+        buf = self._buf
+        deadline = monotonic() + timeout
+        with self._lock:
+            while True:
+                # Handle closed.
+                if buf[_CLOSED_OFFSET]:
+                    return False
+                # Drop records that can never fit.
+                if data_len > self._capacity:
+                    self._drop()
+                    return True
+                (written,) = _POSITION.unpack_from(buf, _WRITTEN_OFFSET)
+                (read,) = _POSITION.unpack_from(buf, _READ_OFFSET)
+                # Handle enough free space.
+                if self._capacity - (written - read) >= data_len:
+                    break
+                # Handle full. Wait for the collector to free some space, or drop the record.
+                if monotonic() > deadline:
+                    self._drop()
+                    return True
+                sleep(0.001)
+            self._copy_in(written, data)
+            _POSITION.pack_into(buf, _WRITTEN_OFFSET, written + data_len)
+        return True
+
+    def read(self) -> list[bytes]:
+        buf = self._buf
+        with self._lock:
+            (written,) = _POSITION.unpack_from(buf, _WRITTEN_OFFSET)
+            (read,) = _POSITION.unpack_from(buf, _READ_OFFSET)
+        # Data between the read and write positions is never overwritten, so can be copied without a lock.
+        data = self._copy_out(read, written - read)
+        # Free the space.
+        with self._lock:
+            _POSITION.pack_into(buf, _READ_OFFSET, written)
+        # Split the data into payloads.
+        payloads: list[bytes] = []
+        offset = 0
+        while offset < len(data):
+            (payload_len,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            payloads.append(data[offset : offset + payload_len])
+            offset += payload_len
+        return payloads
+
+    @property
+    def dropped(self) -> int:
+        with self._lock:
+            dropped: int = _POSITION.unpack_from(self._buf, _DROPPED_OFFSET)[0]
+        return dropped
+
+    def close(self) -> None:
+        with self._lock:
+            self._buf[_CLOSED_OFFSET] = 1
+
+    def _drop(self) -> None:
+        # Count dropped records, so the parent process can report them. The caller must hold the lock.
+        (dropped,) = _POSITION.unpack_from(self._buf, _DROPPED_OFFSET)
+        _POSITION.pack_into(self._buf, _DROPPED_OFFSET, dropped + 1)
+
+    def unlink(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def _copy_in(self, position: int, data: bytes) -> None:
+        buf = self._buf
+        start = position % self._capacity
+        head_len = min(len(data), self._capacity - start)
+        # Handle wrapping around the end of the buffer.
+        buf[_HEADER_SIZE + start : _HEADER_SIZE + start + head_len] = data[:head_len]
+        buf[_HEADER_SIZE : _HEADER_SIZE + len(data) - head_len] = data[head_len:]
+
+    def _copy_out(self, position: int, size: int) -> bytes:
+        buf = self._buf
+        start = position % self._capacity
+        head_len = min(size, self._capacity - start)
+        # Handle wrapping around the end of the buffer.
+        head = buf[_HEADER_SIZE + start : _HEADER_SIZE + start + head_len]
+        tail = buf[_HEADER_SIZE : _HEADER_SIZE + size - head_len]
+        return bytes(head) + bytes(tail)
+
+
+class _Collector:
+    __slots__ = ("_ring", "_logot", "_lock", "_stopping", "_thread")
+
+    # How often (in seconds) to collect logs from the ring buffer.
+    _INTERVAL: ClassVar[float] = 0.005
+
+    def __init__(self, ring: _RingBuffer, logot: Logot) -> None:
+        self._ring = ring
+        self._logot = logot
+        self._lock = allocate_lock()
+        self._stopping = False
+        self._thread = Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._thread.join()
+        self.collect()
+
+    def collect(self) -> None:
+        # Only one thread can read the ring buffer at a time.
+        with self._lock:
+            for payload in self._ring.read():
+                levelname, msg, levelno, name, exc_info = marshal.loads(payload)
+                self._logot.capture(
+                    Captured(
+                        intern_str(levelname),
+                        msg,
+                        exc_info=_decode_exc_info(exc_info),
+                        levelno=levelno,
+                        name=intern_str(name),
+                    )
+                )
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self.collect()
+            sleep(self._INTERVAL)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from logot._typing import Name
+
+
+class NameFilter:
+    # Filters logger names by included and excluded logger names. Each logger name also matches its descendants, with
+    # the most specific logger name deciding whether a name is accepted.
+    # Logger names are stored in a trie of name parts, and results are cached for each name, so filtering a log is
+    # usually a single `dict` lookup.
+
+    __slots__ = ("roots", "_include_root", "_trie", "_cache")
+
+    def __init__(self, names: Sequence[Name], exclude: Sequence[str]) -> None:
+        self._include_root = None in names
+        self._trie: dict[Any, Any] = {}
+        for name in names:
+            if name is not None:
+                self._insert(name, True)
+        for name in exclude:
+            self._insert(name, False)
+        # The logger names to capture from, skipping names nested in other captured names.
+        if self._include_root:
+            self.roots: tuple[Name, ...] = (None,)
+        else:
+            self.roots = tuple(
+                sorted(
+                    {
+                        name
+                        for name in names
+                        if name is not None and not any(_is_nested(name, other) for other in names if other != name)
+                    }
+                )
+            )
+        self._cache: dict[Name, bool] = {}
+
+    def accepts(self, name: Name) -> bool:
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+        # Handle uncached name. Logger names are a small, fixed set, so the cache does not need to be bounded.
+        accepted = self._cache[name] = self._match(name)
+        return accepted
+
+    def _insert(self, name: str, include: bool) -> None:
+        node = self._trie
+        for part in name.split("."):
+            node = node.setdefault(part, {})
+        # Name parts are `str`, so a `None` key can mark the decision for this node.
+        node[None] = include
+
+    def _match(self, name: Name) -> bool:
+        accepted = self._include_root
+        # Handle root logger.
+        if name is None:
+            return accepted
+        # Walk the trie, using the decision of the most specific matching node.
+        node = self._trie
+        for part in name.split("."):
+            node = node.get(part)
+            if node is None:
+                break
+            accepted = node.get(None, accepted)
+        return accepted
+
+
+def _is_nested(name: str, other: Name) -> bool:
+    return other is None or name.startswith(f"{other}.")
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+from collections.abc import Callable
+from functools import cache
+from typing import Any, TypeAlias
+
+from logot._capture import Captured, intern_str
+from logot._msg import _CONVERSION_MAP
+from logot._route import Route
+
+# A parser converting a log line into a `Captured` log, or `None` if the line is not a log.
+Parser: TypeAlias = Callable[[str], "Captured | None"]
+
+# Regex matching a `logging` format conversion specifier.
+_RE_FORMAT = re.compile(r"%\((\w+)\)([#0+ \-]*\d*(?:\.\d+)?)([diouxXeEfFgGcrsa])|%%")
+
+# Regex matchers for known `logging` format fields.
+_FORMAT_FIELDS = {
+    "levelname": r"\w+",
+    "levelno": r"\d+",
+    "name": r".*?",
+    "message": r".*",
+}
+
+
+def line_parser(format: str, *, json: bool) -> Parser:
+    return parse_json if json else format_parser(format)
+
+
+def capture_line(route: Route, parser: Parser, line: str | bytes) -> None:
+    try:
+        captured = parser(line.decode(errors="replace") if isinstance(line, bytes) else line)
+    except Exception:
+        # Handle unparseable lines as non-log lines, so a single bad line cannot stop a background reader.
+        return
+    # Handle non-log lines.
+    if captured is not None:
+        capture_routed(route, captured)
+
+
+def capture_routed(route: Route, captured: Captured) -> None:
+    # Handle logs not accepted by the route. Logs without a known level are always accepted by level.
+    levelno = captured.levelno if isinstance(captured.levelno, int) else route.levelno
+    if route.accepts(levelno, captured.name if isinstance(captured.name, str) else None):
+        route.logot.capture(captured)
+
+
+def _captured(levelname: str, msg: str, levelno: Any, name: Any, record: Any) -> Captured | None:
+    # Handle unknown level number.
+    if levelno is None:
+        levelno = logging.getLevelName(levelname)
+        if not isinstance(levelno, int):
+            levelno = ...
+    else:
+        try:
+            levelno = int(levelno)
+        except (TypeError, ValueError, OverflowError):
+            # Handle invalid level number, treating the line as a non-log line.
+            return None
+    return Captured(intern_str(levelname), msg, levelno=levelno, name=intern_str(name), record=record)
+
+
+@cache
+def format_parser(format: str) -> Parser:
+    # Compile the format into a regex once, so each line is parsed with a single match.
+    parts: list[str] = []
+    fields: set[str] = set()
+    pos = 0
+    for match in _RE_FORMAT.finditer(format):
+        parts.append(re.escape(format[pos : match.start()]))
+        pos = match.end()
+        field, flags, conversion = match.groups()
+        # Handle percent conversion.
+        if field is None:
+            parts.append("%")
+            continue
+        # Handle known fields, capturing them in named groups.
+        if field in _FORMAT_FIELDS and field not in fields:
+            fields.add(field)
+            group = f"(?P<{field}>{_FORMAT_FIELDS[field]})"
+        # Handle other fields.
+        else:
+            group = f"(?:{_CONVERSION_MAP[conversion]})"
+        # Fields may be padded to a minimum width.
+        parts.append(f" *{group} *" if flags else group)
+    parts.append(re.escape(format[pos:]))
+    # Handle missing required fields.
+    for field in ("levelname", "message"):
+        if field not in fields:
+            raise ValueError(f"Missing %({field})s in format: {format!r}")
+    fullmatch = re.compile("".join(parts)).fullmatch
+
+    def parse(line: str) -> Captured | None:
+        match = fullmatch(line.rstrip("\r\n"))
+        # Handle non-log lines.
+        if match is None:
+            return None
+        record = match.groupdict()
+        return _captured(
+            record["levelname"],
+            record["message"],
+            record.get("levelno"),
+            record.get("name"),
+            record,
+        )
+
+    return parse
+
+
+def parse_json(line: str) -> Captured | None:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        # Handle non-JSON lines.
+        return None
+    # Handle non-log JSON lines.
+    if not isinstance(record, dict):
+        return None
+    msg = record.get("message", record.get("msg", record.get("event")))
+    if msg is None:
+        return None
+    return _captured(
+        str(record.get("levelname", record.get("level", "LOG"))).upper(),
+        str(msg),
+        record.get("levelno"),
+        record.get("name", record.get("logger")),
+        record,
+    )
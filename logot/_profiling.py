@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import dataclasses
+from _thread import allocate_lock
+from time import perf_counter
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from logot._capture import Captured
+from logot._match import Matcher
+
+if TYPE_CHECKING:  # pragma: no cover
+    from logot._logged import Logged, _MatcherLogged
+
+# The active reduction profilers. This is checked on every log pattern reduction, so it is kept as a module-level
+# `tuple` that is cheap to test and safe to read from any thread.
+active: tuple[ReductionProfiler, ...] = ()
+_active_lock = allocate_lock()
+
+
+@dataclasses.dataclass(frozen=True)
+class ProfileStats:
+    """
+    Profiling statistics for a matcher or log pattern, combined for all equal matchers or log patterns.
+    """
+
+    label: str
+    """
+    A description of the matcher or log pattern.
+    """
+
+    calls: int
+    """
+    The number of captured logs tested.
+    """
+
+    hits: int
+    """
+    The number of captured logs that matched.
+    """
+
+    seconds: float
+    """
+    The total time (in seconds) spent testing captured logs.
+    """
+
+
+@dataclasses.dataclass(frozen=True)
+class LoggingProfileStats:
+    """
+    Profiling statistics for :mod:`logging` records with the same logger name and level.
+    """
+
+    name: str
+    """
+    The logger name.
+    """
+
+    levelname: str
+    """
+    The level name.
+    """
+
+    records: int
+    """
+    The number of records handled.
+    """
+
+    seconds: float
+    """
+    The total time (in seconds) spent handling records.
+    """
+
+
+class ReductionProfiler:
+    """
+    Profiles the time spent matching captured logs against :doc:`log patterns </log-pattern-matching>`.
+
+    Use as a context manager. While active, every :class:`logot.Matcher` call is counted and timed, including
+    message pattern regex evaluation and custom ``*matchers``. Time is also recorded for each log pattern from
+    :mod:`logot.logged`.
+
+    .. note::
+
+        Profiling adds overhead to every log pattern reduction, so only enable it while investigating slow tests.
+    """
+
+    __slots__ = ("_lock", "_matchers", "_patterns")
+
+    def __init__(self) -> None:
+        self._lock = allocate_lock()
+        # Stats keyed by label, so equal matchers and log patterns share stats without keeping them alive.
+        self._matchers: dict[str, _Stats] = {}
+        self._patterns: dict[str, _Stats] = {}
+
+    def __enter__(self) -> ReductionProfiler:
+        global active
+        with _active_lock:
+            active = (*active, self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        global active
+        with _active_lock:
+            active = tuple(profiler for profiler in active if profiler is not self)
+
+    @property
+    def matchers(self) -> list[ProfileStats]:
+        """
+        Profiling statistics for each matcher, sorted by total time (most expensive first).
+        """
+        return self._stats(self._matchers)
+
+    @property
+    def patterns(self) -> list[ProfileStats]:
+        """
+        Profiling statistics for each log pattern, sorted by total time (most expensive first).
+        """
+        return self._stats(self._patterns)
+
+    def report(self, *, limit: int = 20) -> str:
+        """
+        Returns a report of the most expensive log patterns and matchers.
+
+        :param limit: The maximum number of log patterns and matchers to include.
+        """
+        return "\n".join(
+            (
+                *_report("Log patterns", self.patterns[:limit]),
+                "",
+                *_report("Matchers", self.matchers[:limit]),
+            )
+        )
+
+    def _stats(self, stats: dict[str, _Stats]) -> list[ProfileStats]:
+        with self._lock:
+            profile_stats = [
+                ProfileStats(label=label, calls=entry.calls, hits=entry.hits, seconds=entry.seconds)
+                for label, entry in stats.items()
+            ]
+        return sorted(profile_stats, key=lambda entry: entry.seconds, reverse=True)
+
+    def _record(self, stats: dict[str, _Stats], obj: Any, hit: bool, seconds: float) -> None:
+        label = _label(obj)
+        with self._lock:
+            try:
+                entry = stats[label]
+            except KeyError:
+                entry = stats[label] = _Stats()
+            entry.calls += 1
+            entry.hits += hit
+            entry.seconds += seconds
+
+
+class _Stats:
+    __slots__ = ("calls", "hits", "seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.hits = 0
+        self.seconds = 0.0
+
+
+def profile_reduce(logged: _MatcherLogged, captured: Captured) -> Logged | None:
+    # Profiled version of `_MatcherLogged.reduce()`, timing each matcher.
+    profilers = active
+    logged_start = perf_counter()
+    hit = True
+    for matcher in logged.matchers:
+        start = perf_counter()
+        matcher_hit = matcher.match(captured)
+        seconds = perf_counter() - start
+        for profiler in profilers:
+            profiler._record(profiler._matchers, matcher, matcher_hit, seconds)
+        # Stop at the first non-matching matcher, like `_MatcherLogged.reduce()`.
+        if not matcher_hit:
+            hit = False
+            break
+    seconds = perf_counter() - logged_start
+    for profiler in profilers:
+        profiler._record(profiler._patterns, logged, hit, seconds)
+    return None if hit else logged
+
+
+def _label(obj: Any) -> str:
+    # Handle matcher.
+    if isinstance(obj, Matcher):
+        return f"{type(obj).__name__.lstrip('_')} {obj!r}"
+    # Handle log pattern.
+    return str(obj)
+
+
+def _report(title: str, stats: list[ProfileStats]) -> list[str]:
+    return [
+        f"{title}:",
+        f"{'calls':>10} {'hits':>10} {'total (ms)':>12} {'per call (us)':>14}  {title[:-1].lower()}",
+        *(
+            f"{entry.calls:>10} {entry.hits:>10} {entry.seconds * 1e3:>12.3f} "
+            f"{entry.seconds / entry.calls * 1e6:>14.3f}  {entry.label}"
+            for entry in stats
+        ),
+    ]
@@ -1,15 +1,56 @@
 from __future__ import annotations
 
-from collections.abc import Generator
-from typing import Callable
+import logging
+import sys
+from collections.abc import Generator, Iterable
+from contextlib import AbstractContextManager, nullcontext
+from typing import Callable, cast
 
 import pytest
 
 from logot._import import import_any_parsed
+from logot._level import get_levelno
+from logot._logging import LoggingProfiler
 from logot._logot import Capturer, Logot
-from logot._typing import Level, Name, T, Wildcard
+from logot._profiling import ReductionProfiler
+from logot._typing import ExcInfoRetention, Level, Name, RecordRetention, T, Wildcard
+from logot._validate import (
+    validate_exc_info_retention,
+    validate_max_buffered,
+    validate_max_msg_len,
+    validate_record_retention,
+)
 from logot._wait import AsyncWaiter
 
+# Cache key for log levels learned by `--logot-adaptive-level`.
+_ADAPTIVE_LEVELS_CACHE_KEY = "logot/adaptive_levels"
+# Log levels learned by `--logot-adaptive-level`, keyed by test node ID.
+_ADAPTIVE_LEVELS = pytest.StashKey[dict[str, int]]()
+# Log levels chosen by `--logot-adaptive-level`, keyed by test node ID.
+_ADAPTIVE_LEVELS_CHOSEN = pytest.StashKey[dict[str, Level]]()
+# The session profiler used by `--logot-profile-reduction`.
+_REDUCTION_PROFILER = pytest.StashKey[ReductionProfiler]()
+# The session profiler used by the `logot_profile` fixture.
+_LOGGING_PROFILER = pytest.StashKey[LoggingProfiler]()
+# Captured log memory used by each test, as `(records, bytes)`, keyed by test node ID.
+_CAPTURE_MEMORY = pytest.StashKey[dict[str, tuple[int, int]]]()
+# The number of tests to report by `--logot-capture-report`.
+_CAPTURE_REPORT = pytest.StashKey[int]()
+# Logs captured and consumed by the `logot` fixture, as `[captured, consumed]`, keyed by `(level name, logger name)`.
+_USAGE = pytest.StashKey[dict[tuple[str, Name], list[int]]]()
+# The most verbose log level required by log patterns in any test, for `--logot-usage-report`.
+_USAGE_LEVELNO = pytest.StashKey[int]()
+# The `(level, name)` used for automatic log capturing, for `--logot-usage-report`.
+_USAGE_CONFIG = pytest.StashKey[tuple[Level, Name]]()
+# The maximum number of loggers and levels shown by `--logot-usage-report`.
+_USAGE_REPORT_LIMIT = 20
+# Persistent capturers to uninstall at the end of the test session, as `(module name, class name)`.
+_PERSISTENT_CAPTURERS = (
+    ("logot._logging", "PersistentLoggingCapturer"),
+    ("logot._loguru", "PersistentLoguruCapturer"),
+    ("logot._structlog", "PersistentStructlogCapturer"),
+)
+
 
 def pytest_addoption(parser: pytest.Parser, pluginmanager: pytest.PytestPluginManager) -> None:
     group = parser.getgroup("logot")
@@ -43,22 +84,160 @@ def pytest_addoption(parser: pytest.Parser, pluginmanager: pytest.PytestPluginMa
         name="async_waiter",
         help="The default `async_waiter` for the `logot` fixture",
     )
+    _add_option(
+        parser,
+        group,
+        name="record_retention",
+        help="The default `record_retention` for the `logot` fixture",
+    )
+    _add_option(
+        parser,
+        group,
+        name="exc_info_retention",
+        help="The default `exc_info_retention` for the `logot` fixture",
+    )
+    _add_option(
+        parser,
+        group,
+        name="max_msg_len",
+        help="The default `max_msg_len` for the `logot` fixture",
+    )
+    _add_option(
+        parser,
+        group,
+        name="max_buffered",
+        help="The default `max_buffered` for the `logot` fixture",
+    )
+    _add_option(
+        parser,
+        group,
+        name="adaptive_level",
+        help="Learn the `level` used for automatic `logot` log capturing from the log patterns used by each test",
+    )
+    _add_option(
+        parser,
+        group,
+        name="capture_report",
+        help="The number of tests using the most captured log memory to report",
+    )
+    _add_option(
+        parser,
+        group,
+        name="max_capture_bytes",
+        help="Fail tests where the `logot` fixture captured logs using more memory (in bytes)",
+    )
+    _add_option(
+        parser,
+        group,
+        name="usage_report",
+        help="Report logs captured by the `logot` fixture but never matched against log patterns",
+    )
+    _add_option(
+        parser,
+        group,
+        name="profile_reduction",
+        help="Profile log pattern matching in the `logot` fixture, reporting the most expensive log patterns",
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    # Uninstall persistent capturers. Only capturers that were imported can have been installed.
+    for module_name, capturer_name in _PERSISTENT_CAPTURERS:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            getattr(module, capturer_name).uninstall()
+    # Persist log levels learned by `--logot-adaptive-level`.
+    levels = session.config.stash.get(_ADAPTIVE_LEVELS, None)
+    cache = getattr(session.config, "cache", None)
+    if levels is not None and cache is not None:
+        cache.set(_ADAPTIVE_LEVELS_CACHE_KEY, levels)
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    # Report log levels chosen by `--logot-adaptive-level`.
+    chosen = config.stash.get(_ADAPTIVE_LEVELS_CHOSEN, None)
+    if chosen:
+        terminalreporter.section("logot adaptive levels")
+        for nodeid, level in chosen.items():
+            terminalreporter.write_line(f"{_format_level(level)} {nodeid}")
+    # Report the tests using the most captured log memory.
+    memory = config.stash.get(_CAPTURE_MEMORY, None)
+    limit = config.stash.get(_CAPTURE_REPORT, 0)
+    if memory and limit:
+        terminalreporter.section("logot capture memory")
+        for nodeid, (records, size) in sorted(memory.items(), key=lambda item: item[1][1], reverse=True)[:limit]:
+            terminalreporter.write_line(f"{size:>12} bytes {records:>8} records  {nodeid}")
+    # Report logs captured but never matched against log patterns.
+    usage = config.stash.get(_USAGE, None)
+    if usage is not None:
+        terminalreporter.section("logot capture usage")
+        for line in _usage_report(config, usage):
+            terminalreporter.write_line(line)
+    # Report log patterns profiled by `--logot-profile-reduction`.
+    profiler = config.stash.get(_REDUCTION_PROFILER, None)
+    if profiler is not None:
+        terminalreporter.section("logot reduction profile")
+        terminalreporter.write_line(profiler.report())
+    # Report logs profiled by the `logot_profile` fixture.
+    logging_profiler = config.stash.get(_LOGGING_PROFILER, None)
+    if logging_profiler is not None:
+        terminalreporter.section("logot logging profile")
+        terminalreporter.write_line(logging_profiler.report())
 
 
 @pytest.fixture()
 def logot(
+    request: pytest.FixtureRequest,
     logot_level: Level,
     logot_name: Name,
     logot_capturer: Callable[[], Capturer],
     logot_timeout: float,
     logot_async_waiter: Callable[[], AsyncWaiter],
+    logot_record_retention: RecordRetention,
+    logot_exc_info_retention: ExcInfoRetention,
+    logot_max_msg_len: int | None,
+    logot_max_buffered: int | None,
+    logot_adaptive_level: bool,
+    logot_profile_reduction: bool,
+    logot_capture_report: int,
+    logot_max_capture_bytes: int | None,
+    logot_usage_report: bool,
 ) -> Generator[Logot, None, None]:
     """
     An initialized `logot.Logot` instance with log capturing enabled.
     """
-    logot = Logot(capturer=logot_capturer, timeout=logot_timeout, async_waiter=logot_async_waiter)
-    with logot.capturing(level=logot_level, name=logot_name):
+    logot = Logot(
+        capturer=logot_capturer,
+        timeout=logot_timeout,
+        async_waiter=logot_async_waiter,
+        record_retention=logot_record_retention,
+        exc_info_retention=logot_exc_info_retention,
+        max_msg_len=logot_max_msg_len,
+        max_buffered=logot_max_buffered,
+        # Only measure captured log memory if it is reported or limited.
+        measure_bytes=bool(logot_capture_report) or logot_max_capture_bytes is not None,
+    )
+    level = _adaptive_level(request, logot_level) if logot_adaptive_level else logot_level
+    profiler: AbstractContextManager[object] = (
+        _get_reduction_profiler(request.config) if logot_profile_reduction else nullcontext()
+    )
+    with profiler, logot.capturing(level=level, name=logot_name):
         yield logot
+    if logot_usage_report:
+        _record_usage(request, logot, logot_level, logot_name)
+    if logot_capture_report or logot_max_capture_bytes is not None:
+        _check_capture_memory(request, logot, logot_capture_report, logot_max_capture_bytes)
+    if logot_adaptive_level:
+        _learn_adaptive_level(request, logot, level)
+
+
+@pytest.fixture()
+def logot_profile(request: pytest.FixtureRequest) -> Generator[LoggingProfiler, None, None]:
+    """
+    A `logot.profiling.LoggingProfiler` measuring the time spent handling logs in the test.
+    """
+    with _get_logging_profiler(request.config), LoggingProfiler() as profiler:
+        yield profiler
 
 
 @pytest.fixture(scope="session")
@@ -101,6 +280,88 @@ def logot_async_waiter(request: pytest.FixtureRequest) -> Callable[[], AsyncWait
     return _get_option(request, name="async_waiter", parser=import_any_parsed, default=Logot.DEFAULT_ASYNC_WAITER)
 
 
+@pytest.fixture(scope="session")
+def logot_record_retention(request: pytest.FixtureRequest) -> RecordRetention:
+    """
+    The default `record_retention` for the `logot` fixture.
+    """
+    return _get_option(
+        request,
+        name="record_retention",
+        parser=_parse_record_retention,
+        default=Logot.DEFAULT_RECORD_RETENTION,
+    )
+
+
+@pytest.fixture(scope="session")
+def logot_exc_info_retention(request: pytest.FixtureRequest) -> ExcInfoRetention:
+    """
+    The default `exc_info_retention` for the `logot` fixture.
+    """
+    return _get_option(
+        request,
+        name="exc_info_retention",
+        parser=_parse_exc_info_retention,
+        default=Logot.DEFAULT_EXC_INFO_RETENTION,
+    )
+
+
+@pytest.fixture(scope="session")
+def logot_max_msg_len(request: pytest.FixtureRequest) -> int | None:
+    """
+    The default `max_msg_len` for the `logot` fixture.
+    """
+    return _get_option(request, name="max_msg_len", parser=_parse_max_msg_len, default=Logot.DEFAULT_MAX_MSG_LEN)
+
+
+@pytest.fixture(scope="session")
+def logot_max_buffered(request: pytest.FixtureRequest) -> int | None:
+    """
+    The default `max_buffered` for the `logot` fixture.
+    """
+    return _get_option(request, name="max_buffered", parser=_parse_max_buffered, default=Logot.DEFAULT_MAX_BUFFERED)
+
+
+@pytest.fixture(scope="session")
+def logot_adaptive_level(request: pytest.FixtureRequest) -> bool:
+    """
+    Whether to learn the `level` used for automatic log capturing from the log patterns used by each test.
+    """
+    return _get_option(request, name="adaptive_level", parser=_parse_bool, default=False)
+
+
+@pytest.fixture(scope="session")
+def logot_capture_report(request: pytest.FixtureRequest) -> int:
+    """
+    The number of tests using the most captured log memory to report.
+    """
+    return _get_option(request, name="capture_report", parser=_parse_capture_report, default=0)
+
+
+@pytest.fixture(scope="session")
+def logot_max_capture_bytes(request: pytest.FixtureRequest) -> int | None:
+    """
+    Fail tests where the `logot` fixture captured logs using more memory (in bytes).
+    """
+    return _get_option(request, name="max_capture_bytes", parser=_parse_max_capture_bytes, default=None)
+
+
+@pytest.fixture(scope="session")
+def logot_usage_report(request: pytest.FixtureRequest) -> bool:
+    """
+    Whether to report logs captured by the `logot` fixture but never matched against log patterns.
+    """
+    return _get_option(request, name="usage_report", parser=_parse_bool, default=False)
+
+
+@pytest.fixture(scope="session")
+def logot_profile_reduction(request: pytest.FixtureRequest) -> bool:
+    """
+    Whether to profile log pattern matching in the `logot` fixture.
+    """
+    return _get_option(request, name="profile_reduction", parser=_parse_bool, default=False)
+
+
 def get_qualname(name: str) -> str:
     return f"logot_{name}"
 
@@ -135,3 +396,199 @@ def _get_option(request: pytest.FixtureRequest, *, name: str, parser: Callable[[
         return parser(value)
     except Exception as ex:
         raise pytest.UsageError(f"Invalid {qualname}: {ex}") from ex
+
+
+def _parse_bool(value: str) -> bool:
+    value = value.lower()
+    if value in ("true", "yes", "1"):
+        return True
+    if value in ("false", "no", "0"):
+        return False
+    raise ValueError(f"Invalid bool: {value!r}")
+
+
+def _parse_record_retention(value: str) -> RecordRetention:
+    return validate_record_retention(cast(RecordRetention, value))
+
+
+def _parse_exc_info_retention(value: str) -> ExcInfoRetention:
+    return validate_exc_info_retention(cast(ExcInfoRetention, value))
+
+
+def _parse_max_msg_len(value: str) -> int | None:
+    return validate_max_msg_len(int(value))
+
+
+def _parse_max_buffered(value: str) -> int | None:
+    return validate_max_buffered(int(value))
+
+
+def _parse_capture_report(value: str) -> int:
+    limit = int(value)
+    if limit < 0:
+        raise ValueError(f"Invalid capture_report: {limit!r}")
+    return limit
+
+
+def _parse_max_capture_bytes(value: str) -> int:
+    max_capture_bytes = int(value)
+    if max_capture_bytes < 1:
+        raise ValueError(f"Invalid max_capture_bytes: {max_capture_bytes!r}")
+    return max_capture_bytes
+
+
+def _format_level(level: Level) -> str:
+    # Prefer level names in reports.
+    return logging.getLevelName(level) if isinstance(level, int) else level
+
+
+def _check_capture_memory(
+    request: pytest.FixtureRequest, logot: Logot, limit: int, max_capture_bytes: int | None
+) -> None:
+    stats = logot.stats()
+    records = sum(stats.levels.values()) - stats.dropped
+    # Record the captured log memory for the terminal summary.
+    if limit:
+        request.config.stash[_CAPTURE_REPORT] = limit
+        request.config.stash.setdefault(_CAPTURE_MEMORY, {})[request.node.nodeid] = (records, stats.captured_bytes)
+    # Fail if the captured logs used too much memory.
+    if max_capture_bytes is not None and stats.captured_bytes > max_capture_bytes:
+        pytest.fail(
+            f"logot captured {records} logs using {stats.captured_bytes} bytes, "
+            f"exceeding --logot-max-capture-bytes={max_capture_bytes}",
+            pytrace=False,
+        )
+
+
+def _record_usage(request: pytest.FixtureRequest, logot: Logot, level: Level, name: Name) -> None:
+    stash = request.config.stash
+    stash[_USAGE_CONFIG] = (level, name)
+    # Aggregate the logs captured and consumed.
+    usage = stash.setdefault(_USAGE, {})
+    for key, (captured, consumed) in logot._usage().items():
+        counts = usage.setdefault(key, [0, 0])
+        counts[0] += captured
+        counts[1] += consumed
+    # Track the most verbose log level required by log patterns.
+    levelno = logot._reduced_levelno
+    if levelno is not None and levelno < stash.get(_USAGE_LEVELNO, logging.CRITICAL + 1):
+        stash[_USAGE_LEVELNO] = levelno
+
+
+def _usage_report(config: pytest.Config, usage: dict[tuple[str, Name], list[int]]) -> list[str]:
+    captured_total = sum(captured for captured, _ in usage.values())
+    unused_total = sum(captured - consumed for captured, consumed in usage.values())
+    lines = [
+        f"{unused_total} of {captured_total} captured logs were never matched against a log pattern.",
+        "",
+        f"{'captured':>10} {'consumed':>10} {'unused':>7}  {'level':<8} logger",
+    ]
+    # Show the loggers and levels with the most unused logs.
+    for (levelname, name), (captured, consumed) in sorted(
+        usage.items(), key=lambda item: item[1][0] - item[1][1], reverse=True
+    )[:_USAGE_REPORT_LIMIT]:
+        lines.append(
+            f"{captured:>10} {consumed:>10} {(captured - consumed) / captured:>7.1%}  {levelname:<8} "
+            f"{'root' if name is None else name}"
+        )
+    # Suggest narrower settings.
+    level, name = config.stash[_USAGE_CONFIG]
+    suggestions: list[str] = []
+    levelno = config.stash.get(_USAGE_LEVELNO, None)
+    try:
+        if levelno is not None and levelno > get_levelno(level):
+            suggestions.append(f"{get_optname('level')}={_format_level(levelno)}")
+    except ValueError:
+        # Unknown level names cannot be compared.
+        pass
+    consumed_name = _common_name(name for (_, name), (_, consumed) in usage.items() if consumed)
+    if consumed_name is not None and (name is None or consumed_name.startswith(f"{name}.")):
+        suggestions.append(f"{get_optname('name')}={consumed_name}")
+    if suggestions:
+        lines.extend(("", f"Suggested settings: {' '.join(suggestions)}"))
+    return lines
+
+
+def _common_name(names: Iterable[Name]) -> Name:
+    # The most specific common ancestor of the given logger names, or `None` for the root logger.
+    common: list[str] | None = None
+    for name in names:
+        # Handle root logger.
+        if name is None:
+            return None
+        parts = name.split(".")
+        if common is None:
+            common = parts
+            continue
+        # Keep the longest shared prefix.
+        n = 0
+        while n < len(common) and n < len(parts) and common[n] == parts[n]:
+            n += 1
+        del common[n:]
+    return ".".join(common) if common else None
+
+
+def _get_reduction_profiler(config: pytest.Config) -> ReductionProfiler:
+    # A single profiler is shared by all tests in the session.
+    try:
+        return config.stash[_REDUCTION_PROFILER]
+    except KeyError:
+        profiler = config.stash[_REDUCTION_PROFILER] = ReductionProfiler()
+        return profiler
+
+
+def _get_logging_profiler(config: pytest.Config) -> LoggingProfiler:
+    # A single profiler is shared by all tests in the session, and reported at the end of the run.
+    try:
+        return config.stash[_LOGGING_PROFILER]
+    except KeyError:
+        profiler = config.stash[_LOGGING_PROFILER] = LoggingProfiler()
+        return profiler
+
+
+def _get_adaptive_levels(config: pytest.Config) -> dict[str, int]:
+    # Load the learned log levels from the previous run. Without a cache, nothing can be learned between runs.
+    try:
+        return config.stash[_ADAPTIVE_LEVELS]
+    except KeyError:
+        cache = getattr(config, "cache", None)
+        levels: dict[str, int] = {} if cache is None else cache.get(_ADAPTIVE_LEVELS_CACHE_KEY, {})
+        config.stash[_ADAPTIVE_LEVELS] = levels
+        config.stash[_ADAPTIVE_LEVELS_CHOSEN] = {}
+        return levels
+
+
+def _adaptive_level(request: pytest.FixtureRequest, level: Level) -> Level:
+    levels = _get_adaptive_levels(request.config)
+    learned_levelno = levels.get(request.node.nodeid)
+    # Only ever make the capture level *less* verbose than the configured level.
+    try:
+        if learned_levelno is not None and learned_levelno > get_levelno(level):
+            level = learned_levelno
+    except ValueError:
+        # Unknown level names cannot be compared, so use the configured level.
+        pass
+    request.config.stash[_ADAPTIVE_LEVELS_CHOSEN][request.node.nodeid] = level
+    return level
+
+
+def _learn_adaptive_level(request: pytest.FixtureRequest, logot: Logot, level: Level) -> None:
+    # Learn the minimum log level required by the log patterns used in this test.
+    # If no log patterns were used, only capture the most severe logs.
+    levelno = logot._reduced_levelno
+    if levelno is None:
+        levelno = logging.CRITICAL
+    request.config.stash[_ADAPTIVE_LEVELS][request.node.nodeid] = levelno
+    # Fail if the log patterns needed more verbose logs than were captured. Their results cannot be trusted (e.g. an
+    # `assert_not_logged` would always pass) until the test is run again with the newly-learned level.
+    try:
+        captured_levelno = get_levelno(level)
+    except ValueError:
+        return
+    if levelno < captured_levelno:
+        pytest.fail(
+            f"logot captured logs at level {_format_level(level)}, "
+            f"but log patterns required level {_format_level(levelno)}. "
+            "Re-run the test to use the learned level.",
+            pytrace=False,
+        )
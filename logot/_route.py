@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import sys
+from _thread import allocate_lock
+from typing import TYPE_CHECKING, Callable
+
+from logot._names import NameFilter
+from logot._scope import Scope
+from logot._typing import Name
+
+if TYPE_CHECKING:  # pragma: no cover
+    from logot._capture import Captured
+    from logot._logot import Logot
+
+
+class Route:
+    __slots__ = ("logot", "levelno", "name", "scope", "_prefix")
+
+    def __init__(
+        self, logot: Logot, *, levelno: int, name: Name | NameFilter = None, scope: Scope | None = None
+    ) -> None:
+        self.logot = logot
+        self.levelno = levelno
+        self.name = name
+        self.scope = scope
+        # Precompute the name prefix, avoiding string formatting on the capture path.
+        self._prefix = f"{name}."
+
+    def accepts(self, levelno: int, name: Name) -> bool:
+        # Handle level.
+        if levelno < self.levelno:
+            return False
+        # Handle scope. This must be called in the execution context that emitted the log.
+        if self.scope is not None and not self.scope.is_active():
+            return False
+        # Handle root logger.
+        if self.name is None:
+            return True
+        # Handle multiple names.
+        if isinstance(self.name, NameFilter):
+            return self.name.accepts(name)
+        # Handle exact or prefix name.
+        return name is not None and (name == self.name or name.startswith(self._prefix))
+
+
+class Router:
+    # Routes logs from a single persistent capture hook to the currently capturing `Logot` instances.
+    # Routes are stored in an immutable `tuple` that is replaced on every change, so the capture path can read them
+    # without taking a lock.
+
+    __slots__ = ("_lock", "routes", "levelno")
+
+    def __init__(self) -> None:
+        self._lock = allocate_lock()
+        self.routes: tuple[Route, ...] = ()
+        # The minimum level accepted by any route, allowing a fast early exit on the capture path.
+        self.levelno = sys.maxsize
+
+    def add(self, logot: Logot, *, levelno: int, name: Name | NameFilter = None, scope: Scope | None = None) -> Route:
+        route = Route(logot, levelno=levelno, name=name, scope=scope)
+        with self._lock:
+            self._set_routes((*self.routes, route))
+        return route
+
+    def remove(self, route: Route) -> None:
+        with self._lock:
+            self._set_routes(tuple(r for r in self.routes if r is not route))
+
+    def dispatch(self, levelno: int, name: Name, convert: Callable[[], Captured]) -> None:
+        # Sends a log to every accepting route. The log is only converted once, and only if at least one `Logot` is
+        # capturing it. Capture hooks are expected to skip logs below `levelno` before calling this.
+        captured = None
+        for route in self.routes:
+            if route.accepts(levelno, name):
+                if captured is None:
+                    captured = convert()
+                route.logot.capture(captured)
+
+    def _set_routes(self, routes: tuple[Route, ...]) -> None:
+        levelno = min((route.levelno for route in routes), default=sys.maxsize)
+        # Never let a concurrent capture see the new routes with a stale (higher) minimum level.
+        self.levelno = min(self.levelno, levelno)
+        self.routes = routes
+        self.levelno = levelno
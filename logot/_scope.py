@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+
+# The scopes active in the current execution context. Threads and tasks started with a copy of the current context
+# (e.g. `asyncio` tasks) inherit the active scopes.
+_SCOPES: ContextVar[frozenset[Scope]] = ContextVar("logot_scopes", default=frozenset())
+
+
+class Scope:
+    # Limits capturing to logs emitted in the execution context where the scope was entered. This isolates concurrent
+    # tests running in the same process.
+
+    __slots__ = ()
+
+    def enter(self) -> None:
+        _SCOPES.set(_SCOPES.get() | {self})
+
+    def exit(self) -> None:
+        # Remove the scope rather than resetting a token, since capturing may stop in a different context.
+        _SCOPES.set(_SCOPES.get() - {self})
+
+    def is_active(self) -> bool:
+        return self in _SCOPES.get()
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import io
+import logging
+import pickle
+import selectors
+import socket
+import struct
+from collections import deque
+from collections.abc import Callable
+from threading import Event, Thread
+from typing import Any
+
+from logot._capture import Captured, intern_str
+from logot._level import get_levelno
+from logot._logging import _capture_record
+from logot._logot import Capturer, Logot
+from logot._names import NameFilter
+from logot._parse import capture_routed, parse_json
+from logot._route import Route
+from logot._typing import Level, Name
+
+# Frame header used by `logging.handlers.SocketHandler` and `logging.handlers.DatagramHandler`: payload length.
+_LENGTH = struct.Struct(">L")
+
+# How much data (in bytes) to receive from a socket at a time.
+_CHUNK_SIZE = 1 << 16
+
+# How long (in seconds) the sockets must be idle before a flush is done.
+_FLUSH_INTERVAL = 0.001
+
+# The maximum time (in seconds) to wait for a flush.
+_FLUSH_TIMEOUT = 1.0
+
+
+class SocketCapturer(Capturer):
+    """
+    A :class:`logot.Capturer` implementation for logs sent over the network by other processes.
+
+    A TCP server and a UDP socket are bound to the same address. They receive records sent by
+    :class:`logging.handlers.SocketHandler` and :class:`logging.handlers.DatagramHandler`, and JSON log lines. All
+    senders are handled by a single background thread.
+
+    .. note::
+
+        Pickled records are unpickled without loading any classes, so untrusted senders cannot run arbitrary code.
+
+    :param host: The host to bind to. Defaults to ``"127.0.0.1"``.
+    :param port: The port to bind to. Defaults to ``0``, binding to a free port. Use :attr:`address` to get the bound
+        address.
+    :param prefix: An optional function returning a logger name prefix for each sender address, allowing logs from
+        different senders to be told apart.
+    :param max_record_size: The maximum size (in bytes) of a received record. Connections sending larger records are
+        closed, bounding the buffered data for each connection.
+    """
+
+    __slots__ = (
+        "_host",
+        "_port",
+        "_prefix",
+        "_max_record_size",
+        "_route",
+        "_selector",
+        "_server",
+        "_datagram",
+        "_wake_r",
+        "_wake_w",
+        "_stopping",
+        "_flushes",
+        "_connections",
+        "_thread",
+        "address",
+    )
+
+    _name_filter = True
+
+    address: tuple[str, int]
+    """
+    The bound ``(host, port)`` address. This is only available while capturing.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        prefix: Callable[[Any], str] | None = None,
+        max_record_size: int = 1 << 20,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._prefix = prefix
+        self._max_record_size = max_record_size
+
+    def start_capturing(self, logot: Logot, /, *, level: Level, name: Name | NameFilter) -> None:
+        self._route = Route(logot, levelno=get_levelno(level), name=name)
+        self._selector = selectors.DefaultSelector()
+        # Bind the TCP server, and then a UDP socket to the same port.
+        self._server = socket.create_server((self._host, self._port))
+        self._server.setblocking(False)
+        self.address = self._server.getsockname()[:2]
+        self._datagram = socket.socket(self._server.family, socket.SOCK_DGRAM)
+        self._datagram.bind(self.address)
+        self._datagram.setblocking(False)
+        # A socket pair is used to wake the background thread.
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._selector.register(self._server, selectors.EVENT_READ, self._accept)
+        self._selector.register(self._datagram, selectors.EVENT_READ, self._receive_datagram)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, self._wake_received)
+        self._stopping = False
+        self._flushes: deque[Event] = deque()
+        self._connections: dict[socket.socket, _Connection] = {}
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop_capturing(self) -> None:
+        self._stopping = True
+        self._wake()
+        self._thread.join()
+        # Close all sockets, including connections.
+        for key in list(self._selector.get_map().values()):
+            key.fileobj.close()  # type: ignore[union-attr]
+        self._selector.close()
+        self._wake_w.close()
+
+    def flush(self) -> None:
+        # Wait for the background thread to handle all data already sent to the sockets.
+        flushed = Event()
+        self._flushes.append(flushed)
+        self._wake()
+        if self._thread.is_alive():  # pragma: no branch
+            flushed.wait(_FLUSH_TIMEOUT)
+
+    def _wake(self) -> None:
+        self._wake_w.send(b"\0")
+
+    def _run(self) -> None:
+        while not self._stopping:
+            # Snapshot pending flushes before checking for data, so they are only marked done once it's handled.
+            # While flushing, poll rather than block, so flushes are done as soon as the sockets are idle.
+            flushes = len(self._flushes)
+            events = self._selector.select(_FLUSH_INTERVAL if flushes else None)
+            for key, _ in events:
+                try:
+                    key.data(key.fileobj)
+                except Exception:
+                    # Handle invalid data, closing the connection. This keeps the background thread handling other
+                    # senders.
+                    if key.fileobj in self._connections:
+                        self._close(key.fileobj)
+            # Handle no more data, marking pending flushes as done. Connections with partially received records are
+            # still sending, so wait for them.
+            if flushes and not events and not any(conn.pending for conn in self._connections.values()):
+                for _ in range(flushes):
+                    self._flushes.popleft().set()
+
+    def _wake_received(self, sock: socket.socket) -> None:
+        sock.recv(_CHUNK_SIZE)
+
+    def _accept(self, server: socket.socket) -> None:
+        conn, address = server.accept()
+        conn.setblocking(False)
+        connection = self._connections[conn] = _Connection(self, address)
+        self._selector.register(conn, selectors.EVENT_READ, connection.receive)
+
+    def _receive_datagram(self, sock: socket.socket) -> None:
+        data, address = sock.recvfrom(_CHUNK_SIZE)
+        # Handle JSON log lines.
+        if data[:1] == b"{":
+            for line in data.splitlines():
+                self._capture(parse_json(line.decode(errors="replace")), address)
+            return
+        # Handle pickled record.
+        self._capture(_unpickle_record(data[_LENGTH.size :]), address)
+
+    def _close(self, conn: socket.socket) -> None:
+        del self._connections[conn]
+        self._selector.unregister(conn)
+        conn.close()
+
+    def _capture(self, captured: Captured | None, address: Any) -> None:
+        # Handle invalid records.
+        if captured is None:
+            return
+        # Add the sender prefix to the logger name.
+        if self._prefix is not None:
+            prefix = self._prefix(address)
+            captured.name = intern_str(f"{prefix}.{captured.name}" if isinstance(captured.name, str) else prefix)
+        capture_routed(self._route, captured)
+
+
+class _Connection:
+    __slots__ = ("_capturer", "_address", "_buffer", "_json")
+
+    def __init__(self, capturer: SocketCapturer, address: Any) -> None:
+        self._capturer = capturer
+        self._address = address
+        self._buffer = b""
+        self._json: bool | None = None
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._buffer)
+
+    def receive(self, conn: socket.socket) -> None:
+        data = conn.recv(_CHUNK_SIZE)
+        # Handle closed connection. A final JSON log line may not end with a newline, so capture it too.
+        if not data:
+            if self._json and self._buffer:
+                self._capturer._capture(parse_json(self._buffer.decode(errors="replace")), self._address)
+            self._capturer._close(conn)
+            return
+        buffer = self._buffer + data
+        # Detect JSON log lines or pickled records from the first byte.
+        if self._json is None:
+            self._json = buffer[:1] == b"{"
+        # Handle JSON log lines.
+        if self._json:
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                self._capturer._capture(parse_json(line.decode(errors="replace")), self._address)
+        # Handle pickled records.
+        else:
+            offset = 0
+            while len(buffer) - offset >= _LENGTH.size:
+                record_start = offset + _LENGTH.size
+                (size,) = _LENGTH.unpack_from(buffer, offset)
+                # Handle too large record.
+                if size > self._capturer._max_record_size:
+                    self._capturer._close(conn)
+                    return
+                # Handle partial record.
+                if len(buffer) < record_start + size:
+                    break
+                offset = record_start + size
+                self._capturer._capture(_unpickle_record(buffer[record_start:offset]), self._address)
+            buffer = buffer[offset:]
+        # Handle too large partial record.
+        if len(buffer) > self._capturer._max_record_size:
+            self._capturer._close(conn)
+            return
+        self._buffer = buffer
+
+
+class _Unpickler(pickle.Unpickler):
+    # Records are pickled as a `dict` of builtin types, so no classes need to be loaded.
+
+    def find_class(self, module: str, name: str) -> Any:
+        raise pickle.UnpicklingError(f"Forbidden class: {module}.{name}")
+
+
+def _unpickle_record(data: bytes) -> Captured | None:
+    try:
+        record_dict = _Unpickler(io.BytesIO(data)).load()
+    except Exception:
+        # Handle invalid records.
+        return None
+    # Handle invalid records.
+    if not isinstance(record_dict, dict):
+        return None
+    captured = _capture_record(logging.makeLogRecord(record_dict))
+    captured.levelname = intern_str(captured.levelname)
+    captured.name = intern_str(captured.name)
+    return captured
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import marshal
+import mmap
+import struct
+import tempfile
+
+from logot._capture import Captured
+
+# Frame header for each spilled log: payload length.
+_LENGTH = struct.Struct(">L")
+
+
+class Spill:
+    # Older captured logs spilled to an append-only temporary file, in the order they were captured. Logs are read back
+    # through a memory map, which is remapped as the file grows.
+    # Most logs only have `str`, `int`, `None` or `...` fields, and are encoded with `marshal`. Other logs (e.g. with
+    # an exception) are kept in memory, with only a reference to them spilled. Underlying log records are never kept.
+
+    __slots__ = ("_file", "_map", "_read_pos", "_write_pos", "_objects", "_next_key", "_head")
+
+    def __init__(self) -> None:
+        self._file = tempfile.TemporaryFile()
+        self._map: mmap.mmap | None = None
+        self._read_pos = 0
+        self._write_pos = 0
+        self._objects: dict[int, Captured] = {}
+        self._next_key = 0
+        # A log returned to the front of the spill after being partly consumed.
+        self._head: tuple[Captured, int] | None = None
+
+    def __bool__(self) -> bool:
+        return self._head is not None or self._read_pos < self._write_pos
+
+    def append(self, captured: Captured, count: int) -> None:
+        # Handle logs that can be encoded.
+        if _is_plain(captured):
+            payload = marshal.dumps((count, captured.levelname, captured.msg, captured.levelno, captured.name))
+        # Handle other logs, keeping them in memory.
+        else:
+            key = self._next_key
+            self._next_key += 1
+            self._objects[key] = Captured(
+                captured.levelname,
+                captured.msg,
+                exc_info=captured.exc_info,
+                levelno=captured.levelno,  # type: ignore[arg-type]
+                name=captured.name,
+            )
+            payload = marshal.dumps((count, key))
+        self._file.write(_LENGTH.pack(len(payload)) + payload)
+        self._write_pos += _LENGTH.size + len(payload)
+
+    def popleft(self) -> tuple[Captured, int]:
+        # This must only be called while there are spilled logs.
+        # Handle a partly consumed log.
+        if self._head is not None:
+            head, self._head = self._head, None
+            return head
+        # Remap the file once reads reach the end of the current memory map.
+        if self._map is None or self._read_pos >= len(self._map):
+            self._remap()
+        assert self._map is not None
+        (size,) = _LENGTH.unpack_from(self._map, self._read_pos)
+        payload_pos = self._read_pos + _LENGTH.size
+        fields = marshal.loads(self._map[payload_pos : payload_pos + size])
+        self._read_pos = payload_pos + size
+        # Handle log kept in memory.
+        if len(fields) == 2:
+            count, key = fields
+            return self._objects.pop(key), count
+        # Handle encoded log.
+        count, levelname, msg, levelno, name = fields
+        return Captured(levelname, msg, levelno=levelno, name=name), count
+
+    def appendleft(self, captured: Captured, count: int) -> None:
+        self._head = (captured, count)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def _remap(self) -> None:
+        self._file.flush()
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), self._write_pos, access=mmap.ACCESS_READ)
+
+
+def _is_plain(captured: Captured) -> bool:
+    return (
+        type(captured.levelname) is str
+        and type(captured.msg) is str
+        and (captured.exc_info is None or captured.exc_info is ...)
+        and (captured.levelno is None or captured.levelno is ... or type(captured.levelno) is int)
+        and (captured.name is None or captured.name is ... or type(captured.name) is str)
+    )
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import sys
+
+from logot._capture import Captured, ExcSnapshot
+from logot._typing import Name
+
+
+@dataclasses.dataclass(frozen=True)
+class LogotStats:
+    """
+    Statistics about the logs captured by a :class:`logot.Logot`.
+
+    .. seealso::
+
+        See :meth:`logot.Logot.stats` API reference.
+    """
+
+    levels: dict[str, int]
+    """
+    The number of logs captured at each level name (e.g. ``{"INFO": 12}``), including logs dropped by sampling.
+    """
+
+    names: dict[Name, int]
+    """
+    The number of logs captured from each logger name, including logs dropped by sampling. Logs from the root logger
+    (or an unknown logger) are counted under :data:`None`.
+    """
+
+    msg_length: int
+    """
+    The total length (in characters) of all captured log messages.
+    """
+
+    captured_bytes: int
+    """
+    The approximate memory (in bytes) used by captured logs, including messages, log records and exceptions. Logs
+    dropped by sampling are not included.
+
+    Only measured when :attr:`Logot.measure_bytes` is enabled, otherwise ``0``.
+    """
+
+    dropped: int
+    """
+    The number of logs dropped by sampling.
+    """
+
+    consumed: int
+    """
+    The number of logs consumed while matching :doc:`log patterns </log-pattern-matching>`.
+    """
+
+    buffered: int
+    """
+    The number of logs currently buffered, waiting to be matched.
+    """
+
+    peak_buffered: int
+    """
+    The maximum number of logs buffered at once.
+    """
+
+    capture_seconds: float
+    """
+    The total time (in seconds) spent in :meth:`logot.Logot.capture`.
+    """
+
+    def to_json(self) -> str:
+        """
+        Returns the statistics as a JSON object. Logs from the root logger are counted under ``""`` in ``names``.
+        """
+        stats = dataclasses.asdict(self)
+        stats["names"] = {_name_str(name): count for name, count in self.names.items()}
+        return json.dumps(stats, sort_keys=True)
+
+    def to_prometheus(self, *, prefix: str = "logot") -> str:
+        """
+        Returns the statistics in the Prometheus text exposition format.
+
+        :param prefix: The prefix for all metric names.
+        """
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, help: str, samples: list[tuple[str, float]]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.extend(f"{prefix}_{name}{labels} {value}" for labels, value in samples)
+
+        metric(
+            "logs_total",
+            "counter",
+            "Logs captured, by level.",
+            [(f'{{level="{_escape(levelname)}"}}', count) for levelname, count in sorted(self.levels.items())],
+        )
+        metric(
+            "logger_logs_total",
+            "counter",
+            "Logs captured, by logger name.",
+            [
+                (f'{{name="{_escape(name)}"}}', count)
+                for name, count in sorted((_name_str(name), count) for name, count in self.names.items())
+            ],
+        )
+        metric("msg_length_total", "counter", "Total length of captured log messages.", [("", self.msg_length)])
+        metric(
+            "captured_bytes_total", "counter", "Approximate memory used by captured logs.", [("", self.captured_bytes)]
+        )
+        metric("dropped_total", "counter", "Logs dropped by sampling.", [("", self.dropped)])
+        metric("consumed_total", "counter", "Logs consumed while matching log patterns.", [("", self.consumed)])
+        metric("buffered", "gauge", "Logs currently buffered.", [("", self.buffered)])
+        metric("peak_buffered", "gauge", "Maximum logs buffered at once.", [("", self.peak_buffered)])
+        metric("capture_seconds_total", "counter", "Time spent capturing logs.", [("", self.capture_seconds)])
+        return "\n".join(lines) + "\n"
+
+
+class Stats:
+    # Statistics maintained incrementally on the capture path. The capture counters are guarded by `Logot._lock`, and
+    # the buffer counters are guarded by `Logot._queue_lock`.
+
+    __slots__ = (
+        "counts",
+        "consumed_counts",
+        "msg_length",
+        "captured_bytes",
+        "dropped",
+        "capture_seconds",
+        "consumed",
+        "buffered",
+        "peak_buffered",
+    )
+
+    def __init__(self) -> None:
+        # Capture counters. Logs are counted by `(level name, logger name)`.
+        self.counts: dict[tuple[str, Name], int] = {}
+        self.msg_length = 0
+        self.captured_bytes = 0
+        self.dropped = 0
+        self.capture_seconds = 0.0
+        # Buffer counters.
+        self.consumed = 0
+        self.consumed_counts: dict[tuple[str, Name], int] = {}
+        self.buffered = 0
+        self.peak_buffered = 0
+
+    def count(self, captured: Captured, size: int) -> None:
+        key = _key(captured)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.msg_length += len(captured.msg)
+        self.captured_bytes += size
+
+    def consume(self, captured: Captured, count: int) -> None:
+        self.consumed += count
+        key = _key(captured)
+        self.consumed_counts[key] = self.consumed_counts.get(key, 0) + count
+
+    def levels(self) -> dict[str, int]:
+        levels: dict[str, int] = {}
+        for (levelname, _), count in self.counts.items():
+            levels[levelname] = levels.get(levelname, 0) + count
+        return levels
+
+    def snapshot(self) -> LogotStats:
+        names: dict[Name, int] = {}
+        for (_, name), count in self.counts.items():
+            names[name] = names.get(name, 0) + count
+        return LogotStats(
+            levels=self.levels(),
+            names=names,
+            msg_length=self.msg_length,
+            captured_bytes=self.captured_bytes,
+            dropped=self.dropped,
+            consumed=self.consumed,
+            buffered=self.buffered,
+            peak_buffered=self.peak_buffered,
+            capture_seconds=self.capture_seconds,
+        )
+
+
+def _key(captured: Captured) -> tuple[str, Name]:
+    return (captured.levelname, captured.name if isinstance(captured.name, str) else None)
+
+
+def captured_size(captured: Captured) -> int:
+    # The approximate memory used by a captured log. Objects shared between logs (e.g. interned level names and logger
+    # names) are not counted, and `sys.getsizeof()` does not follow references, so this is a lower bound.
+    size = sys.getsizeof(captured) + sys.getsizeof(captured.msg)
+    # Handle log record.
+    record = captured.record
+    if record is not None and record is not ...:
+        size += sys.getsizeof(record) + sys.getsizeof(getattr(record, "__dict__", None))
+    # Handle exception, including its traceback frames.
+    exc_info = captured.exc_info
+    if isinstance(exc_info, BaseException):
+        size += sys.getsizeof(exc_info) + sys.getsizeof(exc_info.args)
+        tb = exc_info.__traceback__
+        while tb is not None:
+            size += sys.getsizeof(tb) + sys.getsizeof(tb.tb_frame)
+            tb = tb.tb_next
+    # Handle exception snapshot.
+    elif isinstance(exc_info, ExcSnapshot):
+        size += sys.getsizeof(exc_info) + sys.getsizeof(exc_info.args)
+    return size
+
+
+def _name_str(name: Name) -> str:
+    return "" if name is None else name
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
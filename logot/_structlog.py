@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import logging
+import sys
+from _thread import allocate_lock
 from functools import partial
 
 import structlog
@@ -8,8 +11,14 @@ from structlog.types import EventDict, WrappedLogger
 
 from logot._capture import Captured, capture_exc_info
 from logot._logot import Capturer, Logot
+from logot._names import NameFilter
+from logot._route import Route, Router
 from logot._typing import Level, Name
 
+# Routes events from the persistent processor to capturing `Logot` instances.
+_PERSISTENT_LOCK = allocate_lock()
+_PERSISTENT_ROUTER = Router()
+
 
 class StructlogCapturer(Capturer):
     """
@@ -18,39 +27,121 @@ class StructlogCapturer(Capturer):
 
     __slots__ = ("_old_processors",)
 
-    def start_capturing(self, logot: Logot, /, *, level: Level, name: Name) -> None:
+    _name_filter = True
+
+    def start_capturing(self, logot: Logot, /, *, level: Level, name: Name | NameFilter) -> None:
         config = structlog.get_config()
         processors = config["processors"]
         self._old_processors = processors
+        route = Route(logot, levelno=_get_levelno(level), name=name)
+        structlog.configure(processors=[partial(_processor, route=route), *processors])
+
+    def stop_capturing(self) -> None:
+        structlog.configure(processors=self._old_processors)
+
+    def _is_forwarded(self, captured: Captured) -> bool:
+        return _is_forwarded(captured)
+
+
+class PersistentStructlogCapturer(Capturer):
+    """
+    A :class:`logot.Capturer` implementation for :mod:`structlog` that installs a single processor for the whole
+    session, switching its target :class:`logot.Logot` on each capture.
+
+    Unlike :class:`StructlogCapturer`, :mod:`structlog` is not reconfigured for every capture, so loggers cached by
+    ``cache_logger_on_first_use`` after the first capture keep capturing.
+
+    .. important::
+
+        The processor is *not* removed when capturing stops. Use :meth:`uninstall` to remove it. The :mod:`pytest`
+        plugin does this automatically at the end of the test session.
+    """
+
+    __slots__ = ("_route",)
 
-        if isinstance(level, str):
-            levelno = NAME_TO_LEVEL[level.lower()]
-        else:
-            levelno = level
+    _name_filter = True
 
-        structlog.configure(processors=[partial(_processor, logot=logot, name=name, levelno=levelno), *processors])
+    def start_capturing(self, logot: Logot, /, *, level: Level, name: Name | NameFilter) -> None:
+        _install_persistent_processor()
+        self._route = _PERSISTENT_ROUTER.add(logot, levelno=_get_levelno(level), name=name)
 
     def stop_capturing(self) -> None:
-        structlog.configure(processors=self._old_processors)
+        _PERSISTENT_ROUTER.remove(self._route)
+
+    def _is_forwarded(self, captured: Captured) -> bool:
+        return _is_forwarded(captured)
+
+    @staticmethod
+    def uninstall() -> None:
+        """
+        Removes the persistent processor from the :mod:`structlog` processor chain.
+        """
+        with _PERSISTENT_LOCK:
+            processors = structlog.get_config()["processors"]
+            # Handle not installed.
+            if not any(processor is _persistent_processor for processor in processors):
+                return
+            structlog.configure(
+                processors=[processor for processor in processors if processor is not _persistent_processor]
+            )
+
+
+def _install_persistent_processor() -> None:
+    with _PERSISTENT_LOCK:
+        processors = structlog.get_config()["processors"]
+        # Handle already installed.
+        if any(processor is _persistent_processor for processor in processors):
+            return
+        # Configure a new processor chain, rather than modifying the configured one in-place.
+        structlog.configure(processors=[_persistent_processor, *processors])
+
+
+def _get_levelno(level: Level) -> int:
+    if isinstance(level, str):
+        return NAME_TO_LEVEL[level.lower()]
+    return level
 
 
-def _processor(
-    logger: WrappedLogger, method_name: str, event_dict: EventDict, *, logot: Logot, name: Name, levelno: int
-) -> EventDict:
-    msg = event_dict["event"]
-    level = method_name.upper()
-    event_levelno = NAME_TO_LEVEL[method_name]
-    logger_name = getattr(logger, "name", None)
-
-    if (name is None or f"{logger_name}.".startswith(f"{name}.")) and event_levelno >= levelno:
-        captured = Captured(
-            level,
-            msg,
-            exc_info=capture_exc_info(event_dict.get("exc_info")),
-            levelno=event_levelno,
-            name=logger_name,
-            record=event_dict,
-        )
-        logot.capture(captured)
+def _is_forwarded(captured: Captured) -> bool:
+    # Structlog forwards events to `logging` by calling a `logging.Logger` (e.g. created by
+    # `structlog.stdlib.LoggerFactory`) from its bound logger.
+    if not isinstance(captured.record, logging.LogRecord):
+        return False
+    # Find the caller of the `logging.Logger`, skipping `logging` and `logot` frames.
+    frame = sys._getframe()
+    while frame is not None:
+        name: str = frame.f_globals.get("__name__", "")
+        if not (name == "logging" or name.startswith(("logging.", "logot."))):
+            return name.startswith("structlog.")
+        frame = frame.f_back
+    return False  # pragma: no cover
+
+
+def _capture_event(method_name: str, levelno: int, name: Name, event_dict: EventDict) -> Captured:
+    return Captured(
+        method_name.upper(),
+        event_dict["event"],
+        exc_info=capture_exc_info(event_dict.get("exc_info")),
+        levelno=levelno,
+        name=name,
+        record=event_dict,
+    )
+
+
+def _processor(logger: WrappedLogger, method_name: str, event_dict: EventDict, *, route: Route) -> EventDict:
+    levelno = NAME_TO_LEVEL[method_name]
+    name = getattr(logger, "name", None)
+    # Only convert the event if the route accepts it.
+    if route.accepts(levelno, name):
+        route.logot.capture(_capture_event(method_name, levelno, name, event_dict))
+    return event_dict
+
 
+def _persistent_processor(logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+    levelno = NAME_TO_LEVEL[method_name]
+    # Handle events not accepted by any route, without looking up the logger name.
+    if levelno < _PERSISTENT_ROUTER.levelno:
+        return event_dict
+    name = getattr(logger, "name", None)
+    _PERSISTENT_ROUTER.dispatch(levelno, name, partial(_capture_event, method_name, levelno, name, event_dict))
     return event_dict
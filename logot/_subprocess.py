@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import logging
+from subprocess import Popen
+from threading import Thread
+from time import monotonic
+from typing import IO, Any
+
+from logot._level import get_levelno
+from logot._logot import Capturer, Logot
+from logot._names import NameFilter
+from logot._parse import capture_line, line_parser
+from logot._route import Route
+from logot._typing import Level, Name
+
+# The maximum time (in seconds) to wait for a flush.
+_FLUSH_TIMEOUT = 1.0
+
+
+class SubprocessCapturer(Capturer):
+    """
+    A :class:`logot.Capturer` implementation for logs written as text lines by a subprocess.
+
+    Lines are read and parsed in a background thread as soon as they are written. Lines that do not match the log
+    format (e.g. tracebacks or other output) are ignored.
+
+    :param source: A :class:`subprocess.Popen` with ``stdout`` and/or ``stderr`` pipes, or a single pipe to read from.
+    :param format: The :mod:`logging` format of the log lines. Defaults to :data:`logging.BASIC_FORMAT`. The
+        ``%(levelname)s`` and ``%(message)s`` fields are required. The ``%(levelno)d`` and ``%(name)s`` fields are
+        also captured, and other fields are ignored.
+    :param json: Parse JSON log lines instead. The ``levelname`` (or ``level``), ``levelno``, ``name`` (or
+        ``logger``) and ``message`` (or ``msg`` or ``event``) keys are captured.
+    """
+
+    __slots__ = ("_source", "_parser", "_route", "_threads")
+
+    _name_filter = True
+
+    def __init__(
+        self,
+        source: Popen[Any] | IO[Any],
+        *,
+        format: str = logging.BASIC_FORMAT,
+        json: bool = False,
+    ) -> None:
+        self._source = source
+        self._parser = line_parser(format, json=json)
+
+    def start_capturing(self, logot: Logot, /, *, level: Level, name: Name | NameFilter) -> None:
+        self._route: Route | None = Route(logot, levelno=get_levelno(level), name=name)
+        # Read each pipe in a background thread.
+        if isinstance(self._source, Popen):
+            streams = [stream for stream in (self._source.stdout, self._source.stderr) if stream is not None]
+        else:
+            streams = [self._source]
+        self._threads = [Thread(target=self._read, args=(stream,), daemon=True) for stream in streams]
+        for thread in self._threads:
+            thread.start()
+
+    def stop_capturing(self) -> None:
+        # The background threads keep reading until the pipes are closed, discarding logs. This stops the subprocess
+        # blocking on a full pipe.
+        self._route = None
+
+    def flush(self) -> None:
+        # Once the subprocess has exited, wait for the remaining lines to be read. The pipes may be kept open by other
+        # processes (e.g. a grandchild process inheriting them), so give up after a timeout.
+        if isinstance(self._source, Popen) and self._source.poll() is not None:
+            deadline = monotonic() + _FLUSH_TIMEOUT
+            for thread in self._threads:
+                thread.join(max(deadline - monotonic(), 0.0))
+
+    def _read(self, stream: IO[Any]) -> None:
+        while True:
+            # Lines are returned as soon as they are complete, so logs are captured with low latency.
+            line = stream.readline()
+            # Handle closed pipe.
+            if not line:
+                return
+            route = self._route
+            # Handle stopped capturing.
+            if route is None:
+                continue
+            capture_line(route, self._parser, line)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from types import EllipsisType
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Literal, TypeVar
 from typing import ParamSpec as ParamSpec
 from typing import TypeAlias as TypeAlias
 
@@ -11,6 +11,8 @@ T = TypeVar("T")
 Level: TypeAlias = str | int
 ExcInfo: TypeAlias = bool | BaseException | None
 Name: TypeAlias = str | None
+RecordRetention: TypeAlias = Literal["full", "none"]
+ExcInfoRetention: TypeAlias = Literal["full", "snapshot"]
 
 if TYPE_CHECKING:  # pragma: no cover
     Wildcard: TypeAlias = T | EllipsisType
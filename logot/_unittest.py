@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import sys
 from typing import Callable, ClassVar
 from unittest import TestCase, TestResult
 
+from logot._logging import LoggingProfiler
 from logot._logot import Capturer, Logot
-from logot._typing import Level, Name
+from logot._typing import ExcInfoRetention, Level, Name, RecordRetention
 from logot._wait import AsyncWaiter
 
 
@@ -55,16 +57,81 @@ class LogotTestCase(TestCase):
     Defaults to :attr:`logot.Logot.DEFAULT_ASYNC_WAITER`.
     """
 
+    logot_record_retention: ClassVar[RecordRetention] = Logot.DEFAULT_RECORD_RETENTION
+    """
+    The default ``record_retention`` for :attr:`LogotTestCase.logot`.
+
+    Defaults to :attr:`logot.Logot.DEFAULT_RECORD_RETENTION`.
+    """
+
+    logot_exc_info_retention: ClassVar[ExcInfoRetention] = Logot.DEFAULT_EXC_INFO_RETENTION
+    """
+    The default ``exc_info_retention`` for :attr:`LogotTestCase.logot`.
+
+    Defaults to :attr:`logot.Logot.DEFAULT_EXC_INFO_RETENTION`.
+    """
+
+    logot_max_msg_len: ClassVar[int | None] = Logot.DEFAULT_MAX_MSG_LEN
+    """
+    The default ``max_msg_len`` for :attr:`LogotTestCase.logot`.
+
+    Defaults to :attr:`logot.Logot.DEFAULT_MAX_MSG_LEN`.
+    """
+
+    logot_max_buffered: ClassVar[int | None] = Logot.DEFAULT_MAX_BUFFERED
+    """
+    The default ``max_buffered`` for :attr:`LogotTestCase.logot`.
+
+    Defaults to :attr:`logot.Logot.DEFAULT_MAX_BUFFERED`.
+    """
+
+    logot_profile: ClassVar[bool] = False
+    """
+    Whether to measure the time spent handling logs in each test with a :class:`logot.profiling.LoggingProfiler`.
+
+    The profiler for each test is available as :attr:`LogotTestCase.logot_profiler`. The most expensive logger names
+    and levels from all tests in the class are reported to :data:`sys.stderr` once the class has run.
+
+    Defaults to ``False``.
+    """
+
+    logot_profiler: LoggingProfiler
+    """
+    An active :class:`logot.profiling.LoggingProfiler` measuring the time spent handling logs in the test.
+
+    This is only available when :attr:`LogotTestCase.logot_profile` is enabled.
+    """
+
+    _logot_class_profiler: ClassVar[LoggingProfiler | None] = None
+
     def _logot_setup(self) -> None:
         self.logot = Logot(
             capturer=self.__class__.logot_capturer,
             timeout=self.__class__.logot_timeout,
             async_waiter=self.__class__.logot_async_waiter,
+            record_retention=self.__class__.logot_record_retention,
+            exc_info_retention=self.__class__.logot_exc_info_retention,
+            max_msg_len=self.__class__.logot_max_msg_len,
+            max_buffered=self.__class__.logot_max_buffered,
         )
         # TODO: Use `TestCase.enterContext()` when we only need to support Python 3.11+.
         ctx = self.logot.capturing(level=self.logot_level, name=self.logot_name)
         ctx.__enter__()
         self.addCleanup(ctx.__exit__, None, None, None)
+        if self.logot_profile:
+            self._logot_profile_setup()
+
+    def _logot_profile_setup(self) -> None:
+        cls = self.__class__
+        # A single profiler is shared by all tests in the class, and reported once the class has run.
+        class_profiler = cls.__dict__.get("_logot_class_profiler")
+        if class_profiler is None:
+            class_profiler = cls._logot_class_profiler = LoggingProfiler()
+            cls.addClassCleanup(_logot_profile_report, cls)
+        self.logot_profiler = LoggingProfiler()
+        for profiler in (class_profiler, self.logot_profiler):
+            profiler.__enter__()
+            self.addCleanup(profiler.__exit__, None, None, None)
 
     def run(self, result: TestResult | None = None) -> TestResult | None:
         self._logot_setup()
@@ -73,3 +140,9 @@ class LogotTestCase(TestCase):
     def debug(self) -> None:
         self._logot_setup()
         return super().debug()
+
+
+def _logot_profile_report(cls: type[LogotTestCase]) -> None:
+    profiler = cls.__dict__["_logot_class_profiler"]
+    cls._logot_class_profiler = None
+    print(f"logot logging profile for {cls.__qualname__}:", profiler.report(), sep="\n", file=sys.stderr)
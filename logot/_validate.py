@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from logot._typing import Level, Name
+import logging
+from collections.abc import Mapping, Sequence
+from typing import cast
+
+from logot._names import NameFilter
+from logot._typing import ExcInfoRetention, Level, Name, RecordRetention
 
 
 def validate_level(level: Level) -> Level:
@@ -19,6 +24,18 @@ def validate_name(name: Name) -> Name:
     raise TypeError(f"Invalid name: {name!r}")
 
 
+def validate_names(name: Name | Sequence[str], exclude: Sequence[str]) -> Name | NameFilter:
+    # Handle invalid excluded names.
+    if isinstance(exclude, str) or not all(isinstance(excluded, str) for excluded in exclude):
+        raise TypeError(f"Invalid exclude: {exclude!r}")
+    # Handle multiple names.
+    if isinstance(name, Sequence) and not isinstance(name, str) and name and all(isinstance(n, str) for n in name):
+        return NameFilter(name, exclude)
+    # Handle a single name, filtering it if there are excluded names.
+    name = validate_name(cast(Name, name))
+    return NameFilter((name,), exclude) if exclude else name
+
+
 def validate_timeout(timeout: float) -> float:
     # Handle numeric timeout.
     if isinstance(timeout, (float, int)):
@@ -27,3 +44,62 @@ def validate_timeout(timeout: float) -> float:
         raise ValueError(f"Invalid timeout: {timeout!r}")
     # Handle invalid timeout.
     raise TypeError(f"Invalid timeout: {timeout!r}")
+
+
+def validate_record_retention(record_retention: RecordRetention) -> RecordRetention:
+    # Handle known record retention.
+    if record_retention in ("full", "none"):
+        return record_retention
+    # Handle invalid record retention.
+    raise ValueError(f"Invalid record_retention: {record_retention!r}")
+
+
+def validate_exc_info_retention(exc_info_retention: ExcInfoRetention) -> ExcInfoRetention:
+    # Handle known exception retention.
+    if exc_info_retention in ("full", "snapshot"):
+        return exc_info_retention
+    # Handle invalid exception retention.
+    raise ValueError(f"Invalid exc_info_retention: {exc_info_retention!r}")
+
+
+def validate_max_msg_len(max_msg_len: int | None) -> int | None:
+    # Handle `None` or `int` max message length.
+    if max_msg_len is None:
+        return None
+    if isinstance(max_msg_len, int):
+        if max_msg_len >= 0:
+            return max_msg_len
+        raise ValueError(f"Invalid max_msg_len: {max_msg_len!r}")
+    # Handle invalid max message length.
+    raise TypeError(f"Invalid max_msg_len: {max_msg_len!r}")
+
+
+def validate_max_buffered(max_buffered: int | None) -> int | None:
+    # Handle `None` or `int` max buffered logs.
+    if max_buffered is None:
+        return None
+    if isinstance(max_buffered, int):
+        if max_buffered >= 1:
+            return max_buffered
+        raise ValueError(f"Invalid max_buffered: {max_buffered!r}")
+    # Handle invalid max buffered logs.
+    raise TypeError(f"Invalid max_buffered: {max_buffered!r}")
+
+
+def validate_sample(sample: Mapping[Level, float] | None) -> dict[str, float] | None:
+    # Handle no sampling.
+    if sample is None:
+        return None
+    # Handle sample rates, keyed by level name.
+    if isinstance(sample, Mapping):
+        sample_names: dict[str, float] = {}
+        for level, rate in sample.items():
+            if not isinstance(rate, (float, int)):
+                raise TypeError(f"Invalid sample rate: {rate!r}")
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"Invalid sample rate: {rate!r}")
+            level = validate_level(level)
+            sample_names[level if isinstance(level, str) else logging.getLevelName(level)] = float(rate)
+        return sample_names
+    # Handle invalid sample.
+    raise TypeError(f"Invalid sample: {sample!r}")
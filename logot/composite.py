@@ -0,0 +1,11 @@
+"""
+Integration API for capturing logs from several logging frameworks together.
+
+.. seealso::
+
+    See :doc:`/log-capturing` usage guide.
+"""
+
+from __future__ import annotations
+
+from logot._composite import CompositeCapturer as CompositeCapturer
@@ -0,0 +1,11 @@
+"""
+Integration API for log files.
+
+.. seealso::
+
+    See :doc:`/log-capturing` usage guide.
+"""
+
+from __future__ import annotations
+
+from logot._file import FileCapturer as FileCapturer
@@ -9,3 +9,4 @@ Integration API for :mod:`logging`.
 from __future__ import annotations
 
 from logot._logging import LoggingCapturer as LoggingCapturer
+from logot._logging import PersistentLoggingCapturer as PersistentLoggingCapturer
@@ -9,3 +9,4 @@ Integration API for :mod:`loguru`.
 from __future__ import annotations
 
 from logot._loguru import LoguruCapturer as LoguruCapturer
+from logot._loguru import PersistentLoguruCapturer as PersistentLoguruCapturer
@@ -0,0 +1,11 @@
+"""
+Integration API for :mod:`multiprocessing`.
+
+.. seealso::
+
+    See :doc:`/log-capturing` usage guide.
+"""
+
+from __future__ import annotations
+
+from logot._multiprocessing import MultiprocessingCapturer as MultiprocessingCapturer
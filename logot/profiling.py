@@ -0,0 +1,14 @@
+"""
+Integration API for profiling :mod:`logot`.
+
+.. seealso::
+
+    See :doc:`/log-pattern-matching` usage guide.
+"""
+
+from __future__ import annotations
+
+from logot._logging import LoggingProfiler as LoggingProfiler
+from logot._profiling import LoggingProfileStats as LoggingProfileStats
+from logot._profiling import ProfileStats as ProfileStats
+from logot._profiling import ReductionProfiler as ReductionProfiler
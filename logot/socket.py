@@ -0,0 +1,11 @@
+"""
+Integration API for logs sent over the network by :mod:`logging.handlers` (or as JSON log lines).
+
+.. seealso::
+
+    See :doc:`/log-capturing` usage guide.
+"""
+
+from __future__ import annotations
+
+from logot._socket import SocketCapturer as SocketCapturer
@@ -8,4 +8,5 @@ Integration API for :mod:`structlog`.
 
 from __future__ import annotations
 
+from logot._structlog import PersistentStructlogCapturer as PersistentStructlogCapturer
 from logot._structlog import StructlogCapturer as StructlogCapturer
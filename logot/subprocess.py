@@ -0,0 +1,11 @@
+"""
+Integration API for :mod:`subprocess`.
+
+.. seealso::
+
+    See :doc:`/log-capturing` usage guide.
+"""
+
+from __future__ import annotations
+
+from logot._subprocess import SubprocessCapturer as SubprocessCapturer
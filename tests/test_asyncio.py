@@ -7,7 +7,7 @@ from typing import Any, Callable
 
 import pytest
 
-from logot import Captured, Logot, logged
+from logot import Captured, Logot, await_for_all, await_for_any, logged
 from logot._typing import P
 from tests import capture_soon, lines
 
@@ -42,3 +42,44 @@ async def test_await_for_fail(logot: Logot) -> None:
         "",
         "[INFO] foo bar",
     )
+
+
+@asyncio_test
+async def test_await_for_all_pass_soon(logot: Logot) -> None:
+    other_logot = Logot()
+    capture_soon(logot, Captured("INFO", "foo bar"))
+    capture_soon(other_logot, Captured("INFO", "baz"))
+    await await_for_all({logot: logged.info("foo bar"), other_logot: logged.info("baz")})
+
+
+@asyncio_test
+async def test_await_for_all_fail(logot: Logot) -> None:
+    other_logot = Logot()
+    with pytest.raises(AssertionError) as ex:
+        await await_for_all({logot: logged.info("foo bar"), other_logot: logged.info("baz")}, timeout=0.1)
+    assert str(ex.value) == lines(
+        "Not logged:",
+        "",
+        "Unordered:",
+        "- [INFO] foo bar",
+        "- [INFO] baz",
+    )
+
+
+@asyncio_test
+async def test_await_for_any_pass_immediate(logot: Logot) -> None:
+    logot.capture(Captured("INFO", "foo bar"))
+    await await_for_any({logot: logged.info("foo bar"), Logot(): logged.info("baz")})
+
+
+@asyncio_test
+async def test_await_for_any_pass_soon(logot: Logot) -> None:
+    other_logot = Logot()
+    capture_soon(other_logot, Captured("INFO", "baz"))
+    await await_for_any({logot: logged.info("foo bar"), other_logot: logged.info("baz")})
+
+
+@asyncio_test
+async def test_await_for_all_empty() -> None:
+    with pytest.raises(ValueError):
+        await await_for_all({})
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+
+import pytest
+import structlog
+from loguru import logger as loguru_logger
+from structlog.stdlib import LoggerFactory
+
+from logot import Captured, Capturer, Logot, logged
+from logot._composite import _default_capturers
+from logot.composite import CompositeCapturer
+from logot.logging import LoggingCapturer, PersistentLoggingCapturer
+from logot.loguru import LoguruCapturer, PersistentLoguruCapturer
+from logot.structlog import PersistentStructlogCapturer, StructlogCapturer
+
+logger = logging.getLogger(__name__)
+
+
+class PropagateHandler(logging.Handler):
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+class BrokenCapturer(Capturer):
+    def start_capturing(self, logot: Logot, /, **kwargs: object) -> None:
+        raise RuntimeError("Boom!")
+
+    def stop_capturing(self) -> None:  # pragma: no cover
+        pass
+
+
+class ProxyCapturer(Capturer):
+    logot: Logot
+
+    def start_capturing(self, logot: Logot, /, **kwargs: object) -> None:
+        ProxyCapturer.logot = logot
+
+    def stop_capturing(self) -> None:
+        pass
+
+
+@pytest.fixture()
+def loguru_propagated() -> Iterator[None]:
+    handler_id = loguru_logger.add(PropagateHandler(), format="{message}")
+    try:
+        yield
+    finally:
+        loguru_logger.remove(handler_id)
+
+
+@pytest.fixture()
+def structlog_stdlib() -> Iterator[None]:
+    config = structlog.get_config()
+    structlog.configure(logger_factory=LoggerFactory())
+    try:
+        yield
+    finally:
+        structlog.configure(logger_factory=config["logger_factory"])
+
+
+def test_capturing() -> None:
+    with Logot(capturer=CompositeCapturer).capturing() as logot:
+        # Ensure log capturing is enabled, in emission order.
+        logger.info("foo bar")
+        loguru_logger.info("foo baz")
+        structlog.get_logger().info("foo qux")
+        logot.assert_logged(logged.info("foo bar") >> logged.info("foo baz") >> logged.info("foo qux"))
+    # Ensure log capturing is disabled.
+    logger.info("foo bar")
+    loguru_logger.info("foo bar")
+    structlog.get_logger().info("foo bar")
+    logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_capturing_level_fail() -> None:
+    with Logot(capturer=CompositeCapturer).capturing(level="INFO") as logot:
+        logger.debug("foo bar")
+        loguru_logger.debug("foo bar")
+        structlog.get_logger().debug("foo bar")
+        logot.assert_not_logged(logged.debug("foo bar"))
+
+
+@pytest.mark.usefixtures("loguru_propagated")
+def test_capturing_forwarded_loguru() -> None:
+    with Logot(capturer=CompositeCapturer).capturing() as logot:
+        loguru_logger.info("foo bar")
+        # Logs forwarded to `logging` are only captured once.
+        logot.assert_logged(logged.info("foo bar"))
+        logot.assert_not_logged(logged.info("foo bar"))
+
+
+@pytest.mark.usefixtures("structlog_stdlib")
+def test_capturing_forwarded_structlog() -> None:
+    with Logot(capturer=CompositeCapturer).capturing() as logot:
+        structlog.get_logger(__name__).info("foo bar", foo="bar")
+        # Logs forwarded to `logging` are only captured once, using the original structlog event.
+        logot.assert_logged(logged.info("foo bar"))
+        logot.assert_not_logged(logged.info("%s"))
+
+
+@pytest.mark.usefixtures("loguru_propagated", "structlog_stdlib")
+def test_capturing_forwarded_persistent() -> None:
+    capturer = CompositeCapturer(LoggingCapturer, PersistentLoguruCapturer, PersistentStructlogCapturer)
+    with Logot(capturer=lambda: capturer).capturing() as logot:
+        loguru_logger.info("foo bar")
+        structlog.get_logger(__name__).info("foo baz")
+        # Logs forwarded to `logging` are only captured once.
+        logot.assert_logged(logged.info("foo bar") >> logged.info("foo baz"))
+        logot.assert_not_logged(logged.info("%s"))
+
+
+def test_capturing_not_forwarded() -> None:
+    with Logot(capturer=CompositeCapturer).capturing() as logot:
+        # Identical logs from the same capturer are not forwarded.
+        logger.info("foo bar")
+        logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar") >> logged.info("foo bar"))
+
+
+@pytest.mark.usefixtures("loguru_propagated")
+def test_capturing_not_forwarded_prefix() -> None:
+    with Logot(capturer=CompositeCapturer).capturing() as logot:
+        # Logs with a matching prefix from different capturers are not forwarded.
+        logger.info("Worker started")
+        loguru_logger.info("Worker started 2")
+        logot.assert_logged(logged.info("Worker started") >> logged.info("Worker started 2"))
+        logot.assert_not_logged(logged.info("Worker started%s"))
+
+
+@pytest.mark.usefixtures("loguru_propagated")
+def test_capturing_not_forwarded_empty() -> None:
+    with Logot(capturer=CompositeCapturer).capturing() as logot:
+        # Empty logs are not forwarded.
+        logger.info("")
+        loguru_logger.info("foo bar")
+        logot.assert_logged(logged.info("") >> logged.info("foo bar"))
+        logot.assert_not_logged(logged.info("%s"))
+
+
+def test_capturing_not_forwarded_extra() -> None:
+    with Logot(capturer=CompositeCapturer).capturing() as logot:
+        # Logs with an `extra` attribute not emitted by loguru are not forwarded.
+        logger.info("foo bar", extra={"extra": {}})
+        logot.assert_logged(logged.info("foo bar"))
+
+
+@pytest.mark.usefixtures("structlog_stdlib")
+def test_capturing_not_forwarded_structlog() -> None:
+    with Logot(capturer=CompositeCapturer).capturing() as logot:
+        # Logs sent directly to `logging` are not forwarded, even with a structlog `logging` logger factory.
+        structlog.get_logger(__name__).info("foo bar")
+        logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar") >> logged.info("foo bar"))
+        logot.assert_not_logged(logged.info("%s"))
+
+
+def test_capturing_capturers() -> None:
+    with Logot(capturer=lambda: CompositeCapturer(LoggingCapturer, LoguruCapturer)).capturing() as logot:
+        structlog.get_logger().info("foo bar")
+        loguru_logger.info("foo baz")
+        logot.assert_logged(logged.info("foo baz"))
+        logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_capturing_start_error() -> None:
+    capturer = CompositeCapturer(StructlogCapturer, BrokenCapturer)
+    processors = structlog.get_config()["processors"]
+    with pytest.raises(RuntimeError, match="^Boom!$"):
+        capturer.start_capturing(Logot(), level="DEBUG", name=None)
+    # Capturers already started are stopped.
+    assert structlog.get_config()["processors"] is processors
+
+
+def test_capturing_proxy() -> None:
+    with Logot(capturer=lambda: CompositeCapturer(ProxyCapturer), timeout=9.0).capturing() as logot:
+        proxy = ProxyCapturer.logot
+        proxy.capture(Captured("INFO", "foo bar"))
+        # Methods other than `capture()` act on the wrapped `Logot`.
+        assert proxy.timeout == 9.0
+        proxy.assert_logged(logged.info("foo bar"))
+        logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_default_capturers_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("logot._composite.find_spec", lambda name: None)
+    assert [repr(capturer) for capturer in _default_capturers()] == ["logot.logging.LoggingCapturer"]
+
+
+def test_capturing_multiple_names() -> None:
+    with Logot(capturer=CompositeCapturer).capturing(name=["boom", "tests"], exclude=["tests.boom"]) as logot:
+        logger.info("foo bar")
+        loguru_logger.info("foo baz")
+        logot.assert_logged(logged.info("foo bar") >> logged.info("foo baz"))
+
+
+def test_capturing_multiple_names_unsupported() -> None:
+    capturer = CompositeCapturer(LoggingCapturer, PersistentLoggingCapturer)
+    with pytest.raises(TypeError) as ex:
+        with Logot(capturer=lambda: capturer).capturing(name=["foo", "bar"]):
+            pass  # pragma: no cover
+    assert str(ex.value) == "PersistentLoggingCapturer does not support multiple names or exclude"
+    # Capturers already started are stopped.
+    assert not logging.getLogger("foo").handlers
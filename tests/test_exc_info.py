@@ -4,6 +4,7 @@ from typing import cast
 
 import pytest
 
+from logot import Captured, ExcSnapshot
 from logot._exc_info import exc_info_matcher
 from logot._typing import ExcInfo
 from tests import ExampleException
@@ -21,3 +22,89 @@ def test_invalid() -> None:
     with pytest.raises(TypeError) as ex:
         exc_info_matcher(cast(ExcInfo, 1.5))
     assert str(ex.value) == "Invalid exc_info: 1.5"
+
+
+def raise_example() -> ExampleException:
+    try:
+        raise ExampleException("foo")
+    except ExampleException as ex:
+        return ex
+
+
+class IdentityException(Exception):
+    pass
+
+
+def raise_identity() -> IdentityException:
+    try:
+        raise IdentityException("foo")
+    except IdentityException as ex:
+        return ex
+
+
+def test_snapshot_match() -> None:
+    ex = raise_identity()
+    captured = Captured("INFO", "foo bar", exc_info=ExcSnapshot(ex))
+    assert exc_info_matcher(ex).match(captured)
+    assert exc_info_matcher(True).match(captured)
+    assert not exc_info_matcher(None).match(captured)
+
+
+def test_snapshot_match_fail() -> None:
+    ex = raise_identity()
+    captured = Captured("INFO", "foo bar", exc_info=ExcSnapshot(ex))
+    assert not exc_info_matcher(raise_identity()).match(captured)
+
+
+def test_snapshot_match_value() -> None:
+    # Exceptions compared by value still match equal exceptions.
+    captured = Captured("INFO", "foo bar", exc_info=ExcSnapshot(raise_example()))
+    assert exc_info_matcher(ExampleException("foo")).match(captured)
+    assert not exc_info_matcher(ExampleException("bar")).match(captured)
+
+
+def test_snapshot_eq() -> None:
+    ex = raise_identity()
+    snapshot = ExcSnapshot(ex)
+    assert snapshot == ExcSnapshot(ex)
+    assert snapshot != ExcSnapshot(raise_identity())
+    assert snapshot != ExampleException("foo")
+    assert snapshot.__eq__("foo") is NotImplemented
+
+
+def test_snapshot_eq_reraised() -> None:
+    snapshots: list[ExcSnapshot] = []
+
+    def log_and_reraise() -> None:
+        try:
+            raise IdentityException("foo")
+        except IdentityException as ex:
+            snapshots.append(ExcSnapshot(ex))
+            raise
+
+    with pytest.raises(IdentityException) as ex:
+        log_and_reraise()
+    # The traceback is extended as the exception propagates, after it was logged.
+    (snapshot,) = snapshots
+    assert snapshot == ex.value
+    assert snapshot == ExcSnapshot(ex.value)
+    assert ExcSnapshot(ex.value) == snapshot
+
+
+def test_snapshot_eq_traceback() -> None:
+    ex = raise_identity()
+    snapshot = ExcSnapshot(ex)
+    # A different traceback is a different exception, even with the same `id()`.
+    try:
+        raise ex.with_traceback(None)
+    except IdentityException:
+        pass
+    assert snapshot != ex
+    assert snapshot != ExcSnapshot(ex)
+
+
+def test_snapshot_fields() -> None:
+    snapshot = ExcSnapshot(raise_example())
+    assert snapshot.type is ExampleException
+    assert snapshot.args == ("foo",)
+    assert repr(snapshot) == "ExcSnapshot(type=ExampleException, args=('foo',))"
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from time import sleep
+
+import pytest
+
+from logot import Logot, logged
+from logot._capture import Captured
+from logot._file import _Tailer
+from logot._parse import line_parser
+from logot._route import Route
+from logot.file import FileCapturer
+
+
+@pytest.fixture()
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "app.log"
+
+
+def write(path: Path, text: str, *, mode: str = "a") -> None:
+    with open(path, mode) as file:
+        file.write(text)
+
+
+def capturing(path: Path, **kwargs: object) -> Callable[[], FileCapturer]:
+    return partial(FileCapturer, path, **kwargs)  # type: ignore[arg-type]
+
+
+def test_capturing(path: Path) -> None:
+    write(path, "INFO:app:foo bar\n")
+    with Logot(capturer=capturing(path)).capturing() as logot:
+        # Existing logs are not captured.
+        logot.assert_not_logged(logged.info("foo bar"))
+        write(path, "INFO:app:foo baz\n")
+        logot.assert_logged(logged.info("foo baz", name="app"))
+    # Ensure log capturing is disabled.
+    write(path, "INFO:app:foo bar\n")
+    logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_capturing_wait_for(path: Path) -> None:
+    with Logot(capturer=capturing(path)).capturing() as logot:
+        write(path, "INFO:app:foo bar\n")
+        logot.wait_for(logged.info("foo bar"))
+
+
+def test_capturing_wait_for_idle(path: Path) -> None:
+    with Logot(capturer=capturing(path)).capturing() as logot:
+        # Let polling back off while the file is idle.
+        sleep(0.1)
+        write(path, "INFO:app:foo bar\n")
+        logot.wait_for(logged.info("foo bar"))
+
+
+def test_capturing_partial_line(path: Path) -> None:
+    with Logot(capturer=capturing(path)).capturing() as logot:
+        write(path, "INFO:app:foo ")
+        logot.assert_not_logged(logged.info("foo %s"))
+        write(path, "bar\n")
+        logot.assert_logged(logged.info("foo bar"))
+
+
+def test_capturing_created(path: Path) -> None:
+    with Logot(capturer=capturing(path)).capturing() as logot:
+        logot.assert_not_logged(logged.info("foo bar"))
+        write(path, "INFO:app:foo bar\n")
+        logot.assert_logged(logged.info("foo bar"))
+
+
+def test_capturing_rotated(path: Path) -> None:
+    write(path, "")
+    with Logot(capturer=capturing(path)).capturing() as logot:
+        write(path, "INFO:app:foo bar\n")
+        os.rename(path, f"{path}.1")
+        logot.assert_logged(logged.info("foo bar"))
+        write(path, "INFO:app:foo baz\n")
+        logot.assert_logged(logged.info("foo baz"))
+
+
+def test_capturing_rotated_partial_line(path: Path) -> None:
+    write(path, "")
+    with Logot(capturer=capturing(path)).capturing() as logot:
+        write(path, "INFO:app:foo bar")
+        logot.assert_not_logged(logged.info("foo bar"))
+        os.rename(path, f"{path}.1")
+        write(path, "INFO:app:foo baz\n")
+        # The partial last line of the rotated file is captured.
+        logot.assert_logged(logged.info("foo bar") >> logged.info("foo baz"))
+
+
+def test_capturing_rotated_race(path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    write(path, "")
+    logot = Logot()
+    tailer = _Tailer(path, Route(logot, levelno=logging.DEBUG), line_parser(logging.BASIC_FORMAT, json=False))
+    os.rename(path, f"{path}.1")
+    write(path, "INFO:app:foo baz\n")
+    stat = os.stat
+
+    def racing_stat(stat_path: Path) -> os.stat_result:
+        # Write to the rotated file after it was last read, but before the rotation is detected.
+        monkeypatch.setattr(os, "stat", stat)
+        write(Path(f"{path}.1"), "INFO:app:foo bar\n")
+        return stat(stat_path)
+
+    monkeypatch.setattr(os, "stat", racing_stat)
+    assert tailer.poll()
+    tailer.close()
+    logot.assert_logged(logged.info("foo bar") >> logged.info("foo baz"))
+
+
+def test_capturing_truncated(path: Path) -> None:
+    write(path, "INFO:app:foo bar\n" * 10)
+    with Logot(capturer=capturing(path)).capturing() as logot:
+        write(path, "INFO:app:foo baz\n", mode="w")
+        logot.assert_logged(logged.info("foo baz"))
+
+
+def test_capturing_multiple(tmp_path: Path) -> None:
+    paths = [tmp_path / "app.log", tmp_path / "worker.log"]
+    with Logot(capturer=partial(FileCapturer, *paths)).capturing() as logot:
+        write(paths[0], "INFO:app:foo bar\n")
+        write(paths[1], "INFO:worker:foo baz\n")
+        logot.assert_logged(logged.info("foo bar", name="app"))
+        logot.assert_logged(logged.info("foo baz", name="worker"))
+
+
+def test_capturing_level_fail(path: Path) -> None:
+    with Logot(capturer=capturing(path)).capturing(level="INFO") as logot:
+        write(path, "DEBUG:app:foo bar\n")
+        logot.assert_not_logged(logged.debug("foo bar"))
+
+
+def test_capturing_json(path: Path) -> None:
+    with Logot(capturer=capturing(path, json=True)).capturing() as logot:
+        write(path, '{"level": "info", "event": "foo bar"}\n')
+        logot.assert_logged(logged.info("foo bar"))
+
+
+def test_capturing_unreadable(path: Path) -> None:
+    path.mkdir()
+    with Logot(capturer=capturing(path)).capturing() as logot:
+        logot.assert_not_logged(logged.info("foo bar"))
+        # Unreadable files are retried.
+        path.rmdir()
+        write(path, "INFO:app:foo bar\n")
+        logot.assert_logged(logged.info("foo bar"))
+
+
+def test_capturing_error(path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    write(path, "")
+    fstat = os.fstat
+    errors = [OSError("Boom!")]
+
+    def broken_fstat(fd: int) -> os.stat_result:
+        if errors:
+            raise errors.pop()
+        return fstat(fd)
+
+    with Logot(capturer=capturing(path)).capturing() as logot:
+        monkeypatch.setattr(os, "fstat", broken_fstat)
+        logot.assert_not_logged(logged.info("foo bar"))
+        assert not errors
+        # Files are retried after an error.
+        write(path, "INFO:app:foo bar\n")
+        logot.assert_logged(logged.info("foo bar"))
+
+
+def test_capturing_parse_error(path: Path) -> None:
+    capturer = FileCapturer(path)
+    parser = capturer._parser
+
+    def broken_parser(line: str) -> Captured | None:
+        if "boom" in line:
+            raise ValueError("Boom!")
+        return parser(line)
+
+    capturer._parser = broken_parser
+    with Logot(capturer=lambda: capturer).capturing() as logot:
+        # Lines that cannot be parsed are ignored.
+        write(path, "INFO:app:boom\nINFO:app:foo bar\n")
+        logot.assert_logged(logged.info("foo bar"))
+        logot.assert_not_logged(logged.info("boom"))
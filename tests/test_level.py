@@ -4,7 +4,7 @@ from typing import cast
 
 import pytest
 
-from logot._level import level_matcher
+from logot._level import level_matcher, matcher_levelno
 from logot._typing import Level
 
 
@@ -24,3 +24,10 @@ def test_invalid() -> None:
     with pytest.raises(TypeError) as ex:
         level_matcher(cast(Level, 1.5))
     assert str(ex.value) == "Invalid level: 1.5"
+
+
+def test_levelno() -> None:
+    assert matcher_levelno(level_matcher(...)) == 0
+    assert matcher_levelno(level_matcher("INFO")) == 20
+    assert matcher_levelno(level_matcher("BOOM")) == 0
+    assert matcher_levelno(level_matcher(20)) == 20
@@ -126,6 +126,17 @@ def test_matcher_logged_reduce_name_str() -> None:
     )
 
 
+def test_matcher_logged_levelno() -> None:
+    assert logged.log(..., "foo bar")._levelno() == 0
+    assert logged.info("foo bar")._levelno() == 20
+    assert logged.log(30, "foo bar")._levelno() == 30
+
+
+def test_composed_logged_levelno() -> None:
+    assert (logged.info("foo") >> logged.debug("bar"))._levelno() == 10
+    assert (logged.warning("foo") & (logged.error("bar") | logged.info("baz")))._levelno() == 20
+
+
 def test_ordered_all_logged_repr() -> None:
     # Composed `Logged` are flattened from the left.
     assert (
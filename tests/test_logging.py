@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Iterator
+from contextvars import copy_context
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue, SimpleQueue
+from threading import Thread
+from typing import Any, Callable
+
+import pytest
 
 from logot import Logot, logged
+from logot.logging import LoggingCapturer, PersistentLoggingCapturer
 from tests import ExampleException
 
 logger = logging.getLogger(__name__)
@@ -96,3 +107,293 @@ def test_capture_exc_info_exception(logot: Logot) -> None:
 def test_capture_name(logot: Logot) -> None:
     logger.info("foo bar")
     logot.assert_logged(logged.info("foo bar", name=__name__))
+
+
+def run_thread(target: Callable[[], object]) -> None:
+    thread = Thread(target=target)
+    thread.start()
+    thread.join()
+
+
+def test_persistent_capturing_scoped() -> None:
+    try:
+        with Logot(capturer=partial(PersistentLoggingCapturer, scoped=True)).capturing(name=__name__) as logot:
+            logger.info("foo bar")
+            # Logs from other execution contexts are not captured.
+            run_thread(partial(logger.info, "foo baz"))
+            # Logs from copies of the execution context are captured.
+            run_thread(partial(copy_context().run, logger.info, "foo qux"))
+            logot.assert_logged(logged.info("foo bar") >> logged.info("foo qux"))
+            logot.assert_not_logged(logged.info("foo baz"))
+        # Ensure log capturing is disabled.
+        run_thread(partial(copy_context().run, logger.info, "foo bar"))
+        logot.assert_not_logged(logged.info("foo bar"))
+    finally:
+        PersistentLoggingCapturer.uninstall()
+
+
+def test_persistent_capturing_scoped_concurrent() -> None:
+    async def scenario(n: int) -> None:
+        with Logot(capturer=partial(PersistentLoggingCapturer, scoped=True)).capturing(name=__name__) as logot:
+            for _ in range(10):
+                logger.info("foo %s", n)
+                await asyncio.sleep(0)
+            # Concurrent tasks only capture their own logs.
+            for _ in range(10):
+                logot.assert_logged(logged.info(f"foo {n}"))
+            logot.assert_not_logged(logged.info("foo %d"))
+
+    async def main() -> None:
+        await asyncio.gather(scenario(1), scenario(2))
+
+    try:
+        asyncio.run(main())
+    finally:
+        PersistentLoggingCapturer.uninstall()
+
+
+@pytest.fixture()
+def persistent_logot() -> Iterator[Logot]:
+    try:
+        yield Logot(capturer=PersistentLoggingCapturer)
+    finally:
+        PersistentLoggingCapturer.uninstall()
+
+
+def test_persistent_capturing(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing(name=__name__) as logot:
+        # Ensure log capturing is enabled.
+        logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar"))
+    # Ensure log capturing is disabled.
+    logger.info("foo bar")
+    logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_persistent_capturing_level_fail(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing(level=logging.INFO, name=__name__) as logot:
+        logger.debug("foo bar")
+        logot.assert_not_logged(logged.debug("foo bar"))
+
+
+def test_persistent_capturing_level_unknown(persistent_logot: Logot) -> None:
+    with pytest.raises(ValueError):
+        persistent_logot.capturing(level="BOOM", name=__name__).__enter__()
+
+
+def test_persistent_capturing_single_handler(persistent_logot: Logot) -> None:
+    handlers = len(logger.handlers)
+    with persistent_logot.capturing(name=__name__):
+        pass
+    # The handler is added once, and kept between captures.
+    assert len(logger.handlers) == handlers + 1
+    with persistent_logot.capturing(name=__name__):
+        assert len(logger.handlers) == handlers + 1
+    PersistentLoggingCapturer.uninstall()
+    assert len(logger.handlers) == handlers
+
+
+def test_persistent_capturing_level_reset(persistent_logot: Logot) -> None:
+    assert logger.level == logging.NOTSET
+    with persistent_logot.capturing(level=logging.INFO, name=__name__):
+        assert logger.level == logging.INFO
+        with Logot(capturer=PersistentLoggingCapturer).capturing(level=logging.DEBUG, name=__name__):
+            assert logger.level == logging.DEBUG
+    # The logger level is kept between captures.
+    assert logger.level == logging.DEBUG
+    # When the capturer is uninstalled, the logging verbosity is restored.
+    PersistentLoggingCapturer.uninstall()
+    assert logger.level == logging.NOTSET
+
+
+def test_persistent_capturing_level_cache(persistent_logot: Logot, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+    clear_cache = logging.Logger.manager._clear_cache  # type: ignore[attr-defined]
+
+    def counting_clear_cache() -> None:
+        nonlocal calls
+        calls += 1
+        clear_cache()
+
+    monkeypatch.setattr(logging.Logger.manager, "_clear_cache", counting_clear_cache)
+    for _ in range(10):
+        with persistent_logot.capturing(level=logging.DEBUG, name=__name__) as logot:
+            logger.debug("foo bar")
+            logot.assert_logged(logged.debug("foo bar"))
+    # The logger level is only set once, clearing the logger cache once.
+    assert calls == 1
+    PersistentLoggingCapturer.uninstall()
+    assert calls == 2
+
+
+def test_persistent_capturing_level_unchanged(persistent_logot: Logot, monkeypatch: pytest.MonkeyPatch) -> None:
+    logger.setLevel(logging.INFO)
+    try:
+        # The logger level is already verbose enough, so is not set again.
+        monkeypatch.setattr(logger, "setLevel", None)
+        with persistent_logot.capturing(level=logging.WARNING, name=__name__):
+            pass
+        monkeypatch.undo()
+        assert logger.level == logging.INFO
+    finally:
+        logger.setLevel(logging.NOTSET)
+
+
+def test_persistent_capturing_level_root(persistent_logot: Logot) -> None:
+    root_logger = logging.getLogger()
+    levelno = root_logger.level
+    with persistent_logot.capturing(level=logging.DEBUG):
+        assert root_logger.level == logging.DEBUG
+    PersistentLoggingCapturer.uninstall()
+    assert root_logger.level == levelno
+
+
+def test_persistent_capturing_multiple(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing(level=logging.INFO, name=__name__) as logot_1:
+        with Logot(capturer=PersistentLoggingCapturer).capturing(name=__name__) as logot_2:
+            logger.debug("foo bar")
+            logot_1.assert_not_logged(logged.debug("foo bar"))
+            logot_2.assert_logged(logged.debug("foo bar"))
+
+
+def test_capturing_multiple_names() -> None:
+    names = [f"{__name__}.db", f"{__name__}.http", f"{__name__}.worker"]
+    with Logot().capturing(name=names, exclude=[f"{__name__}.http.access"]) as logot:
+        # A single handler is added to each logger.
+        assert all(len(logging.getLogger(name).handlers) == 1 for name in names)
+        logging.getLogger(f"{__name__}.db").info("foo bar")
+        logging.getLogger(f"{__name__}.worker.tasks").info("foo baz")
+        logging.getLogger(f"{__name__}.http.access").info("foo qux")
+        logger.info("foo qux")
+        logot.assert_logged(logged.info("foo bar") >> logged.info("foo baz"))
+        logot.assert_not_logged(logged.info("foo qux"))
+    assert not any(logging.getLogger(name).handlers for name in names)
+    assert all(logging.getLogger(name).level == logging.NOTSET for name in names)
+
+
+def test_capturing_shared_handler() -> None:
+    logot_a = Logot()
+    logot_b = Logot()
+    with logot_a.capturing(name=__name__), logot_b.capturing(name=__name__, level=logging.INFO):
+        # A single handler is shared by all captures from the same logger.
+        assert len(logger.handlers) == 1
+        assert logger.handlers[0].level == logging.DEBUG
+        logger.debug("foo bar")
+        logger.info("foo baz")
+        logot_a.assert_logged(logged.debug("foo bar") >> logged.info("foo baz"))
+        logot_b.assert_logged(logged.info("foo baz"))
+        logot_b.assert_not_logged(logged.debug("foo bar"))
+        with logot_b.capturing(name=__name__, level=logging.WARNING):
+            pass
+        # The same log is converted once, and captured by all `Logot` instances.
+        logger.info("foo qux")
+        assert logot_a._queue[0] is logot_b._queue[0]
+    # The handler is removed once nothing is capturing.
+    assert not logger.handlers
+
+
+def test_capturing_exclude() -> None:
+    with Logot().capturing(exclude=[f"{__name__}.noisy"]) as logot:
+        logger.info("foo bar")
+        logging.getLogger(f"{__name__}.noisy").info("foo baz")
+        logot.assert_logged(logged.info("foo bar"))
+        logot.assert_not_logged(logged.info("foo baz"))
+
+
+def test_capturing_multiple_names_unsupported() -> None:
+    with pytest.raises(TypeError) as ex:
+        Logot(capturer=PersistentLoggingCapturer).capturing(name=["foo", "bar"])
+    assert str(ex.value) == "PersistentLoggingCapturer does not support multiple names or exclude"
+
+
+@pytest.fixture()
+def queue_logger() -> Iterator[logging.Logger]:
+    queue_logger = logging.getLogger(f"{__name__}.queue")
+    queue_logger.propagate = False
+    try:
+        yield queue_logger
+    finally:
+        queue_logger.handlers.clear()
+        queue_logger.propagate = True
+        queue_logger.setLevel(logging.NOTSET)
+
+
+def start_listener(queue_logger: logging.Logger, queue: Any) -> QueueListener:
+    queue_logger.addHandler(QueueHandler(queue))
+    listener = QueueListener(queue)
+    listener.start()
+    return listener
+
+
+def test_listener_capturing(queue_logger: logging.Logger) -> None:
+    queue: Queue[logging.LogRecord] = Queue()
+    listener = start_listener(queue_logger, queue)
+    try:
+        with Logot(capturer=partial(LoggingCapturer, listener=listener)).capturing() as logot:
+            for _ in range(100):
+                queue_logger.info("foo bar")
+            # The listener queue is drained before asserting.
+            logot.assert_logged(logged.info("foo bar"))
+            assert queue.empty()
+        assert listener.handlers == ()
+        # Ensure log capturing is disabled.
+        logot.clear()
+        queue_logger.info("foo bar")
+    finally:
+        listener.stop()
+    logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_listener_capturing_name_fail(queue_logger: logging.Logger) -> None:
+    listener = start_listener(queue_logger, Queue())
+    try:
+        with Logot(capturer=partial(LoggingCapturer, listener=listener)).capturing(name="boom") as logot:
+            queue_logger.info("foo bar")
+            logot.assert_not_logged(logged.info("foo bar"))
+    finally:
+        listener.stop()
+
+
+def test_listener_capturing_multiple_names(queue_logger: logging.Logger) -> None:
+    listener = start_listener(queue_logger, Queue())
+    try:
+        with Logot(capturer=partial(LoggingCapturer, listener=listener)).capturing(
+            name=["boom", queue_logger.name]
+        ) as logot:
+            queue_logger.info("foo bar")
+            logot.assert_logged(logged.info("foo bar"))
+    finally:
+        listener.stop()
+
+
+def test_listener_capturing_level_fail(queue_logger: logging.Logger) -> None:
+    queue_logger.setLevel(logging.DEBUG)
+    listener = start_listener(queue_logger, Queue())
+    try:
+        with Logot(capturer=partial(LoggingCapturer, listener=listener)).capturing(level=logging.INFO) as logot:
+            queue_logger.debug("foo bar")
+            logot.assert_not_logged(logged.debug("foo bar"))
+    finally:
+        listener.stop()
+
+
+def test_listener_capturing_stopped(queue_logger: logging.Logger) -> None:
+    queue: Queue[logging.LogRecord] = Queue()
+    listener = start_listener(queue_logger, queue)
+    listener.stop()
+    with Logot(capturer=partial(LoggingCapturer, listener=listener)).capturing() as logot:
+        queue_logger.info("foo bar")
+        # Flushing a stopped listener does not block.
+        logot.assert_not_logged(logged.info("foo bar"))
+    assert not queue.empty()
+
+
+def test_listener_capturing_no_join(queue_logger: logging.Logger) -> None:
+    listener = start_listener(queue_logger, SimpleQueue())
+    try:
+        with Logot(capturer=partial(LoggingCapturer, listener=listener)).capturing() as logot:
+            queue_logger.info("foo bar")
+            # Queues without `join()` cannot be flushed.
+            logot.wait_for(logged.info("foo bar"))
+    finally:
+        listener.stop()
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import gc
+import logging
+import weakref
+
 import pytest
 
-from logot import Captured, Logot, logged
-from tests import lines
+from logot import Captured, Capturer, ExcSnapshot, Logot, logged
+from logot._capture import msg_equals
+from tests import ExampleException, lines
 
 
 def test_assert_logged_pass(logot: Logot) -> None:
@@ -44,6 +49,269 @@ def test_clear(logot: Logot) -> None:
     logot.assert_not_logged(logged.info("foo bar"))
 
 
+def test_record_retention_none() -> None:
+    logot = Logot(record_retention="none")
+    captured = Captured("INFO", "foo bar", record=object())
+    logot.capture(captured)
+    # The record is dropped, without changing the original captured log.
+    assert logot._queue[0].record is ...
+    assert captured.record is not ...
+    logot.assert_logged(logged.info("foo bar"))
+
+
+def test_record_retention_none_no_record() -> None:
+    logot = Logot(record_retention="none")
+    captured = Captured("INFO", "foo bar")
+    logot.capture(captured)
+    assert logot._queue[0] is captured
+
+
+class IdentityException(Exception):
+    pass
+
+
+class Marker:
+    pass
+
+
+def capture_exception(logot: Logot) -> weakref.ref[Marker]:
+    # Return a weak reference to a local variable, which is only kept alive by the exception traceback.
+    marker = Marker()
+    try:
+        raise ExampleException("foo")
+    except ExampleException as ex:
+        logot.capture(Captured("ERROR", "foo bar", exc_info=ex))
+    return weakref.ref(marker)
+
+
+def test_exc_info_retention_full() -> None:
+    logot = Logot()
+    marker_ref = capture_exception(logot)
+    gc.collect()
+    assert marker_ref() is not None
+    logot.assert_logged(logged.error("foo bar", exc_info=True))
+
+
+def test_exc_info_retention_snapshot() -> None:
+    logot = Logot(exc_info_retention="snapshot")
+    marker_ref = capture_exception(logot)
+    # The exception traceback is released, including local variables.
+    gc.collect()
+    assert marker_ref() is None
+    logot.assert_logged(logged.error("foo bar", exc_info=True))
+
+
+def test_exc_info_retention_snapshot_match() -> None:
+    logot = Logot(exc_info_retention="snapshot")
+    ex = ExampleException("foo")
+    logot.capture(Captured("ERROR", "foo bar", exc_info=ex))
+    assert isinstance(logot._queue[0].exc_info, ExcSnapshot)
+    logot.assert_logged(logged.error("foo bar", exc_info=ex))
+
+
+def test_exc_info_retention_snapshot_reraise() -> None:
+    logger = logging.getLogger("logot")
+
+    def log_and_reraise() -> None:
+        try:
+            raise IdentityException("foo")
+        except IdentityException:
+            logger.exception("failed")
+            raise
+
+    with Logot(exc_info_retention="snapshot").capturing() as logot:
+        with pytest.raises(IdentityException) as ex:
+            log_and_reraise()
+        logot.assert_logged(logged.error("failed", exc_info=ex.value))
+
+
+def test_max_msg_len() -> None:
+    logot = Logot(max_msg_len=5)
+    logot.capture(Captured("INFO", "foo bar"))
+    assert logot._queue[0].msg == "foo b"
+    logot.assert_logged(logged.info("foo bar"))
+
+
+def test_max_msg_len_fail() -> None:
+    logot = Logot(max_msg_len=5)
+    logot.capture(Captured("INFO", "foo bar"))
+    logot.capture(Captured("INFO", "foo baz"))
+    logot.assert_not_logged(logged.info("foo b"))
+    logot.assert_not_logged(logged.info("foo bax"))
+
+
+def test_max_msg_len_pattern() -> None:
+    logot = Logot(max_msg_len=5)
+    logot.capture(Captured("INFO", "foo bar"))
+    # Message patterns only match the truncated message.
+    logot.assert_logged(logged.info("foo %s"))
+
+
+def test_max_msg_len_compare() -> None:
+    logot = Logot(max_msg_len=5)
+    for msg in ("foo bar", "foo bar", "foo baz"):
+        logot.capture(Captured("INFO", msg, record=object()))
+    msg_a, msg_b, msg_c = (captured.msg for captured in logot._queue)
+    assert msg_equals(msg_a, msg_b)
+    assert not msg_equals(msg_a, msg_c)
+    assert msg_equals("foo bar", msg_a)
+    assert not msg_equals("foo b", msg_a)
+    # Truncated messages otherwise behave as the truncated `str`, keeping the `__eq__()` and `__hash__()` contract.
+    assert msg_a == msg_c == "foo b"
+    assert hash(msg_a) == hash(msg_c) == hash("foo b")
+
+
+def test_max_msg_len_repeats() -> None:
+    logot = Logot(max_msg_len=5)
+    for msg in ("foo bar", "foo bar", "foo baz"):
+        logot.capture(Captured("INFO", msg))
+    # Truncated messages are only repeats if their full messages are equal.
+    assert len(logot._queue) == 2
+    logot.assert_logged(logged.info("foo bar") >> logged.info("foo bar") >> logged.info("foo baz"))
+
+
+def test_repeats() -> None:
+    logot = Logot()
+    for _ in range(5):
+        logot.capture(Captured("INFO", "foo bar"))
+    # Repeated logs are counted, rather than buffered again.
+    assert len(logot._queue) == 1
+    logot.assert_logged(logged.info("foo bar") >> logged.info("foo bar"))
+    assert list(logot._counts) == [3]
+    logot.assert_logged(logged.info("foo bar") >> logged.info("foo bar") >> logged.info("foo bar"))
+    logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_repeats_skipped() -> None:
+    logot = Logot()
+    for msg in ("foo bar", "foo bar", "foo bar", "foo baz"):
+        logot.capture(Captured("INFO", msg))
+    logot.assert_logged(logged.info("foo bar") >> logged.info("foo baz"))
+    assert not logot._queue
+
+
+def test_repeats_record() -> None:
+    logot = Logot()
+    logot.capture(Captured("INFO", "foo bar", record=object()))
+    logot.capture(Captured("INFO", "foo bar", record=object()))
+    # Logs with underlying log records are never repeats, since custom matchers can tell them apart.
+    assert len(logot._queue) == 2
+
+
+def test_repeats_exc_info() -> None:
+    logot = Logot()
+    logot.capture(Captured("INFO", "foo bar", exc_info=ExampleException("foo")))
+    logot.capture(Captured("INFO", "foo bar", exc_info=ExampleException("foo")))
+    assert len(logot._queue) == 2
+
+
+def test_repeats_clear() -> None:
+    logot = Logot()
+    logot.capture(Captured("INFO", "foo bar"))
+    logot.capture(Captured("INFO", "foo bar"))
+    logot.clear()
+    assert not logot._counts
+    logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_max_buffered() -> None:
+    logot = Logot(max_buffered=2)
+    for n in range(5):
+        logot.capture(Captured("INFO", f"foo {n}", levelno=logging.INFO, name="logot", record=object()))
+    # Older logs are spilled to disk.
+    assert len(logot._queue) == 2
+    logot.assert_logged(logged.info("foo 1", name="logot") >> logged.info("foo 4"))
+    logot.assert_not_logged(logged.info("foo %d"))
+
+
+def test_max_buffered_interleaved() -> None:
+    logot = Logot(max_buffered=1)
+    for msg in ("foo bar", "foo bar", "foo bar", "foo baz", "foo qux"):
+        logot.capture(Captured("INFO", msg))
+    # Partly consumed repeats of a spilled log stay spilled.
+    logot.assert_logged(logged.info("foo bar"))
+    logot.capture(Captured("INFO", "foo quux"))
+    logot.assert_logged(logged.info("foo bar") >> logged.info("foo bar") >> logged.info("foo baz"))
+    logot.capture(Captured("INFO", "foo corge"))
+    logot.assert_logged(logged.info("foo qux") >> logged.info("foo quux") >> logged.info("foo corge"))
+
+
+def test_max_buffered_exc_info() -> None:
+    logot = Logot(max_buffered=1)
+    ex = ExampleException("foo")
+    logot.capture(Captured("ERROR", "foo bar", exc_info=ex))
+    logot.capture(Captured("INFO", "foo baz"))
+    # Logs that cannot be encoded are kept in memory.
+    logot.assert_logged(logged.error("foo bar", exc_info=ex) >> logged.info("foo baz"))
+
+
+def test_max_buffered_clear() -> None:
+    logot = Logot(max_buffered=1)
+    for msg in ("foo bar", "foo baz", "foo qux"):
+        logot.capture(Captured("INFO", msg))
+    logot.assert_logged(logged.info("foo bar"))
+    logot.clear()
+    assert logot._spill is None
+    logot.assert_not_logged(logged.info("foo baz"))
+
+
+def test_capturing_sample() -> None:
+    sample_logger = logging.getLogger("logot.sample")
+    with Logot().capturing(name="logot.sample", sample={"DEBUG": 0.25, logging.INFO: 0.5}) as logot:
+        for n in range(8):
+            sample_logger.debug("foo %d", n)
+            sample_logger.info("bar %d", n)
+            sample_logger.warning("baz %d", n)
+        # Sampling is deterministic, with exact level counts.
+        assert [captured.msg for captured in logot._queue] == [
+            *("baz 0", "bar 1", "baz 1", "baz 2", "foo 3", "bar 3", "baz 3"),
+            *("baz 4", "bar 5", "baz 5", "baz 6", "foo 7", "bar 7", "baz 7"),
+        ]
+        assert logot.level_counts() == {"DEBUG": 8, "INFO": 8, "WARNING": 8}
+
+
+def test_capturing_sample_names() -> None:
+    with Logot().capturing(name="logot.sample", sample={"INFO": 0.5}) as logot:
+        # Each logger is sampled separately.
+        logging.getLogger("logot.sample.a").info("foo bar")
+        logging.getLogger("logot.sample.b").info("foo bar")
+        logging.getLogger("logot.sample.a").info("foo baz")
+        logging.getLogger("logot.sample.b").info("foo baz")
+        logot.assert_logged(
+            logged.info("foo baz", name="logot.sample.a") >> logged.info("foo baz", name="logot.sample.b")
+        )
+        logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_capturing_sample_proxy() -> None:
+    proxies: list[Logot] = []
+
+    class ProxyCapturer(Capturer):
+        def start_capturing(self, logot: Logot, /, **kwargs: object) -> None:
+            proxies.append(logot)
+
+        def stop_capturing(self) -> None:
+            pass
+
+    with Logot(capturer=ProxyCapturer, timeout=9.0).capturing(sample={"INFO": 0.5}) as logot:
+        (proxy,) = proxies
+        proxy.capture(Captured("INFO", "foo bar"))
+        proxy.capture(Captured("INFO", "foo bar"))
+        # Methods other than `capture()` act on the wrapped `Logot`.
+        assert proxy.timeout == 9.0
+        assert proxy.level_counts() == logot.level_counts() == {"INFO": 2}
+        proxy.assert_logged(logged.info("foo bar"))
+        logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_level_counts_clear() -> None:
+    logot = Logot()
+    logot.capture(Captured("INFO", "foo bar"))
+    assert logot.level_counts() == {"INFO": 1}
+    logot.clear()
+    assert logot.level_counts() == {}
+
+
 def test_repr(logot: Logot) -> None:
     assert (
         repr(logot)
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import multiprocessing
+from collections.abc import Iterator
+from functools import partial
 from typing import Callable
 
 import pytest
 from loguru import logger
 
 from logot import Logot, logged
-from logot.loguru import LoguruCapturer
+from logot.loguru import LoguruCapturer, PersistentLoguruCapturer
 from tests import ExampleException
 
 
@@ -31,6 +34,18 @@ def test_capturing_level_pass() -> None:
         logot.assert_logged(logged.info("foo bar"))
 
 
+def test_capturing_multiple_names() -> None:
+    with Logot(capturer=LoguruCapturer).capturing(name=["boom", "tests"], exclude=[f"{__name__}.boom"]) as logot:
+        logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar"))
+
+
+def test_capturing_exclude() -> None:
+    with Logot(capturer=LoguruCapturer).capturing(exclude=[__name__]) as logot:
+        logger.info("foo bar")
+        logot.assert_not_logged(logged.info("foo bar"))
+
+
 def test_capturing_level_fail() -> None:
     with Logot(capturer=LoguruCapturer).capturing(level="INFO") as logot:
         logger.debug("foo bar")
@@ -89,3 +104,90 @@ def test_capture_exc_info_exception(logot: Logot) -> None:
 def test_capture_name(logot: Logot) -> None:
     logger.info("foo bar")
     logot.assert_logged(logged.info("foo bar", name=__name__))
+
+
+@pytest.fixture()
+def persistent_logot() -> Iterator[Logot]:
+    try:
+        yield Logot(capturer=PersistentLoguruCapturer)
+    finally:
+        PersistentLoguruCapturer.uninstall()
+
+
+def test_persistent_capturing(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing() as logot:
+        # Ensure log capturing is enabled.
+        logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar"))
+    # Ensure log capturing is disabled.
+    logger.info("foo bar")
+    logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_persistent_capturing_level_pass(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing(level=20) as logot:
+        logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar"))
+
+
+def test_persistent_capturing_level_fail(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing(level="INFO") as logot:
+        logger.debug("foo bar")
+        logot.assert_not_logged(logged.debug("foo bar"))
+
+
+def test_persistent_capturing_name_prefix_pass(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing(name="tests") as logot:
+        logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar"))
+
+
+def test_persistent_capturing_name_fail(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing(name="boom") as logot:
+        logger.info("foo bar")
+        logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_persistent_capturing_single_sink(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing():
+        pass
+    add = logger.add
+    try:
+        # The sink is added once, and kept between captures.
+        logger.add = None  # type: ignore[assignment]
+        with persistent_logot.capturing() as logot:
+            logger.info("foo bar")
+            logot.assert_logged(logged.info("foo bar"))
+    finally:
+        logger.add = add  # type: ignore[method-assign]
+
+
+def test_persistent_capturing_sink_level(persistent_logot: Logot) -> None:
+    add = logger.add
+    levels: list[int] = []
+    try:
+        logger.add = lambda *args, **kwargs: levels.append(kwargs["level"]) or add(*args, **kwargs)  # type: ignore
+        # The sink is added at the capture level.
+        with persistent_logot.capturing(level="INFO"):
+            pass
+        # The sink is not re-added for a higher level.
+        with persistent_logot.capturing(level="WARNING"):
+            pass
+        # The sink is re-added for a lower level.
+        with persistent_logot.capturing(level="DEBUG") as logot:
+            logger.debug("foo bar")
+            logot.assert_logged(logged.debug("foo bar"))
+    finally:
+        logger.add = add  # type: ignore[method-assign]
+    assert levels == [20, 10]
+
+
+def test_persistent_capturing_enqueue() -> None:
+    try:
+        with Logot(capturer=partial(PersistentLoguruCapturer, enqueue=True)).capturing() as logot:
+            process = multiprocessing.get_context("fork").Process(target=logger.info, args=("foo bar",))
+            process.start()
+            process.join()
+            logot.assert_logged(logged.info("foo bar"))
+    finally:
+        PersistentLoguruCapturer.uninstall()
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import copy
+import logging
+import multiprocessing
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pytest
+
+from logot import Logot, logged
+from logot._multiprocessing import _after_fork_in_child, _ChildHandler, _RingBuffer
+from logot.multiprocessing import MultiprocessingCapturer
+from tests import ExampleException
+
+logger = logging.getLogger(__name__)
+
+
+class UnpicklableException(Exception):
+    def __reduce__(self) -> str | tuple[object, ...]:
+        raise TypeError("Unpicklable")
+
+
+def log_exception(exception: Exception) -> None:
+    try:
+        raise exception
+    except Exception:
+        logger.exception("foo bar")
+
+
+@pytest.fixture()
+def capturer() -> MultiprocessingCapturer:
+    return MultiprocessingCapturer()
+
+
+@pytest.fixture()
+def logot(capturer: MultiprocessingCapturer) -> Iterator[Logot]:
+    with Logot(capturer=lambda: capturer).capturing(name=__name__) as logot:
+        yield logot
+
+
+@pytest.fixture()
+def ring() -> Iterator[_RingBuffer]:
+    ring = _RingBuffer.create(64)
+    try:
+        yield ring
+    finally:
+        ring.unlink()
+
+
+def remove_child_handlers() -> None:
+    for handler in logger.handlers[:]:
+        if isinstance(handler, _ChildHandler):
+            logger.removeHandler(handler)
+
+
+def test_capturing() -> None:
+    with Logot(capturer=MultiprocessingCapturer).capturing(name=__name__) as logot:
+        # Ensure log capturing is enabled.
+        logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar"))
+        # The logger will have been overridden for the required verbosity.
+        assert logger.level == logging.DEBUG
+    # Ensure log capturing is disabled.
+    logger.info("foo bar")
+    logot.assert_not_logged(logged.info("foo bar"))
+    assert logger.level == logging.NOTSET
+
+
+def test_capturing_level_fail() -> None:
+    with Logot(capturer=MultiprocessingCapturer).capturing(level="INFO", name=__name__) as logot:
+        logger.debug("foo bar")
+        logot.assert_not_logged(logged.debug("foo bar"))
+
+
+def test_capturing_fork() -> None:
+    with Logot(capturer=MultiprocessingCapturer).capturing(name=__name__) as logot:
+        process = multiprocessing.get_context("fork").Process(target=logger.info, args=("foo bar",))
+        process.start()
+        process.join()
+        logot.assert_logged(logged.info("foo bar", name=__name__))
+
+
+def test_capturing_fork_exc_info() -> None:
+    with Logot(capturer=MultiprocessingCapturer).capturing(name=__name__) as logot:
+        process = multiprocessing.get_context("fork").Process(target=log_exception, args=(ExampleException("foo"),))
+        process.start()
+        process.join()
+        logot.assert_logged(logged.error("foo bar", exc_info=ExampleException("foo")))
+
+
+def test_capturing_spawn() -> None:
+    with Logot(capturer=MultiprocessingCapturer).capturing(name=__name__) as logot:
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=MultiprocessingCapturer.initializer,
+            initargs=MultiprocessingCapturer.initargs(),
+        ) as executor:
+            executor.submit(logger.warning, "foo bar").result()
+        logot.assert_logged(logged.warning("foo bar"))
+
+
+def test_after_fork_in_child(capturer: MultiprocessingCapturer, logot: Logot) -> None:
+    # Simulate a fork in the current process.
+    _after_fork_in_child()
+    try:
+        logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar"))
+        logot.assert_not_logged(logged.info("foo bar"))
+    finally:
+        remove_child_handlers()
+        MultiprocessingCapturer._active.append(capturer)
+
+
+def test_initializer(logot: Logot) -> None:
+    MultiprocessingCapturer.initializer(*MultiprocessingCapturer.initargs())
+    try:
+        logger.info("foo bar")
+        # Logged by both the parent and child handlers.
+        logot.assert_logged(logged.info("foo bar") >> logged.info("foo bar"))
+    finally:
+        remove_child_handlers()
+
+
+def test_initializer_exc_info(capturer: MultiprocessingCapturer, logot: Logot) -> None:
+    _after_fork_in_child()
+    try:
+        log_exception(ExampleException("foo"))
+        log_exception(UnpicklableException("foo"))
+        logot.assert_logged(logged.error("foo bar", exc_info=ExampleException("foo")))
+        # Unpicklable exceptions can still be matched.
+        logot.assert_logged(logged.error("foo bar", exc_info=True))
+    finally:
+        remove_child_handlers()
+        MultiprocessingCapturer._active.append(capturer)
+
+
+def test_initializer_level(ring: _RingBuffer) -> None:
+    child_logger = logging.getLogger(f"{__name__}.child")
+    MultiprocessingCapturer.initializer((ring, logging.DEBUG, child_logger.name))
+    try:
+        # The logger will have been overridden for the required verbosity.
+        assert child_logger.level == logging.DEBUG
+    finally:
+        child_logger.handlers.clear()
+        child_logger.setLevel(logging.NOTSET)
+
+
+def test_initargs_empty() -> None:
+    assert MultiprocessingCapturer.initargs() == ()
+
+
+def test_ring_buffer_wrap(ring: _RingBuffer) -> None:
+    for n in range(10):
+        assert ring.write(b"foo bar %d" % n)
+        assert ring.write(b"baz %d" % n)
+        assert ring.read() == [b"foo bar %d" % n, b"baz %d" % n]
+
+
+def test_ring_buffer_full(ring: _RingBuffer) -> None:
+    assert ring.write(b"x" * 30)
+    # Records are dropped when the ring buffer stays full.
+    assert ring.write(b"x" * 30, timeout=0.01)
+    assert ring.read() == [b"x" * 30]
+    assert ring.dropped == 1
+
+
+def test_ring_buffer_too_large(ring: _RingBuffer) -> None:
+    # Records that can never fit are dropped.
+    assert ring.write(b"x" * 64)
+    assert ring.read() == []
+    assert ring.dropped == 1
+
+
+def test_ring_buffer_closed(ring: _RingBuffer) -> None:
+    ring.close()
+    assert not ring.write(b"foo bar")
+
+
+def test_ring_buffer_copy(ring: _RingBuffer) -> None:
+    # Copying attaches to the same shared memory, as when unpickling in a child process.
+    ring_copy = copy.copy(ring)
+    assert ring_copy.write(b"foo bar")
+    assert ring.read() == [b"foo bar"]
+
+
+def test_child_handler_closed(ring: _RingBuffer) -> None:
+    ring.close()
+    logger.addHandler(_ChildHandler(logging.DEBUG, ring, logger))
+    # The child handler removes itself once capturing stops.
+    logger.warning("foo bar")
+    assert not logger.handlers
+
+
+def test_child_handler_closed_propagated(ring: _RingBuffer) -> None:
+    ring.close()
+    logger.addHandler(_ChildHandler(logging.DEBUG, ring, logger))
+    # The child handler removes itself from its own logger, not the logger of a propagated record.
+    logging.getLogger(f"{__name__}.child").warning("foo bar")
+    assert not logger.handlers
+
+
+def test_capturing_dropped() -> None:
+    with pytest.warns(RuntimeWarning, match=r"^Dropped 1 log\(s\) from child processes"):
+        with Logot(capturer=partial(MultiprocessingCapturer, size=64)).capturing(name=__name__) as logot:
+            process = multiprocessing.get_context("fork").Process(target=logger.info, args=("x" * 64,))
+            process.start()
+            process.join()
+            logot.assert_not_logged(logged.info("x" * 64))
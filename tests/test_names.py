@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from logot._names import NameFilter
+
+
+def test_roots() -> None:
+    assert NameFilter(["worker", "app.http", "app", "app.db"], ()).roots == ("app", "worker")
+    assert NameFilter(["app", None], ["app.db"]).roots == (None,)
+
+
+def test_accepts() -> None:
+    name_filter = NameFilter(["app", "worker"], ["app.db"])
+    assert name_filter.accepts("app")
+    assert name_filter.accepts("app.http")
+    assert name_filter.accepts("worker.tasks")
+    assert not name_filter.accepts("app.db")
+    assert not name_filter.accepts("app.db.pool")
+    assert not name_filter.accepts("application")
+    assert not name_filter.accepts("root")
+    assert not name_filter.accepts(None)
+
+
+def test_accepts_nested() -> None:
+    # The most specific name decides.
+    name_filter = NameFilter(["app", "app.db.slow"], ["app.db"])
+    assert name_filter.accepts("app.http")
+    assert not name_filter.accepts("app.db")
+    assert name_filter.accepts("app.db.slow")
+    assert name_filter.accepts("app.db.slow.queries")
+
+
+def test_accepts_root() -> None:
+    name_filter = NameFilter([None], ["noisy"])
+    assert name_filter.accepts(None)
+    assert name_filter.accepts("root")
+    assert name_filter.accepts("app")
+    assert not name_filter.accepts("noisy")
+    assert not name_filter.accepts("noisy.child")
+
+
+def test_accepts_cached() -> None:
+    name_filter = NameFilter(["app"], ())
+    assert name_filter.accepts("app.db")
+    assert name_filter._cache == {"app.db": True}
+    assert name_filter.accepts("app.db")
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import io
+import logging
+import unittest
+from logging.handlers import MemoryHandler
+
+import pytest
+
+from logot import Captured, Logot, logged
+from logot._profiling import active
+from logot.profiling import LoggingProfiler, ReductionProfiler
+from logot.unittest import LogotTestCase
+
+HANDLE = logging.Handler.handle
+
+
+def test_profiler() -> None:
+    logot = Logot()
+    logot.capture(Captured("DEBUG", "foo bar"))
+    logot.capture(Captured("INFO", "foo baz"))
+    with ReductionProfiler() as profiler:
+        logot.assert_logged(logged.info("foo %s"))
+    # The log pattern tested both captured logs, matching the second.
+    (pattern,) = profiler.patterns
+    assert (pattern.label, pattern.calls, pattern.hits) == ("[INFO] foo %s", 2, 1)
+    assert pattern.seconds > 0.0
+    # The level matcher rejected the first captured log, so the message matcher was only tested once.
+    matchers = {entry.label: (entry.calls, entry.hits) for entry in profiler.matchers}
+    assert matchers == {
+        "LevelNameMatcher 'INFO'": (2, 1),
+        "MessagePatternMatcher 'foo %s'": (1, 1),
+    }
+
+
+def test_profiler_sorted() -> None:
+    logot = Logot()
+    with ReductionProfiler() as profiler:
+        for n in range(10):
+            logot.capture(Captured("INFO", f"foo {n}"))
+            logot.assert_logged(logged.info(f"foo {n}"))
+    patterns = profiler.patterns
+    assert len(patterns) == 10
+    assert [entry.seconds for entry in patterns] == sorted((entry.seconds for entry in patterns), reverse=True)
+
+
+def test_profiler_repeated() -> None:
+    logot = Logot()
+    with ReductionProfiler() as profiler:
+        for _ in range(5):
+            logot.capture(Captured("INFO", "foo bar"))
+            logot.assert_logged(logged.info("foo bar"))
+    # Equal log patterns and matchers share stats.
+    (pattern,) = profiler.patterns
+    assert (pattern.label, pattern.calls, pattern.hits) == ("[INFO] foo bar", 5, 5)
+    assert len(profiler.matchers) == 2
+
+
+def test_profiler_inactive() -> None:
+    logot = Logot()
+    logot.capture(Captured("INFO", "foo bar"))
+    with ReductionProfiler() as profiler:
+        pass
+    logot.assert_logged(logged.info("foo bar"))
+    assert profiler.patterns == []
+    assert active == ()
+
+
+def test_profiler_nested() -> None:
+    logot = Logot()
+    with ReductionProfiler() as outer:
+        logot.capture(Captured("INFO", "foo bar"))
+        with ReductionProfiler() as inner:
+            logot.assert_logged(logged.info("foo bar"))
+        logot.capture(Captured("INFO", "foo baz"))
+        logot.assert_logged(logged.info("foo baz"))
+    assert [entry.label for entry in inner.patterns] == ["[INFO] foo bar"]
+    assert sorted(entry.label for entry in outer.patterns) == ["[INFO] foo bar", "[INFO] foo baz"]
+
+
+def test_profiler_report() -> None:
+    logot = Logot()
+    logot.capture(Captured("INFO", "foo bar"))
+    with ReductionProfiler() as profiler:
+        logot.assert_logged(logged.info("foo bar"))
+    lines = profiler.report().splitlines()
+    assert lines[0] == "Log patterns:"
+    assert lines[1].split() == ["calls", "hits", "total", "(ms)", "per", "call", "(us)", "log", "pattern"]
+    assert lines[2].split()[:2] == ["1", "1"]
+    assert lines[2].endswith("  [INFO] foo bar")
+    assert lines[3] == ""
+    assert lines[4] == "Matchers:"
+    assert len(lines) == 8
+
+
+def test_profiler_report_limit() -> None:
+    logot = Logot()
+    logot.capture(Captured("INFO", "foo bar"))
+    with ReductionProfiler() as profiler:
+        logot.assert_logged(logged.info("foo bar"))
+    assert profiler.report(limit=0).splitlines() == [
+        "Log patterns:",
+        profiler.report().splitlines()[1],
+        "",
+        "Matchers:",
+        profiler.report().splitlines()[5],
+    ]
+
+
+def test_profile_reduction_pytest(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        """
+        import logging
+
+        from logot import logged
+
+        def test_foo(logot):
+            logging.getLogger("logot").warning("foo bar")
+            logot.assert_logged(logged.warning("foo %s"))
+        """
+    )
+    result = pytester.runpytest("--logot-profile-reduction=true")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*logot reduction profile*", "Log patterns:", "*log pattern", "*  ?WARNING? foo %s"])
+
+
+def test_logging_profiler() -> None:
+    logger = logging.getLogger("logot")
+    handler = logging.StreamHandler(io.StringIO())
+    logger.addHandler(handler)
+    try:
+        with LoggingProfiler() as profiler:
+            logger.warning("foo %s", "bar")
+            logger.warning("foo %s", "baz")
+            logger.error("foo %s", "bar")
+    finally:
+        logger.removeHandler(handler)
+    stats = {(entry.name, entry.levelname): entry.records for entry in profiler.stats}
+    assert stats[("logot", "WARNING")] == 2
+    assert stats[("logot", "ERROR")] == 1
+    assert all(entry.seconds > 0.0 for entry in profiler.stats)
+    assert logging.Handler.handle is HANDLE
+
+
+def test_logging_profiler_multiple_handlers() -> None:
+    logger = logging.getLogger("logot")
+    handlers: list[logging.Handler] = [logging.StreamHandler(io.StringIO()) for _ in range(2)]
+    # Handlers called by other handlers are profiled as part of the calling handler.
+    handlers.append(MemoryHandler(capacity=1, target=logging.StreamHandler(io.StringIO())))
+    for handler in handlers:
+        logger.addHandler(handler)
+    try:
+        with LoggingProfiler() as profiler:
+            logger.warning("foo bar")
+    finally:
+        for handler in handlers:
+            logger.removeHandler(handler)
+    # Each record is only counted once.
+    assert [(entry.name, entry.levelname, entry.records) for entry in profiler.stats] == [("logot", "WARNING", 1)]
+
+
+def test_logging_profiler_logot() -> None:
+    logger = logging.getLogger("logot")
+    logger.propagate = False
+    try:
+        with Logot().capturing(name="logot") as logot, LoggingProfiler() as profiler:
+            logger.warning("foo bar")
+    finally:
+        logger.propagate = True
+    logot.assert_logged(logged.warning("foo bar"))
+    # Handlers installed by logot are not profiled.
+    assert profiler.stats == []
+
+
+def test_logging_profiler_nested() -> None:
+    logger = logging.getLogger("logot")
+    handler = logging.StreamHandler(io.StringIO())
+    logger.addHandler(handler)
+    try:
+        with LoggingProfiler() as outer:
+            logger.warning("foo bar")
+            with LoggingProfiler() as inner:
+                logger.warning("foo bar")
+            assert logging.Handler.handle is not HANDLE
+    finally:
+        logger.removeHandler(handler)
+    assert [entry.records for entry in inner.stats] == [1]
+    assert [entry.records for entry in outer.stats] == [2]
+    assert logging.Handler.handle is HANDLE
+
+
+def test_logging_profiler_report() -> None:
+    logger = logging.getLogger("logot")
+    handler = logging.StreamHandler(io.StringIO())
+    logger.addHandler(handler)
+    try:
+        with LoggingProfiler() as profiler:
+            logger.warning("foo bar")
+    finally:
+        logger.removeHandler(handler)
+    lines = profiler.report().splitlines()
+    assert lines[0] == "Logging overhead:"
+    assert lines[1].split() == ["records", "total", "(ms)", "per", "record", "(us)", "level", "logger"]
+    assert lines[2].split()[0] == "1"
+    assert lines[2].split()[-2:] == ["WARNING", "logot"]
+    assert profiler.report(limit=0).splitlines() == lines[:2]
+
+
+def test_logot_profile_pytest(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        """
+        import logging
+
+        def test_foo(logot_profile):
+            logging.getLogger("logot").warning("foo bar")
+            assert [entry.records for entry in logot_profile.stats] == [1]
+        """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*logot logging profile*", "Logging overhead:", "*1 * WARNING  logot"])
+
+
+class TestLogotProfile(LogotTestCase):
+    logot_profile = True
+
+    def test_profile(self) -> None:
+        handler = logging.StreamHandler(io.StringIO())
+        logging.getLogger("logot").addHandler(handler)
+        try:
+            logging.getLogger("logot").warning("foo bar")
+        finally:
+            logging.getLogger("logot").removeHandler(handler)
+        self.logot.assert_logged(logged.warning("foo bar"))
+        assert [(entry.name, entry.records) for entry in self.logot_profiler.stats] == [("logot", 1)]
+
+
+def test_logot_profile_unittest(capsys: pytest.CaptureFixture[str]) -> None:
+    result = unittest.TestResult()
+    unittest.defaultTestLoader.loadTestsFromTestCase(TestLogotProfile).run(result)
+    assert result.wasSuccessful()
+    assert "logot logging profile for TestLogotProfile:\nLogging overhead:\n" in capsys.readouterr().err
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from contextvars import ContextVar
 from shlex import quote
 from typing import Any, Callable
@@ -7,8 +8,9 @@ from typing import Any, Callable
 import pytest
 
 from logot import Capturer, Logot
-from logot._pytest import get_optname, get_qualname
-from logot._typing import Level, Name
+from logot._logging import _PersistentHandler
+from logot._pytest import _common_name, get_optname, get_qualname
+from logot._typing import ExcInfoRetention, Level, Name, RecordRetention
 from logot._wait import AsyncWaiter
 from logot.asyncio import AsyncioWaiter
 from logot.logging import LoggingCapturer
@@ -106,3 +108,346 @@ def test_async_waiter_config_pass(pytester: pytest.Pytester) -> None:
 
 def test_async_waiter_config_fail(pytester: pytest.Pytester) -> None:
     assert_fixture_config(pytester, "async_waiter", "boom!", passed=False)
+
+
+def test_record_retention_default(logot_record_retention: RecordRetention) -> None:
+    assert logot_record_retention == Logot.DEFAULT_RECORD_RETENTION
+
+
+def test_record_retention_config_pass(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "record_retention", "none")
+
+
+def test_record_retention_config_fail(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "record_retention", "boom!", passed=False)
+
+
+def test_exc_info_retention_default(logot_exc_info_retention: ExcInfoRetention) -> None:
+    assert logot_exc_info_retention == Logot.DEFAULT_EXC_INFO_RETENTION
+
+
+def test_exc_info_retention_config_pass(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "exc_info_retention", "snapshot")
+
+
+def test_exc_info_retention_config_fail(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "exc_info_retention", "boom!", passed=False)
+
+
+def test_max_msg_len_default(logot_max_msg_len: int | None) -> None:
+    assert logot_max_msg_len == Logot.DEFAULT_MAX_MSG_LEN
+
+
+def test_max_msg_len_config_pass(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "max_msg_len", "100", expected=100)
+
+
+def test_max_msg_len_config_fail(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "max_msg_len", "-1", passed=False)
+
+
+def test_max_buffered_default(logot_max_buffered: int | None) -> None:
+    assert logot_max_buffered == Logot.DEFAULT_MAX_BUFFERED
+
+
+def test_max_buffered_config_pass(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "max_buffered", "100", expected=100)
+
+
+def test_max_buffered_config_fail(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "max_buffered", "0", passed=False)
+
+
+def test_adaptive_level_default(logot_adaptive_level: bool) -> None:
+    assert logot_adaptive_level is False
+
+
+def test_adaptive_level_config_pass(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "adaptive_level", "true", expected=True)
+
+
+def test_adaptive_level_config_false_pass(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "adaptive_level", "no", expected=False)
+
+
+def test_adaptive_level_config_fail(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "adaptive_level", "boom!", passed=False)
+
+
+def test_capture_report_default(logot_capture_report: int) -> None:
+    assert logot_capture_report == 0
+
+
+def test_capture_report_config_pass(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "capture_report", "10", expected=10)
+
+
+def test_capture_report_config_fail(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "capture_report", "-1", passed=False)
+
+
+def test_capture_report(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        """
+        import logging
+
+        def test_small(logot):
+            logging.warning("foo")
+
+        def test_large(logot):
+            for _ in range(10):
+                logging.warning("foo bar" * 100)
+
+        def test_empty(logot):
+            pass
+        """
+    )
+    result = pytester.runpytest("--logot-capture-report=2")
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(
+        [
+            "*logot capture memory*",
+            "* bytes       10 records  test_capture_report.py::test_large",
+            "* bytes        1 records  test_capture_report.py::test_small",
+        ]
+    )
+    result.stdout.no_fnmatch_line("*test_empty")
+
+
+def test_max_capture_bytes_default(logot_max_capture_bytes: int | None) -> None:
+    assert logot_max_capture_bytes is None
+
+
+def test_measure_bytes_default(logot: Logot) -> None:
+    # Captured log memory is only measured if it is reported or limited.
+    assert not logot.measure_bytes
+
+
+def test_max_capture_bytes_config_pass(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "max_capture_bytes", "1000", expected=1000)
+
+
+def test_max_capture_bytes_config_fail(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "max_capture_bytes", "0", passed=False)
+
+
+def test_max_capture_bytes(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        """
+        import logging
+
+        def test_small(logot):
+            logging.warning("foo")
+
+        def test_large(logot):
+            for _ in range(10):
+                logging.warning("foo bar" * 100)
+        """
+    )
+    result = pytester.runpytest("--logot-max-capture-bytes=5000")
+    result.assert_outcomes(passed=2, errors=1)
+    result.stdout.fnmatch_lines(["*logot captured 10 logs using * bytes, exceeding --logot-max-capture-bytes=5000"])
+    # No report is made unless requested.
+    result.stdout.no_fnmatch_line("*logot capture memory*")
+
+
+def test_usage_report_default(logot_usage_report: bool) -> None:
+    assert logot_usage_report is False
+
+
+def test_usage_report_config_pass(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "usage_report", "true", expected=True)
+
+
+def test_usage_report_config_fail(pytester: pytest.Pytester) -> None:
+    assert_fixture_config(pytester, "usage_report", "boom!", passed=False)
+
+
+def test_usage_report(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        """
+        import logging
+        from logot import logged
+
+        def test_app(logot):
+            for _ in range(3):
+                logging.getLogger("app.db").debug("query")
+            logging.getLogger("app.web").info("request")
+            logot.assert_logged(logged.info("request"))
+
+        def test_app_db(logot):
+            logging.getLogger("app.db").warning("slow query")
+            logot.assert_logged(logged.warning("slow query"))
+
+        def test_unused(logot):
+            logging.getLogger("other").debug("foo")
+        """
+    )
+    result = pytester.runpytest("--logot-usage-report=true")
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(
+        [
+            "*logot capture usage*",
+            "1 of 6 captured logs were never matched against a log pattern.",
+            "*captured*consumed*unused*level*logger",
+            "         1          0  100.0%  DEBUG    other",
+            "*",
+            "*",
+            "*",
+            "Suggested settings: --logot-level=INFO --logot-name=app",
+        ]
+    )
+
+
+def test_usage_report_no_suggestions(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        """
+        import logging
+        from logot import logged
+
+        def test_app(logot):
+            logging.getLogger("app").info("foo")
+            logging.debug("bar")
+            logot.assert_logged(logged.debug("bar"))
+
+        def test_other(logot):
+            pass
+        """
+    )
+    result = pytester.runpytest("--logot-usage-report=true")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["0 of 2 captured logs were never matched against a log pattern."])
+    result.stdout.no_fnmatch_line("Suggested settings:*")
+
+
+def test_usage_report_unknown_level(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        test_app="""
+        from loguru import logger
+        from logot import logged
+
+        def test_app(logot):
+            logger.info("foo bar")
+            logot.assert_logged(logged.info("foo bar"))
+        """
+    )
+    args = ("--logot-usage-report=true", "--logot-level=TRACE", "--logot-capturer=logot.loguru.LoguruCapturer")
+    result = pytester.runpytest(*args)
+    result.assert_outcomes(passed=1)
+    # Unknown levels cannot be compared, so no level is suggested.
+    result.stdout.fnmatch_lines(["Suggested settings: --logot-name=test_app"])
+
+
+def test_usage_report_name(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        """
+        import logging
+        from logot import logged
+
+        def test_app(logot):
+            logging.getLogger("app.db.query").info("foo")
+            logging.getLogger("app.db").info("bar")
+            logot.assert_logged(logged.info("foo") >> logged.info("bar"))
+        """
+    )
+    result = pytester.runpytest("--logot-usage-report=true", "--logot-name=app", "--logot-level=INFO")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["Suggested settings: --logot-name=app.db"])
+
+
+def test_common_name() -> None:
+    assert _common_name(["app.db", "app.web.views", "app.web"]) == "app"
+    assert _common_name(["app.db", "other"]) is None
+    assert _common_name(["app", None]) is None
+    assert _common_name([]) is None
+
+
+def test_adaptive_level_learn(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        test_app="""
+        import logging
+        from logot import logged
+
+        def test_warning(logot):
+            logging.warning("foo bar")
+            logot.assert_logged(logged.warning("foo bar"))
+
+        def test_unused(logot):
+            pass
+        """
+    )
+    # The first run uses the configured level.
+    result = pytester.runpytest("--logot-adaptive-level=true")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["DEBUG test_app.py::test_warning", "DEBUG test_app.py::test_unused"])
+    # The second run uses the learned level.
+    result = pytester.runpytest("--logot-adaptive-level=true")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["WARNING test_app.py::test_warning", "CRITICAL test_app.py::test_unused"])
+
+
+def test_adaptive_level_learn_changed(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        test_app="""
+        import logging
+        from logot import logged
+
+        def test_app(logot):
+            logging.warning("foo bar")
+            logot.assert_logged(logged.warning("foo bar"))
+        """
+    )
+    pytester.runpytest("--logot-adaptive-level=true").assert_outcomes(passed=1)
+    # Require a more verbose level than the learned level.
+    pytester.makepyfile(
+        test_app="""
+        import logging
+        from logot import logged
+
+        def test_app(logot):
+            logging.info("foo bar")
+            logot.assert_not_logged(logged.info("foo bar"))
+        """
+    )
+    result = pytester.runpytest("--logot-adaptive-level=true")
+    # The test errors, rather than silently passing.
+    result.assert_outcomes(passed=1, errors=1)
+    result.stdout.fnmatch_lines(["*Re-run the test to use the learned level."])
+    # The new level is learned.
+    result = pytester.runpytest("--logot-adaptive-level=true")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["INFO test_app.py::test_app"])
+
+
+def test_adaptive_level_unknown(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        test_app="""
+        from loguru import logger
+        from logot import logged
+
+        def test_app(logot):
+            logger.trace("foo bar")
+            logot.assert_logged(logged.log("TRACE", "foo bar"))
+        """
+    )
+    args = ("--logot-adaptive-level=true", "--logot-level=TRACE", "--logot-capturer=logot.loguru.LoguruCapturer")
+    pytester.runpytest(*args).assert_outcomes(passed=1)
+    # Unknown levels cannot be compared, so the configured level is used.
+    result = pytester.runpytest(*args)
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["TRACE test_app.py::test_app"])
+
+
+def test_persistent_capturer_uninstall(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        """
+        import logging
+
+        def test_persistent(logot):
+            assert any(type(handler).__name__ == "_PersistentHandler" for handler in logging.getLogger().handlers)
+        """
+    )
+    result = pytester.runpytest("--logot-capturer=logot.logging.PersistentLoggingCapturer")
+    result.assert_outcomes(passed=1)
+    # Persistent capturers are uninstalled at the end of the test session.
+    assert not any(isinstance(handler, _PersistentHandler) for handler in logging.getLogger().handlers)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+import pickle
+import socket
+import struct
+from collections.abc import Iterator
+from logging.handlers import DatagramHandler, SocketHandler
+from threading import Timer
+from typing import Any
+
+import pytest
+
+from logot import Logot, logged
+from logot.socket import SocketCapturer
+
+sender = logging.getLogger("sender")
+sender.propagate = False
+sender.setLevel(logging.DEBUG)
+
+
+@pytest.fixture()
+def capturer() -> SocketCapturer:
+    return SocketCapturer()
+
+
+@pytest.fixture()
+def logot(capturer: SocketCapturer) -> Iterator[Logot]:
+    with Logot(capturer=lambda: capturer).capturing() as logot:
+        yield logot
+
+
+def send(handler: logging.Handler, level: int, msg: str) -> None:
+    sender.addHandler(handler)
+    try:
+        sender.log(level, msg)
+    finally:
+        sender.removeHandler(handler)
+        handler.close()
+
+
+def frame(obj: Any) -> bytes:
+    data = pickle.dumps(obj)
+    return struct.pack(">L", len(data)) + data
+
+
+def test_capturing_socket_handler(capturer: SocketCapturer, logot: Logot) -> None:
+    send(SocketHandler(*capturer.address), logging.INFO, "foo bar")
+    logot.assert_logged(logged.info("foo bar", name="sender"))
+
+
+def test_capturing_datagram_handler(capturer: SocketCapturer, logot: Logot) -> None:
+    send(DatagramHandler(*capturer.address), logging.WARNING, "foo bar")
+    logot.wait_for(logged.warning("foo bar", name="sender"))
+
+
+def test_capturing_json(capturer: SocketCapturer, logot: Logot) -> None:
+    with socket.create_connection(capturer.address) as conn:
+        conn.sendall(b'{"levelname": "INFO", "name": "app", "message": "foo bar"}\n{"levelname": "INFO", ')
+        conn.sendall(b'"message": "foo baz"}\n')
+        logot.wait_for(logged.info("foo bar", name="app") >> logged.info("foo baz"))
+
+
+def test_capturing_json_unterminated(capturer: SocketCapturer, logot: Logot) -> None:
+    with socket.create_connection(capturer.address) as conn:
+        conn.sendall(b'{"levelname": "INFO", "message": "foo bar"}\n{"levelname": "INFO", "message": "foo baz"}')
+    # The final log line is captured once the connection is closed.
+    logot.wait_for(logged.info("foo bar") >> logged.info("foo baz"))
+
+
+def test_capturing_json_datagram(capturer: SocketCapturer, logot: Logot) -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.sendto(b'{"level": "info", "event": "foo bar"}\n{"level": "info", "event": "foo baz"}', capturer.address)
+        logot.wait_for(logged.info("foo bar") >> logged.info("foo baz"))
+
+
+def test_capturing_many_records(capturer: SocketCapturer, logot: Logot) -> None:
+    with socket.create_connection(capturer.address) as conn:
+        conn.sendall(b"".join(frame({"msg": f"foo {n}", "levelno": 20, "levelname": "INFO"}) for n in range(1000)))
+        logot.wait_for(logged.info("foo 999"))
+
+
+def test_capturing_level_fail() -> None:
+    capturer = SocketCapturer()
+    with Logot(capturer=lambda: capturer).capturing(level="INFO") as logot:
+        send(SocketHandler(*capturer.address), logging.DEBUG, "foo bar")
+        logot.assert_not_logged(logged.debug("foo bar"))
+
+
+def test_capturing_prefix() -> None:
+    capturer = SocketCapturer(prefix=lambda address: "node")
+    with Logot(capturer=lambda: capturer).capturing(name="node") as logot:
+        send(SocketHandler(*capturer.address), logging.INFO, "foo bar")
+        logot.assert_logged(logged.info("foo bar", name="node.sender"))
+        with socket.create_connection(capturer.address) as conn:
+            conn.sendall(b'{"levelname": "INFO", "message": "foo baz"}\n')
+            logot.wait_for(logged.info("foo baz", name="node"))
+
+
+def test_capturing_invalid_records(capturer: SocketCapturer, logot: Logot) -> None:
+    with socket.create_connection(capturer.address) as conn:
+        # Records loading classes are rejected, and non-`dict` records are ignored.
+        conn.sendall(frame(logging.makeLogRecord({"msg": "foo bar"})) + frame(["foo bar"]) + frame({"msg": "foo baz"}))
+        logot.wait_for(logged.log(..., "foo baz"))
+        logot.assert_not_logged(logged.log(..., "foo bar"))
+
+
+def test_capturing_partial_record(capturer: SocketCapturer, logot: Logot) -> None:
+    data = frame({"msg": "foo bar", "levelno": 20, "levelname": "INFO"})
+    with socket.create_connection(capturer.address) as conn:
+        conn.sendall(data[:10])
+        timer = Timer(0.1, conn.sendall, args=(data[10:],))
+        timer.start()
+        # Flushing waits for the rest of the record.
+        logot.assert_logged(logged.info("foo bar"))
+        timer.join()
+
+
+def test_capturing_max_record_size() -> None:
+    capturer = SocketCapturer(max_record_size=100)
+    with Logot(capturer=lambda: capturer).capturing() as logot:
+        with socket.create_connection(capturer.address) as conn:
+            conn.sendall(frame({"msg": "x" * 1000}))
+            # The connection is closed by the capturer.
+            assert conn.recv(1) == b""
+        with socket.create_connection(capturer.address) as conn:
+            conn.sendall(b'{"message": "' + b"x" * 1000)
+            assert conn.recv(1) == b""
+        logot.assert_not_logged(logged.log(..., "x" * 1000))
+
+
+def test_capturing_invalid_data(capturer: SocketCapturer, logot: Logot) -> None:
+    with socket.create_connection(capturer.address) as conn:
+        # Lines with an invalid level number are ignored.
+        conn.sendall(b'{"levelname": "INFO", "levelno": "high", "message": "foo bar"}\n')
+        conn.sendall(b'{"levelname": "INFO", "message": "foo baz"}\n')
+        logot.wait_for(logged.info("foo baz"))
+        logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_capturing_error() -> None:
+    errors = [ValueError("Boom!")]
+
+    def prefix(address: Any) -> str:
+        if errors:
+            raise errors.pop()
+        return "node"
+
+    capturer = SocketCapturer(prefix=prefix)
+    with Logot(capturer=lambda: capturer).capturing() as logot:
+        with socket.create_connection(capturer.address) as conn:
+            conn.sendall(b'{"levelname": "INFO", "message": "foo bar"}\n')
+            # The connection is closed by the capturer, which keeps handling other senders.
+            assert conn.recv(1) == b""
+        send(SocketHandler(*capturer.address), logging.INFO, "foo baz")
+        logot.assert_logged(logged.info("foo baz", name="node.sender"))
+
+
+def test_flush_idle(logot: Logot) -> None:
+    logot.assert_not_logged(logged.info("foo bar"))
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+import logging
+
+from logot import Captured, Logot, LogotStats, logged
+from logot._typing import ExcInfoRetention, RecordRetention
+from tests import lines
+
+
+def example_stats() -> LogotStats:
+    return LogotStats(
+        levels={"INFO": 2, "DEBUG": 1},
+        names={"app": 2, None: 1},
+        msg_length=21,
+        captured_bytes=512,
+        dropped=1,
+        consumed=2,
+        buffered=1,
+        peak_buffered=3,
+        capture_seconds=0.5,
+    )
+
+
+def test_stats() -> None:
+    logot = Logot()
+    logot.capture(Captured("INFO", "foo bar", name="app"))
+    logot.capture(Captured("INFO", "foo baz", name="app"))
+    logot.capture(Captured("DEBUG", "foo qux"))
+    logot.assert_logged(logged.info("foo baz"))
+    stats = logot.stats()
+    assert stats.levels == {"INFO": 2, "DEBUG": 1}
+    assert stats.names == {"app": 2, None: 1}
+    assert stats.msg_length == 21
+    assert stats.dropped == 0
+    assert stats.consumed == 2
+    assert stats.buffered == 1
+    assert stats.peak_buffered == 3
+    assert stats.capture_seconds > 0.0
+
+
+def test_stats_usage() -> None:
+    logot = Logot()
+    logot.capture(Captured("INFO", "foo bar", name="app"))
+    logot.capture(Captured("DEBUG", "foo baz", name="app"))
+    logot.capture(Captured("INFO", "foo qux"))
+    logot.assert_logged(logged.debug("foo baz"))
+    assert logot._usage() == {("INFO", "app"): (1, 1), ("DEBUG", "app"): (1, 1), ("INFO", None): (1, 0)}
+
+
+def test_stats_repeats() -> None:
+    logot = Logot()
+    for _ in range(3):
+        logot.capture(Captured("INFO", "foo bar"))
+    logot.assert_logged(logged.info("foo bar"))
+    stats = logot.stats()
+    assert (stats.consumed, stats.buffered, stats.peak_buffered) == (1, 2, 3)
+
+
+def test_stats_wait_for() -> None:
+    logot = Logot()
+    logot.capture(Captured("INFO", "foo bar"))
+    logot.wait_for(logged.info("foo bar"))
+    assert logot.stats().consumed == 1
+
+
+def test_stats_max_msg_len() -> None:
+    logot = Logot(max_msg_len=3)
+    logot.capture(Captured("INFO", "foo bar"))
+    # The length of the full message is counted.
+    assert logot.stats().msg_length == 7
+
+
+def test_stats_captured_bytes() -> None:
+    logot = Logot(measure_bytes=True)
+    logot.capture(Captured("INFO", "foo bar"))
+    size = logot.stats().captured_bytes
+    assert size > len("foo bar")
+    # Longer messages use more memory.
+    logot.capture(Captured("INFO", "foo bar" * 100))
+    assert logot.stats().captured_bytes - size > len("foo bar") * 99
+
+
+def test_stats_captured_bytes_disabled() -> None:
+    logot = Logot()
+    logot.capture(Captured("INFO", "foo bar"))
+    # Captured log memory is only measured when enabled.
+    assert logot.stats().captured_bytes == 0
+
+
+def test_stats_captured_bytes_retention() -> None:
+    record = logging.makeLogRecord({"msg": "foo bar"})
+    try:
+        raise ValueError("boom!")
+    except ValueError as ex:
+        exc = ex
+    sizes = {}
+    retentions: list[tuple[RecordRetention, ExcInfoRetention]] = [
+        ("none", "snapshot"),
+        ("full", "snapshot"),
+        ("full", "full"),
+    ]
+    for record_retention, exc_info_retention in retentions:
+        logot = Logot(record_retention=record_retention, exc_info_retention=exc_info_retention, measure_bytes=True)
+        logot.capture(Captured("INFO", "foo bar", exc_info=exc, record=record))
+        sizes[record_retention, exc_info_retention] = logot.stats().captured_bytes
+    # Retaining log records and full exceptions uses more memory.
+    assert sizes["none", "snapshot"] < sizes["full", "snapshot"] < sizes["full", "full"]
+
+
+def test_stats_sample() -> None:
+    with Logot().capturing(name="logot.stats", sample={"INFO": 0.5}) as logot:
+        for _ in range(4):
+            logging.getLogger("logot.stats").info("foo bar")
+    stats = logot.stats()
+    # Logs dropped by sampling are still counted.
+    assert stats.levels == {"INFO": 4}
+    assert stats.names == {"logot.stats": 4}
+    assert stats.dropped == 2
+
+
+def test_stats_clear() -> None:
+    logot = Logot()
+    logot.capture(Captured("INFO", "foo bar"))
+    logot.clear()
+    assert logot.stats() == LogotStats(
+        levels={},
+        names={},
+        msg_length=0,
+        captured_bytes=0,
+        dropped=0,
+        consumed=0,
+        buffered=0,
+        peak_buffered=0,
+        capture_seconds=0.0,
+    )
+
+
+def test_to_json() -> None:
+    assert json.loads(example_stats().to_json()) == {
+        "levels": {"INFO": 2, "DEBUG": 1},
+        "names": {"app": 2, "": 1},
+        "msg_length": 21,
+        "captured_bytes": 512,
+        "dropped": 1,
+        "consumed": 2,
+        "buffered": 1,
+        "peak_buffered": 3,
+        "capture_seconds": 0.5,
+    }
+
+
+def test_to_prometheus() -> None:
+    assert example_stats().to_prometheus(prefix="app") == lines(
+        "# HELP app_logs_total Logs captured, by level.",
+        "# TYPE app_logs_total counter",
+        'app_logs_total{level="DEBUG"} 1',
+        'app_logs_total{level="INFO"} 2',
+        "# HELP app_logger_logs_total Logs captured, by logger name.",
+        "# TYPE app_logger_logs_total counter",
+        'app_logger_logs_total{name=""} 1',
+        'app_logger_logs_total{name="app"} 2',
+        "# HELP app_msg_length_total Total length of captured log messages.",
+        "# TYPE app_msg_length_total counter",
+        "app_msg_length_total 21",
+        "# HELP app_captured_bytes_total Approximate memory used by captured logs.",
+        "# TYPE app_captured_bytes_total counter",
+        "app_captured_bytes_total 512",
+        "# HELP app_dropped_total Logs dropped by sampling.",
+        "# TYPE app_dropped_total counter",
+        "app_dropped_total 1",
+        "# HELP app_consumed_total Logs consumed while matching log patterns.",
+        "# TYPE app_consumed_total counter",
+        "app_consumed_total 2",
+        "# HELP app_buffered Logs currently buffered.",
+        "# TYPE app_buffered gauge",
+        "app_buffered 1",
+        "# HELP app_peak_buffered Maximum logs buffered at once.",
+        "# TYPE app_peak_buffered gauge",
+        "app_peak_buffered 3",
+        "# HELP app_capture_seconds_total Time spent capturing logs.",
+        "# TYPE app_capture_seconds_total counter",
+        "app_capture_seconds_total 0.5",
+        "",
+    )
+
+
+def test_to_prometheus_escape() -> None:
+    stats = LogotStats(
+        levels={},
+        names={'a"b\\c\nd': 1},
+        msg_length=0,
+        captured_bytes=0,
+        dropped=0,
+        consumed=0,
+        buffered=0,
+        peak_buffered=0,
+        capture_seconds=0.0,
+    )
+    assert 'logot_logger_logs_total{name="a\\"b\\\\c\\nd"} 1' in stats.to_prometheus().splitlines()
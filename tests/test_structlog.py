@@ -8,7 +8,7 @@ import structlog
 from structlog.stdlib import LoggerFactory
 
 from logot import Logot, logged
-from logot.structlog import StructlogCapturer
+from logot.structlog import PersistentStructlogCapturer, StructlogCapturer
 from tests import ExampleException
 
 logger = structlog.get_logger(__name__)
@@ -37,6 +37,18 @@ def test_capturing() -> None:
     logot.assert_not_logged(logged.info("foo bar"))
 
 
+def test_capturing_multiple_names() -> None:
+    with Logot(capturer=StructlogCapturer).capturing(name=["boom", "tests"], exclude=["tests.boom"]) as logot:
+        logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar"))
+
+
+def test_capturing_exclude() -> None:
+    with Logot(capturer=StructlogCapturer).capturing(exclude=[__name__]) as logot:
+        logger.info("foo bar")
+        logot.assert_not_logged(logged.info("foo bar"))
+
+
 def test_multiple_capturing() -> None:
     with Logot(capturer=StructlogCapturer).capturing() as logot_1:
         with Logot(capturer=StructlogCapturer).capturing() as logot_2:
@@ -126,3 +138,80 @@ def test_capture_exc_info_exception(logot: Logot) -> None:
 def test_capture_name(logot: Logot) -> None:
     logger.info("foo bar")
     logot.assert_logged(logged.info("foo bar", name=__name__))
+
+
+@pytest.fixture()
+def persistent_logot() -> Iterator[Logot]:
+    try:
+        yield Logot(capturer=PersistentStructlogCapturer)
+    finally:
+        PersistentStructlogCapturer.uninstall()
+
+
+def test_persistent_capturing(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing() as logot:
+        # Ensure log capturing is enabled.
+        logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar"))
+    # Ensure log capturing is disabled.
+    logger.info("foo bar")
+    logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_persistent_capturing_level_fail(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing(level="INFO") as logot:
+        logger.debug("foo bar")
+        logot.assert_not_logged(logged.debug("foo bar"))
+
+
+def test_persistent_capturing_name_prefix_pass(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing(name="tests") as logot:
+        logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar"))
+
+
+def test_persistent_capturing_name_fail(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing(name="boom") as logot:
+        logger.info("foo bar")
+        logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_persistent_capturing_config_unchanged(persistent_logot: Logot) -> None:
+    processors = structlog.get_config()["processors"]
+    processors_copy = list(processors)
+    with persistent_logot.capturing():
+        pass
+    # The configured processor chain is not modified in-place.
+    assert processors == processors_copy
+    installed_processors = structlog.get_config()["processors"]
+    # The processor is installed once, and structlog is not reconfigured between captures.
+    with persistent_logot.capturing():
+        assert structlog.get_config()["processors"] is installed_processors
+    PersistentStructlogCapturer.uninstall()
+    assert structlog.get_config()["processors"] == processors
+    # Uninstalling again does nothing.
+    PersistentStructlogCapturer.uninstall()
+    assert structlog.get_config()["processors"] == processors
+
+
+def test_persistent_capturing_cached_logger(persistent_logot: Logot) -> None:
+    with persistent_logot.capturing():
+        cached_logger = structlog.wrap_logger(None, cache_logger_on_first_use=True)
+        cached_logger.info("foo bar")
+    # Loggers cached while the processor is installed keep capturing.
+    with persistent_logot.capturing() as logot:
+        cached_logger.info("foo bar")
+        logot.assert_logged(logged.info("foo bar"))
+
+
+def test_persistent_capturing_processors_tuple(persistent_logot: Logot) -> None:
+    processors = structlog.get_config()["processors"]
+    structlog.configure(processors=(*processors,))
+    try:
+        with persistent_logot.capturing() as logot:
+            logger.info("foo bar")
+            logot.assert_logged(logged.info("foo bar"))
+        PersistentStructlogCapturer.uninstall()
+        assert list(structlog.get_config()["processors"]) == processors
+    finally:
+        structlog.configure(processors=processors)
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import io
+import subprocess
+import sys
+import time
+from functools import partial
+
+import pytest
+
+from logot import Logot, logged
+from logot.subprocess import SubprocessCapturer
+from tests import lines
+
+
+def popen(*code: str, text: bool = False) -> subprocess.Popen[bytes]:
+    return subprocess.Popen(
+        [sys.executable, "-c", lines("import json, logging, sys", *code)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=text,
+    )
+
+
+def test_capturing() -> None:
+    process = popen("logging.basicConfig(level=logging.INFO)", "logging.getLogger('app').info('foo bar')")
+    with Logot(capturer=partial(SubprocessCapturer, process)).capturing() as logot:
+        process.wait()
+        logot.assert_logged(logged.info("foo bar", name="app"))
+
+
+def test_capturing_wait_for() -> None:
+    process = popen("logging.basicConfig(level=logging.INFO)", "logging.getLogger('app').info('foo bar')")
+    with Logot(capturer=partial(SubprocessCapturer, process)).capturing() as logot:
+        logot.wait_for(logged.info("foo bar"))
+    process.wait()
+
+
+def test_capturing_text() -> None:
+    process = popen("print('WARNING:app:foo bar')", text=True)
+    with Logot(capturer=partial(SubprocessCapturer, process)).capturing() as logot:
+        process.wait()
+        logot.assert_logged(logged.warning("foo bar"))
+
+
+def test_capturing_stream() -> None:
+    stream = io.StringIO(lines("INFO:app:foo bar", "Traceback (most recent call last):", ""))
+    with Logot(capturer=partial(SubprocessCapturer, stream)).capturing() as logot:
+        logot.wait_for(logged.info("foo bar"))
+        # Non-log lines are ignored.
+        logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_capturing_interned() -> None:
+    process = popen("print('INFO:app:foo bar')", "print('INFO:app:foo baz')")
+    with Logot(capturer=partial(SubprocessCapturer, process)).capturing() as logot:
+        process.wait()
+        logot.flush()
+        # Repeated level names and logger names share a single string.
+        captured_a, captured_b = logot._queue
+        assert captured_a.levelname is captured_b.levelname
+        assert captured_a.name is captured_b.name
+
+
+def test_capturing_flush_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("logot._subprocess._FLUSH_TIMEOUT", 0.1)
+    # A grandchild process keeps the pipes open after the subprocess has exited.
+    process = popen(
+        "import subprocess",
+        "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(5)'])",
+        "print('INFO:app:foo bar', flush=True)",
+    )
+    with Logot(capturer=partial(SubprocessCapturer, process)).capturing() as logot:
+        process.wait()
+        start = time.monotonic()
+        logot.assert_logged(logged.info("foo bar"))
+        assert time.monotonic() - start < 1.0
+
+
+def test_capturing_level_fail() -> None:
+    process = popen("print('DEBUG:app:foo bar')")
+    with Logot(capturer=partial(SubprocessCapturer, process)).capturing(level="INFO") as logot:
+        process.wait()
+        logot.assert_not_logged(logged.debug("foo bar"))
+
+
+def test_capturing_name_fail() -> None:
+    process = popen("print('INFO:app:foo bar')")
+    with Logot(capturer=partial(SubprocessCapturer, process)).capturing(name="boom") as logot:
+        process.wait()
+        logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_capturing_stopped() -> None:
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import sys; sys.stdin.read(); print('INFO:app:foo bar')"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    capturer = SubprocessCapturer(process)
+    with Logot(capturer=lambda: capturer).capturing() as logot:
+        pass
+    assert process.stdin is not None
+    process.stdin.close()
+    process.wait()
+    capturer.flush()
+    # Logs are discarded once capturing stops.
+    logot.assert_not_logged(logged.info("foo bar"))
+
+
+def test_capturing_format() -> None:
+    process = popen("print('2024-01-01 [  INFO] app (20): foo bar')")
+    format = "%(asctime)s [%(levelname)6s] %(name)s (%(levelno)d): %(message)s"
+    with Logot(capturer=partial(SubprocessCapturer, process, format=format)).capturing() as logot:
+        process.wait()
+        logot.assert_logged(logged.info("foo bar", name="app"))
+
+
+def test_capturing_format_percent() -> None:
+    process = popen("print('100% INFO foo bar')")
+    format = "100%% %(levelname)s %(message)s"
+    with Logot(capturer=partial(SubprocessCapturer, process, format=format)).capturing() as logot:
+        process.wait()
+        logot.assert_logged(logged.info("foo bar"))
+
+
+def test_capturing_format_unknown_level() -> None:
+    process = popen("print('TRACE:app:foo bar')")
+    with Logot(capturer=partial(SubprocessCapturer, process)).capturing(level="INFO") as logot:
+        process.wait()
+        # Logs with an unknown level are always captured.
+        logot.assert_logged(logged.log("TRACE", "foo bar"))
+
+
+def test_format_missing_field() -> None:
+    with pytest.raises(ValueError) as ex:
+        SubprocessCapturer(io.StringIO(), format="%(levelname)s")
+    assert str(ex.value) == "Missing %(message)s in format: '%(levelname)s'"
+
+
+def test_capturing_json() -> None:
+    process = popen(
+        "print(json.dumps({'levelname': 'INFO', 'name': 'app', 'message': 'foo bar'}))",
+        "print(json.dumps({'level': 'warning', 'logger': 'app', 'event': 'foo baz'}))",
+        "print(json.dumps({'levelname': 'CUSTOM', 'levelno': 25, 'msg': 'foo qux'}))",
+        "print(json.dumps({'foo': 'bar'}))",
+        "print(json.dumps(['foo', 'bar']))",
+        "print('foo bar')",
+    )
+    with Logot(capturer=partial(SubprocessCapturer, process, json=True)).capturing() as logot:
+        process.wait()
+        logot.assert_logged(logged.info("foo bar", name="app"))
+        logot.assert_logged(logged.warning("foo baz", name="app"))
+        logot.assert_logged(logged.log(25, "foo qux"))
+        logot.assert_not_logged(logged.log(..., "%s"))
+
+
+def test_capturing_json_invalid_levelno() -> None:
+    process = popen(
+        "print(json.dumps({'levelname': 'INFO', 'levelno': 'high', 'message': 'foo bar'}))",
+        "print(json.dumps({'levelname': 'INFO', 'levelno': [20], 'message': 'foo bar'}))",
+        "print(json.dumps({'levelname': 'INFO', 'levelno': 20, 'message': 'foo baz'}))",
+    )
+    with Logot(capturer=partial(SubprocessCapturer, process, json=True)).capturing() as logot:
+        process.wait()
+        # Lines with an invalid level number are ignored, and do not stop the reader.
+        logot.assert_logged(logged.info("foo baz"))
+        logot.assert_not_logged(logged.info("foo bar"))
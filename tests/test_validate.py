@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import logging
 from typing import cast
 
 import pytest
 
-from logot._validate import validate_level, validate_name, validate_timeout
+from logot._names import NameFilter
+from logot._typing import ExcInfoRetention, Level, RecordRetention
+from logot._validate import (
+    validate_exc_info_retention,
+    validate_level,
+    validate_max_buffered,
+    validate_max_msg_len,
+    validate_name,
+    validate_names,
+    validate_record_retention,
+    validate_sample,
+    validate_timeout,
+)
 
 
 def test_validate_level_str_pass() -> None:
@@ -35,6 +48,40 @@ def test_validate_name_type_fail() -> None:
     assert str(ex.value) == "Invalid name: 1.5"
 
 
+def test_validate_names_single_pass() -> None:
+    assert validate_names("logot", ()) == "logot"
+
+
+def test_validate_names_multiple_pass() -> None:
+    name_filter = validate_names(["logot", "tests"], ())
+    assert isinstance(name_filter, NameFilter)
+    assert name_filter.roots == ("logot", "tests")
+
+
+def test_validate_names_exclude_pass() -> None:
+    name_filter = validate_names(None, ["logot"])
+    assert isinstance(name_filter, NameFilter)
+    assert name_filter.roots == (None,)
+
+
+def test_validate_names_type_fail() -> None:
+    with pytest.raises(TypeError) as ex:
+        validate_names(cast(str, [1.5]), ())
+    assert str(ex.value) == "Invalid name: [1.5]"
+
+
+def test_validate_names_empty_fail() -> None:
+    with pytest.raises(TypeError) as ex:
+        validate_names([], ())
+    assert str(ex.value) == "Invalid name: []"
+
+
+def test_validate_names_exclude_type_fail() -> None:
+    with pytest.raises(TypeError) as ex:
+        validate_names(None, "logot")
+    assert str(ex.value) == "Invalid exclude: 'logot'"
+
+
 def test_validate_timeout_numeric_pass() -> None:
     assert validate_timeout(1.0) == 1.0
 
@@ -49,3 +96,89 @@ def test_validate_timeout_type_fail() -> None:
     with pytest.raises(TypeError) as ex:
         validate_timeout(cast(float, "boom!"))
     assert str(ex.value) == "Invalid timeout: 'boom!'"
+
+
+def test_validate_record_retention_pass() -> None:
+    assert validate_record_retention("none") == "none"
+
+
+def test_validate_record_retention_fail() -> None:
+    with pytest.raises(ValueError) as ex:
+        validate_record_retention(cast(RecordRetention, "boom!"))
+    assert str(ex.value) == "Invalid record_retention: 'boom!'"
+
+
+def test_validate_exc_info_retention_pass() -> None:
+    assert validate_exc_info_retention("snapshot") == "snapshot"
+
+
+def test_validate_exc_info_retention_fail() -> None:
+    with pytest.raises(ValueError) as ex:
+        validate_exc_info_retention(cast(ExcInfoRetention, "boom!"))
+    assert str(ex.value) == "Invalid exc_info_retention: 'boom!'"
+
+
+def test_validate_max_msg_len_none_pass() -> None:
+    assert validate_max_msg_len(None) is None
+
+
+def test_validate_max_msg_len_numeric_pass() -> None:
+    assert validate_max_msg_len(10) == 10
+
+
+def test_validate_max_msg_len_numeric_fail() -> None:
+    with pytest.raises(ValueError) as ex:
+        validate_max_msg_len(-1)
+    assert str(ex.value) == "Invalid max_msg_len: -1"
+
+
+def test_validate_max_msg_len_type_fail() -> None:
+    with pytest.raises(TypeError) as ex:
+        validate_max_msg_len(cast(int, "boom!"))
+    assert str(ex.value) == "Invalid max_msg_len: 'boom!'"
+
+
+def test_validate_max_buffered_none_pass() -> None:
+    assert validate_max_buffered(None) is None
+
+
+def test_validate_max_buffered_numeric_pass() -> None:
+    assert validate_max_buffered(10) == 10
+
+
+def test_validate_max_buffered_numeric_fail() -> None:
+    with pytest.raises(ValueError) as ex:
+        validate_max_buffered(0)
+    assert str(ex.value) == "Invalid max_buffered: 0"
+
+
+def test_validate_max_buffered_type_fail() -> None:
+    with pytest.raises(TypeError) as ex:
+        validate_max_buffered(cast(int, "boom!"))
+    assert str(ex.value) == "Invalid max_buffered: 'boom!'"
+
+
+def test_validate_sample_none_pass() -> None:
+    assert validate_sample(None) is None
+
+
+def test_validate_sample_pass() -> None:
+    assert validate_sample({"DEBUG": 0.5, logging.INFO: 1}) == {"DEBUG": 0.5, "INFO": 1.0}
+
+
+def test_validate_sample_fail() -> None:
+    with pytest.raises(TypeError) as ex:
+        validate_sample(cast(dict[Level, float], "boom!"))
+    assert str(ex.value) == "Invalid sample: 'boom!'"
+
+
+def test_validate_sample_rate_fail() -> None:
+    with pytest.raises(ValueError) as ex:
+        validate_sample({"DEBUG": 1.5})
+    assert str(ex.value) == "Invalid sample rate: 1.5"
+
+
+def test_validate_sample_rate_type_fail() -> None:
+    with pytest.raises(TypeError) as ex:
+        validate_sample({"DEBUG": cast(float, "boom!")})
+    assert str(ex.value) == "Invalid sample rate: 'boom!'"
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from threading import Thread
+from time import sleep
+
 import pytest
 
-from logot import Captured, Logot, logged
+from logot import Captured, Logot, logged, wait_for_all, wait_for_any
 from tests import capture_soon, lines
 
 
@@ -25,3 +28,86 @@ def test_wait_for_fail(logot: Logot) -> None:
         "",
         "[INFO] foo bar",
     )
+
+
+def test_wait_for_all_pass_immediate(logot: Logot) -> None:
+    other_logot = Logot()
+    logot.capture(Captured("INFO", "foo bar"))
+    other_logot.capture(Captured("INFO", "baz"))
+    wait_for_all({logot: logged.info("foo bar"), other_logot: logged.info("baz")})
+
+
+def test_wait_for_all_pass_soon(logot: Logot) -> None:
+    other_logot = Logot()
+    logot.capture(Captured("INFO", "foo bar"))
+    capture_soon(other_logot, Captured("INFO", "baz"))
+    wait_for_all({logot: logged.info("foo bar"), other_logot: logged.info("baz")})
+
+
+def test_wait_for_all_fail(logot: Logot) -> None:
+    other_logot = Logot()
+    logot.capture(Captured("INFO", "foo bar"))
+    with pytest.raises(AssertionError) as ex:
+        wait_for_all({logot: logged.info("foo bar"), other_logot: logged.info("baz")}, timeout=0.1)
+    assert str(ex.value) == lines(
+        "Not logged:",
+        "",
+        "[INFO] baz",
+    )
+
+
+def test_wait_for_any_pass_immediate(logot: Logot) -> None:
+    other_logot = Logot()
+    other_logot.capture(Captured("INFO", "baz"))
+    wait_for_any({logot: logged.info("foo bar"), other_logot: logged.info("baz")})
+
+
+def test_wait_for_any_pass_soon(logot: Logot) -> None:
+    other_logot = Logot()
+    capture_soon(other_logot, Captured("INFO", "baz"))
+    wait_for_any({logot: logged.info("foo bar"), other_logot: logged.info("baz")})
+    # The other waiter was stopped.
+    logot.capture(Captured("INFO", "foo bar"))
+    logot.assert_logged(logged.info("foo bar"))
+
+
+def test_wait_for_any_consumes_other_logs(logot: Logot) -> None:
+    other_logot = Logot()
+    logot.capture(Captured("INFO", "foo"))
+    other_logot.capture(Captured("INFO", "baz"))
+    wait_for_any({logot: logged.info("foo") >> logged.info("bar"), other_logot: logged.info("baz")})
+    # Logs partially matched by the other waiter are consumed.
+    logot.assert_not_logged(logged.info("foo"))
+
+
+def test_wait_for_any_fail(logot: Logot) -> None:
+    other_logot = Logot()
+    with pytest.raises(AssertionError) as ex:
+        wait_for_any({logot: logged.info("foo bar"), other_logot: logged.info("baz")}, timeout=0.1)
+    assert str(ex.value) == lines(
+        "Not logged:",
+        "",
+        "Any:",
+        "- [INFO] foo bar",
+        "- [INFO] baz",
+    )
+
+
+def test_wait_for_all_empty() -> None:
+    with pytest.raises(ValueError):
+        wait_for_all({})
+
+
+def test_wait_for_all_concurrent_waiter(logot: Logot) -> None:
+    other_logot = Logot()
+    thread = Thread(target=other_logot.wait_for, args=(logged.info("baz"),), daemon=True)
+    thread.start()
+    sleep(0.1)
+    with pytest.raises(RuntimeError):
+        wait_for_all({logot: logged.info("foo bar"), other_logot: logged.info("baz")})
+    # The successfully started waiter was stopped.
+    logot.capture(Captured("INFO", "foo bar"))
+    logot.assert_logged(logged.info("foo bar"))
+    # Release the concurrent waiter.
+    other_logot.capture(Captured("INFO", "baz"))
+    thread.join()